@@ -1,8 +1,32 @@
 '''
 Pre-processing package with modules:
 
+- batch
+    - module focussed on multi-threaded batch pre-processing
+- benchmark
+    - module timing pre-processing functions and executors
+- dedupe
+    - module finding near-duplicate texts
 - errors
     - module comprised of error handles for preprocessing package
+- features
+    - module hashing processed text into sparse features
+- jobs
+    - module running sharded, resumable pre-processing jobs across workers
+- offsets
+    - module mapping processed text offsets back to original text offsets
+- plan
+    - module optimising the order of pre-processing functions
+- profiling
+    - module profiling pre-processing pipelines stage by stage
+- reader
+    - module reading records from memory-mapped text files
+- sentences
+    - module splitting sentences with punkt parameters and regular expressions
+- stream
+    - module focussed on chunked pre-processing of large texts
 - text
     - module focussed on text pre-processing
+- vocabulary
+    - module interning words as integer IDs
 '''
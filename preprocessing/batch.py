@@ -0,0 +1,231 @@
+'''
+Batch pre-processing module:
+'''
+
+
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from itertools import islice
+from os import cpu_count
+import threading
+
+from preprocessing.errors import FunctionError, InputError
+import preprocessing.spellcheck as spellcheck
+import preprocessing.text as ptext
+
+
+BATCH_CHUNK_SIZE = 64
+CORRECTION_CHUNK_SIZE = 256
+
+
+#functions
+def correct_spelling_batch(text_list, process_count=None, chunk_size=CORRECTION_CHUNK_SIZE):
+    '''
+    Applies correct_spelling onto each string within text_list, returning the corrected strings in
+    the order of text_list as type list of str, in three phases:
+
+    - Collects the unique words across text_list not found within the pre-built dictionary
+    - Corrects each of these words once, across process_count processes
+    - Rewrites each string replacing its words through a single lookup of the corrections
+
+    Words found within the dictionary are their own correction, so the result is the same as
+    correct_spelling's, while each unknown word is searched for only once per batch.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - process_count: number of processes to correct words across, defaulting to the number of
+      CPUs; 1 corrects words within the calling process
+    - chunk_size: number of words sent to a process at a time
+
+    Exceptions raised:
+
+    - InputError: occurs should text_list be non-list or contain non-string elements, or
+      process_count or chunk_size not be positive integers
+    '''
+    if not isinstance(text_list, list):
+        raise InputError("list not passed as argument for text_list")
+    elif process_count is not None and (not isinstance(process_count, int) or process_count < 1):
+        raise InputError("positive integer not passed as argument for process_count")
+    elif not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InputError("positive integer not passed as argument for chunk_size")
+    word_lists = []
+    unknown_words = set()
+    for text_string in text_list:
+        if text_string is None:
+            word_lists.append([])
+        elif isinstance(text_string, str):
+            word_list = text_string.split()
+            word_lists.append(word_list)
+            unknown_words.update(word for word in word_list
+                                 if word not in spellcheck.WORD_DISTRIBUTION)
+        else:
+            raise InputError("string not passed as element of text_list")
+    unknown_words = sorted(unknown_words)
+    process_count = min(process_count or cpu_count() or 1,
+                        -(-len(unknown_words) // chunk_size))
+    if process_count <= 1:
+        corrections = dict(zip(unknown_words, map(spellcheck.correct_word, unknown_words)))
+    else:
+        with ProcessPoolExecutor(max_workers=process_count) as executor:
+            corrections = dict(zip(unknown_words, executor.map(spellcheck.correct_word,
+                                                               unknown_words,
+                                                               chunksize=chunk_size)))
+    return [" ".join([corrections.get(word, word) for word in word_list])
+            for word_list in word_lists]
+
+def preprocess_batch(text_list, function_list, thread_count=None, chunk_size=BATCH_CHUNK_SIZE):
+    '''
+    Given each function within function_list, applies the order of functions put forward onto
+    each string within text_list using run_batch, returning the processed strings in the order of
+    text_list as type list of str. text_list may be any iterable of strings, such as the records
+    yielded by read_records in preprocessing.reader, which is then read a chunk at a time rather
+    than copied into a list first.
+
+    The functions of preprocessing.text spend their time within re and str methods, which hold
+    the GIL, so threads only speed preprocess_batch up on free-threaded builds of Python; on other
+    builds benchmark_batch in preprocessing.benchmark measures about the same throughput at 1, 2,
+    4 and 8 threads.
+
+    Keyword argument:
+
+    - text_list: list or other iterable of string instances
+    - function_list: list of functions available in preprocessing.text
+    - thread_count: number of threads to run, defaulting to the number of CPUs
+    - chunk_size: number of strings a thread processes before looking for more work
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should text_list be a string or non-iterable, function_list be
+      non-list, or thread_count or chunk_size not be positive integers
+    '''
+    if not isinstance(function_list, list):
+        raise InputError("list of functions not passed as argument for function_list")
+    return run_batch(lambda text_string: ptext.preprocess_text(text_string, function_list),
+                     text_list, thread_count, chunk_size)
+
+def run_batch(func, item_list, thread_count=None, chunk_size=BATCH_CHUNK_SIZE):
+    '''
+    Applies func to each item within item_list across thread_count threads, returning the results
+    in the order of item_list as type list.
+
+    item_list is split into chunks of chunk_size items, and each thread is dealt a contiguous run
+    of chunks which it works through from the front. A thread which runs out of chunks steals the
+    last chunk of another thread, so threads finish together even when some items take far
+    longer than others. Threads share no lock: chunks are taken with the atomic deque operations
+    popleft and pop, and each result is stored at its own index. Should func raise, the remaining
+    chunks are abandoned and the first exception raised is re-raised.
+
+    Should item_list be an iterable other than a list, such as a generator, it is consumed lazily:
+    threads take the next chunk_size items from it in turn under a lock, so that only the chunks
+    being processed are held in memory alongside the results.
+
+    Speedup is only expected on free-threaded builds of Python, as func holding the GIL, like the
+    re and str methods preprocessing.text relies on, runs one thread at a time otherwise.
+
+    Keyword argument:
+
+    - func: function taking a single item
+    - item_list: list or other iterable of items
+    - thread_count: number of threads to run, defaulting to the number of CPUs
+    - chunk_size: number of items a thread processes before looking for more work
+
+    Exceptions raised:
+
+    - FunctionError: occurs should func not be callable
+    - InputError: occurs should item_list be a string or non-iterable, or thread_count or
+      chunk_size not be positive integers
+    '''
+    if not callable(func):
+        raise FunctionError("invalid function passed as argument for func")
+    elif isinstance(item_list, (str, bytes)) or not hasattr(item_list, "__iter__"):
+        raise InputError("iterable not passed as argument for item_list")
+    elif thread_count is not None and (not isinstance(thread_count, int) or thread_count < 1):
+        raise InputError("positive integer not passed as argument for thread_count")
+    elif not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InputError("positive integer not passed as argument for chunk_size")
+    if not isinstance(item_list, list):
+        return _run_iterable(func, iter(item_list), thread_count or cpu_count() or 1, chunk_size)
+    results = [None] * len(item_list)
+    chunks = [range(i, min(i + chunk_size, len(item_list)))
+              for i in range(0, len(item_list), chunk_size)]
+    thread_count = min(thread_count or cpu_count() or 1, len(chunks))
+    if thread_count <= 1:
+        for i in range(len(item_list)):
+            results[i] = func(item_list[i])
+        return results
+    queues = [deque(chunks[len(chunks) * i // thread_count:len(chunks) * (i + 1) // thread_count])
+              for i in range(thread_count)]
+    errors = []
+
+    def work(queue_index):
+        '''processes chunks from its own queue, then steals from the other queues'''
+        queue = queues[queue_index]
+        while not errors:
+            try:
+                chunk = queue.popleft()
+            except IndexError:
+                chunk = _steal_chunk(queues, queue_index)
+                if chunk is None:
+                    return
+            try:
+                for i in chunk:
+                    results[i] = func(item_list[i])
+            except BaseException as error:
+                errors.append(error)
+
+    threads = [threading.Thread(target=work, args=(i,)) for i in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return results
+
+def _run_iterable(func, item_iterator, thread_count, chunk_size):
+    '''applies func to each item of item_iterator as run_batch does, pulling chunks under a lock'''
+    if thread_count <= 1:
+        return [func(item) for item in item_iterator]
+    chunk_results = {}
+    errors = []
+    lock = threading.Lock()
+    position = [0]
+
+    def work():
+        '''takes the next chunk of item_iterator until it or another thread runs out or fails'''
+        while not errors:
+            with lock:
+                try:
+                    chunk = list(islice(item_iterator, chunk_size))
+                except BaseException as error:
+                    errors.append(error)
+                    return
+                chunk_index = position[0]
+                position[0] += 1
+            if not chunk:
+                return
+            try:
+                chunk_results[chunk_index] = [func(item) for item in chunk]
+            except BaseException as error:
+                errors.append(error)
+
+    threads = [threading.Thread(target=work) for _ in range(thread_count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    if errors:
+        raise errors[0]
+    return [result for chunk_index in sorted(chunk_results)
+            for result in chunk_results[chunk_index]]
+
+def _steal_chunk(queues, queue_index):
+    '''returns the last chunk of the first other non-empty queue, or None should all be empty'''
+    for offset in range(1, len(queues)):
+        try:
+            return queues[(queue_index + offset) % len(queues)].pop()
+        except IndexError:
+            continue
+    return None
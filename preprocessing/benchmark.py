@@ -0,0 +1,376 @@
+'''
+Benchmarking module:
+'''
+
+
+import argparse
+import random
+import sys
+from time import perf_counter
+
+from preprocessing.errors import InputError
+import preprocessing.batch as pbatch
+import preprocessing.spellcheck as spellcheck
+import preprocessing.text as ptext
+
+
+BASELINE_WORD_COUNT = 20000
+BENCHMARK_FUNCTIONS = [
+    ptext.convert_html_entities,
+    ptext.convert_ligatures,
+    ptext.lowercase,
+    ptext.remove_urls,
+    ptext.remove_numbers,
+    ptext.remove_number_words,
+    ptext.remove_unbound_punct,
+    ptext.keyword_tokenize
+]
+BENCHMARK_SENTENCES = [
+    "This text is a test comprised of keywords &amp; stopwords, written {} times.",
+    "It is comprised of .. punctuation artifacts AND CAPITAL LETTERS over {} days",
+    "Sometimes it\nhas escape\ncharacters as well. 2017 don't forget the ﬁnal {} Œuvres",
+    "I can include urls like https://example.com/{}/page?id=42 &quot;quoted&quot;",
+    "../?>? .../,,, twenty-one hours and {} minutes later; the &lt;end&gt;"
+]
+AGREEMENT_SENTENCES = [
+    "Mr. Smith paid $4.50 for {} apples at 3 p.m. on Jan. 5.",
+    "Dr. J. S. Bach wrote it in 1722... Then the U.S. Congress met (again.)",
+    "\"Why {} times?\" she asked. It was, e.g., late! Nobody knew!!",
+    "The No. {} item costs 5.5 dollars, i.e. cheap. However, sales fell 3.2%.",
+    "See ch. 4 and fig. {}. Prof. Li et al. disagreed; Gen. Motors Corp. did not."
+]
+NORMALIZE_FUNCTIONS = [
+    ptext.convert_html_entities,
+    ptext.convert_ligatures,
+    ptext.lowercase,
+    ptext.remove_esc_chars,
+    ptext.remove_whitespace
+]
+PRUNING_SETTINGS = [
+    {"min_count": 2},
+    {"min_count": 5},
+    {"top_count": 100000},
+    {"top_count": 30000},
+    {"quantize": True},
+    {"min_count": 2, "quantize": True}
+]
+THREAD_COUNTS = (1, 2, 4, 8)
+
+
+#functions
+def benchmark_batch(text_list, function_list, thread_counts=THREAD_COUNTS, repeat=3):
+    '''
+    Times preprocess_batch over text_list with function_list for each thread count within
+    thread_counts, returning the best time of repeat runs in seconds for each thread count as
+    type dict.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - function_list: list of functions available in preprocessing.text
+    - thread_counts: iterable of thread counts to time
+    - repeat: number of runs timed for each thread count
+
+    Exceptions raised:
+
+    - InputError: occurs should repeat not be a positive integer
+    '''
+    return {thread_count: time_call(lambda: pbatch.preprocess_batch(text_list, function_list,
+                                                                    thread_count), repeat)
+            for thread_count in thread_counts}
+
+def benchmark_normalize(text_list, repeat=3):
+    '''
+    Times normalize_characters against the chained functions it fuses over text_list, returning
+    the best time of repeat runs in seconds for each as type dict, keyed "chained" and "fused".
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - repeat: number of runs timed for each
+
+    Exceptions raised:
+
+    - InputError: occurs should repeat not be a positive integer
+    '''
+    return {
+        "chained": time_call(lambda: [ptext.preprocess_text(text_string, NORMALIZE_FUNCTIONS)
+                                      for text_string in text_list], repeat),
+        "fused": time_call(lambda: [ptext.normalize_characters(text_string)
+                                    for text_string in text_list], repeat)
+    }
+
+def benchmark_pruning(pair_list, setting_list=PRUNING_SETTINGS, word_distribution=None):
+    '''
+    Prunes word_distribution with prune_word_distribution for each dict of its keyword arguments
+    within setting_list, correcting the misspelling of each (misspelling, word) tuple within
+    pair_list with each pruned distribution in turn. Returns a report as type list of dict, the
+    unpruned distribution first, each with the setting, the number of words kept, the bytes they
+    hold as Python objects, the share of bytes saved, the share of misspellings corrected to their
+    word, its change against the unpruned distribution and the seconds taken to correct
+    pair_list. WORD_DISTRIBUTION is restored afterwards. Quantized counts stay Python ints, so
+    quantizing only saves the bytes of the int objects words of the same level share.
+
+    The accuracy only says how pruning affects words outside the distribution should pair_list
+    be held out, such as pairs read with read_misspelling_pairs, or made with
+    make_misspelling_pairs from a word list other than the corpus pruned.
+
+    Keyword argument:
+
+    - pair_list: list of (misspelling, word) tuples
+    - setting_list: list of dicts of keyword arguments for prune_word_distribution
+    - word_distribution: Counter instance to prune, defaulting to WORD_DISTRIBUTION
+
+    Exceptions raised:
+
+    - InputError: occurs should pair_list or setting_list be non-list, or a setting be invalid
+    '''
+    if not isinstance(pair_list, list):
+        raise InputError("list not passed as argument for pair_list")
+    elif not isinstance(setting_list, list):
+        raise InputError("list not passed as argument for setting_list")
+    original_distribution = spellcheck.WORD_DISTRIBUTION
+    word_distribution = original_distribution if word_distribution is None else word_distribution
+    report = []
+    try:
+        for setting in [{}] + setting_list:
+            pruned_distribution = spellcheck.prune_word_distribution(word_distribution, **setting)
+            spellcheck.set_word_distribution(pruned_distribution)
+            start = perf_counter()
+            corrected = sum(spellcheck.correct_word(misspelling) == word
+                            for misspelling, word in pair_list)
+            seconds = perf_counter() - start
+            byte_count = _measure_distribution(pruned_distribution)
+            accuracy = corrected / len(pair_list) if pair_list else 1.0
+            report.append({
+                "setting": setting,
+                "words": len(pruned_distribution),
+                "bytes": byte_count,
+                "saved": 1 - byte_count / report[0]["bytes"] if report else 0.0,
+                "accuracy": accuracy,
+                "accuracy_change": accuracy - report[0]["accuracy"] if report else 0.0,
+                "seconds": seconds
+            })
+    finally:
+        spellcheck.set_word_distribution(original_distribution)
+    return report
+
+def benchmark_sentences(text_list, repeat=3):
+    '''
+    Times create_sentence_list over text_list with each of its engines, returning the best time of
+    repeat runs in seconds for each as type dict, keyed by engine.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - repeat: number of runs timed for each engine
+
+    Exceptions raised:
+
+    - InputError: occurs should repeat not be a positive integer
+    '''
+    return {engine: time_call(lambda: [ptext.create_sentence_list(text_string, engine)
+                                       for text_string in text_list], repeat)
+            for engine in ptext.SENTENCE_ENGINES}
+
+def make_benchmark_texts(text_count, sentence_count=20, sentence_list=BENCHMARK_SENTENCES):
+    '''
+    Returns text_count synthetic documents, each of sentence_count sentences taken in turn from
+    sentence_list, by default mixing the markup, numbers, URLs and punctuation the functions in
+    preprocessing.text remove, as type list of str.
+    '''
+    return [" ".join(sentence_list[(i + j) % len(sentence_list)].format(i * j)
+                     for j in range(sentence_count)) for i in range(text_count)]
+
+def make_misspelling_pairs(word_list, pair_count=1000, seed=0):
+    '''
+    Returns pair_count synthetic misspellings of words drawn from the alphabetic words of four or
+    more letters within word_list, each a random one letter edit of its word which is not itself
+    within word_list, as type list of (misspelling, word) tuples. The same seed returns the same
+    pairs.
+
+    Keyword argument:
+
+    - word_list: list of correctly spelt words, such as the most common words of a held-out corpus
+    - pair_count: number of pairs to return
+    - seed: seed for the random choice of words and edits
+
+    Exceptions raised:
+
+    - InputError: occurs should word_list be non-list or hold no alphabetic word of four or more
+      letters
+    '''
+    if not isinstance(word_list, list):
+        raise InputError("list not passed as argument for word_list")
+    candidate_list = sorted({word for word in word_list
+                             if isinstance(word, str) and word.isalpha() and len(word) > 3})
+    if not candidate_list:
+        raise InputError("list without alphabetic words of four or more letters passed as argument for word_list")
+    word_set = set(word_list)
+    generator = random.Random(seed)
+    pair_list = []
+    while len(pair_list) < pair_count:
+        word = generator.choice(candidate_list)
+        edit_list = sorted(spellcheck.find_one_letter_edits(word) - word_set)
+        pair_list.append((generator.choice(edit_list), word))
+    return pair_list
+
+def read_misspelling_pairs(file_path):
+    '''
+    Reads a file of misspellings, one misspelling and its correct word per line separated by
+    whitespace, such as a held-out spelling test set, returning them as type list of
+    (misspelling, word) tuples. Blank lines are skipped.
+
+    Keyword argument:
+
+    - file_path: path of the file of misspellings
+
+    Exceptions raised:
+
+    - InputError: occurs should file_path be non-string, or a line not hold two words
+    '''
+    if not isinstance(file_path, str):
+        raise InputError("string not passed as argument for file_path")
+    pair_list = []
+    with open(file_path, "r", encoding="utf-8") as pair_file:
+        for line in pair_file:
+            word_list = line.split()
+            if not word_list:
+                continue
+            elif len(word_list) != 2:
+                raise InputError("line of other than a misspelling and word passed within file_path")
+            pair_list.append((word_list[0].lower(), word_list[1].lower()))
+    return pair_list
+
+def sentence_agreement(text_list):
+    '''
+    Splits each string within text_list into sentences with both engines of create_sentence_list,
+    returning a report as type dict of the number of texts, the number split the same way by
+    both, their share as the agreement rate, and the texts split differently.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+
+    Exceptions raised:
+
+    - InputError: occurs should text_list be non-list or contain non-string elements
+    '''
+    if not isinstance(text_list, list):
+        raise InputError("list not passed as argument for text_list")
+    disagreements = [text_string for text_string in text_list
+                     if ptext.create_sentence_list(text_string)
+                     != ptext.create_sentence_list(text_string, "regex")]
+    return {
+        "texts": len(text_list),
+        "agreeing": len(text_list) - len(disagreements),
+        "rate": (len(text_list) - len(disagreements)) / len(text_list) if text_list else 1.0,
+        "disagreements": disagreements
+    }
+
+def time_baseline(repeat=5):
+    '''
+    Times a fixed pure-Python loop of string and dict operations over BASELINE_WORD_COUNT words,
+    returning the fastest of repeat runs in seconds as type float. Timings divided by it are
+    comparable across machines and runs, as both scale with the speed of the interpreter.
+
+    Exceptions raised:
+
+    - InputError: occurs should repeat not be a positive integer
+    '''
+    word_list = ["Word{}".format(i % 1000) for i in range(BASELINE_WORD_COUNT)]
+
+    def count_words():
+        '''counts the lowercased words of word_list'''
+        counts = {}
+        for word in word_list:
+            word = word.lower()
+            counts[word] = counts.get(word, 0) + 1
+        return counts
+    return time_call(count_words, repeat)
+
+def time_call(func, repeat=3):
+    '''
+    Calls func repeat times, returning the fastest call in seconds as type float.
+
+    Exceptions raised:
+
+    - InputError: occurs should repeat not be a positive integer
+    '''
+    if not isinstance(repeat, int) or repeat < 1:
+        raise InputError("positive integer not passed as argument for repeat")
+    best = float("inf")
+    for _ in range(repeat):
+        start = perf_counter()
+        func()
+        best = min(best, perf_counter() - start)
+    return best
+
+def _measure_distribution(word_distribution):
+    '''returns the bytes held by word_distribution, its words and its distinct counts'''
+    return (sys.getsizeof(word_distribution)
+            + sum(sys.getsizeof(word) for word in word_distribution)
+            + sum(sys.getsizeof(count) for count
+                  in {id(count): count for count in word_distribution.values()}.values()))
+
+def main(argument_list=None):
+    '''
+    Command line entry point, run as python -m preprocessing.benchmark: prints benchmarks of the
+    batch executor, normalize_characters and the sentence engines over synthetic documents, the
+    agreement rate of the sentence engines, and the memory and accuracy of pruned spellcheck
+    distributions. Misspellings are read from --misspellings, or made from the words of --words;
+    without either they are made from the corpus being pruned and are not held out.
+
+    Keyword argument:
+
+    - argument_list: list of command line arguments, defaulting to sys.argv
+    '''
+    parser = argparse.ArgumentParser(prog="python -m preprocessing.benchmark",
+                                     description="benchmark the pre-processing functions")
+    parser.add_argument("--misspellings",
+                        help="held-out file of one misspelling and its word per line")
+    parser.add_argument("--words", help="held-out file of correctly spelt words, one per line")
+    arguments = parser.parse_args(argument_list)
+    text_list = make_benchmark_texts(200)
+    print("preprocess_batch, {} documents, {}:".format(
+        len(text_list), ", ".join(func.__name__ for func in BENCHMARK_FUNCTIONS)))
+    timings = benchmark_batch(text_list, BENCHMARK_FUNCTIONS)
+    for thread_count, seconds in sorted(timings.items()):
+        print("  {} thread(s): {:.3f}s ({:.2f}x)".format(thread_count, seconds,
+                                                        timings[min(timings)] / seconds))
+    text_list = make_benchmark_texts(2000)
+    print("normalize_characters, {} documents, against {}:".format(
+        len(text_list), ", ".join(func.__name__ for func in NORMALIZE_FUNCTIONS)))
+    timings = benchmark_normalize(text_list)
+    print("  chained: {:.3f}s".format(timings["chained"]))
+    print("  fused: {:.3f}s ({:.2f}x)".format(timings["fused"],
+                                              timings["chained"] / timings["fused"]))
+    text_list = (make_benchmark_texts(2000, 2, AGREEMENT_SENTENCES)
+                 + make_benchmark_texts(200, 20, AGREEMENT_SENTENCES + BENCHMARK_SENTENCES))
+    print("create_sentence_list, {} documents:".format(len(text_list)))
+    timings = benchmark_sentences(text_list)
+    print("  punkt: {:.3f}s".format(timings["punkt"]))
+    print("  regex: {:.3f}s ({:.2f}x)".format(timings["regex"], timings["punkt"] / timings["regex"]))
+    report = sentence_agreement(text_list)
+    print("  agreement: {} of {} documents ({:.2%})".format(report["agreeing"], report["texts"],
+                                                           report["rate"]))
+    if arguments.misspellings:
+        pair_list = read_misspelling_pairs(arguments.misspellings)
+        source = "held-out misspellings from " + arguments.misspellings
+    elif arguments.words:
+        with open(arguments.words, "r", encoding="utf-8") as word_file:
+            pair_list = make_misspelling_pairs(word_file.read().lower().split(), 200)
+        source = "misspellings of held-out words from " + arguments.words
+    else:
+        word_list = [word for word, _ in spellcheck.WORD_DISTRIBUTION.most_common(20000)]
+        pair_list = make_misspelling_pairs(word_list, 200)
+        source = "in-corpus misspellings, not held out"
+    print("prune_word_distribution, {} {}:".format(len(pair_list), source))
+    for row in benchmark_pruning(pair_list):
+        print("  {}: {} words, {:.1f} MiB ({:.1%} saved), {:.1%} corrected ({:+.1%}), {:.3f}s".format(
+            row["setting"] or "unpruned", row["words"], row["bytes"] / (1 << 20), row["saved"],
+            row["accuracy"], row["accuracy_change"], row["seconds"]))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,240 @@
+'''
+Near-duplicate detection module:
+'''
+
+
+from collections import OrderedDict
+import math
+import random
+import threading
+from zlib import crc32
+
+from preprocessing.errors import InputError
+import preprocessing.text as ptext
+
+
+BAND_THRESHOLD_TOLERANCE = 0.05
+MAX_ROW_COUNT = 32
+MERSENNE_PRIME = (1 << 61) - 1
+
+
+#classes
+class MinHashIndex(object):
+    '''
+    Index of MinHash signatures over shingles of keyword_tokenize output, with LSH banding to
+    find near-duplicate texts without comparing against every indexed text. Signatures are split
+    into band_count bands of row_count rows; texts sharing a band are candidates, and a candidate
+    is a near duplicate should the share of signature rows both texts have in common, which
+    estimates their Jaccard similarity, be at least threshold. Once max_size texts are indexed
+    the oldest text is dropped for each new one, bounding memory. An index may be shared between
+    threads, such as those of preprocess_batch: looking a text up, adding it and dropping the
+    oldest text happen under one lock, so that of two near duplicates checked at once only one
+    is let through.
+
+    Texts of similarity s share a band with probability 1 - (1 - s ** row_count) ** band_count,
+    rising steeply about (1 / band_count) ** (1 / row_count), the band threshold. Texts well
+    below the band threshold are rarely candidates and texts well above it nearly always are, so
+    row_count defaults to the largest, up to MAX_ROW_COUNT, putting the band threshold at or just
+    below threshold, e.g. 12 rows for 16 bands at a threshold of 0.8.
+
+    Keyword argument:
+
+    - threshold: estimated Jaccard similarity from which texts are near duplicates
+    - band_count: number of LSH bands
+    - row_count: number of signature rows per band, derived from threshold and band_count by
+      default; one putting the band threshold more than BAND_THRESHOLD_TOLERANCE from threshold
+      raises InputError
+    - shingle_size: number of consecutive keywords per shingle
+    - max_size: largest number of texts held within the index
+    - seed: seed for the random hash permutations
+    '''
+
+    def __init__(self, threshold=0.8, band_count=16, row_count=None, shingle_size=3,
+                 max_size=100000, seed=0):
+        if not isinstance(threshold, (int, float)) or not 0 < threshold <= 1:
+            raise InputError("number between 0 and 1 not passed as argument for threshold")
+        elif not all(isinstance(count, int) and count > 0
+                     for count in (band_count, shingle_size, max_size)
+                     + (() if row_count is None else (row_count,))):
+            raise InputError("positive integer not passed as argument for a count or size")
+        elif row_count is None:
+            row_count = (MAX_ROW_COUNT if threshold == 1 else
+                         min(max(int(math.log(band_count) / -math.log(threshold)), 1),
+                             MAX_ROW_COUNT))
+        elif abs(band_count ** (-1 / row_count) - threshold) > BAND_THRESHOLD_TOLERANCE:
+            raise InputError("band_count and row_count passed put the band threshold far from threshold")
+        self.threshold = threshold
+        self.band_count = band_count
+        self.row_count = row_count
+        self.shingle_size = shingle_size
+        self.max_size = max_size
+        generator = random.Random(seed)
+        self._permutations = [(generator.randrange(1, MERSENNE_PRIME),
+                               generator.randrange(0, MERSENNE_PRIME))
+                              for _ in range(band_count * row_count)]
+        self._signatures = OrderedDict()
+        self._buckets = {}
+        self._next_key = 0
+        self._lock = threading.Lock()
+
+    def __contains__(self, key):
+        return key in self._signatures
+
+    def __len__(self):
+        return len(self._signatures)
+
+    def add(self, text_string, key=None):
+        '''
+        Adds text_string to the index under key, defaulting to the next unused integer, dropping
+        the oldest text should the index hold max_size texts. Returns key. Texts without keywords
+        are not indexed.
+
+        Exceptions raised:
+
+        - InputError: occurs should a non-string argument be passed
+        '''
+        signature = self.signature(text_string)
+        with self._lock:
+            return self._add(signature, key)
+
+    def check(self, text_string, key=None):
+        '''
+        Returns the key of a near duplicate of text_string within the index, or None after adding
+        text_string to the index under key should there be none.
+
+        Exceptions raised:
+
+        - InputError: occurs should a non-string argument be passed
+        '''
+        signature = self.signature(text_string)
+        with self._lock:
+            duplicate_key = self._find(signature)
+            if duplicate_key is None:
+                self._add(signature, key)
+        return duplicate_key
+
+    def find_duplicate(self, text_string):
+        '''
+        Returns the key of a near duplicate of text_string within the index, or None should there
+        be none.
+
+        Exceptions raised:
+
+        - InputError: occurs should a non-string argument be passed
+        '''
+        signature = self.signature(text_string)
+        with self._lock:
+            return self._find(signature)
+
+    def signature(self, text_string):
+        '''
+        Returns the MinHash signature of the shingles of keyword_tokenize output for text_string
+        as a tuple of band_count * row_count int, or an empty tuple should it have no keywords.
+
+        Exceptions raised:
+
+        - InputError: occurs should a non-string argument be passed
+        '''
+        word_list = ptext.keyword_tokenize(text_string).split()
+        if not word_list:
+            return ()
+        shingle_count = max(len(word_list) - self.shingle_size + 1, 1)
+        hashes = {crc32(" ".join(word_list[i:i + self.shingle_size]).encode("utf-8"))
+                  for i in range(shingle_count)}
+        return tuple(min([(a * x + b) % MERSENNE_PRIME for x in hashes]) & 0xffffffff
+                     for a, b in self._permutations)
+
+    def _add(self, signature, key):
+        '''indexes signature under key, returning key; called holding the lock'''
+        if key is None:
+            key = self._next_key
+            self._next_key += 1
+        if not signature:
+            return key
+        elif key in self._signatures:
+            self._remove(key)
+        while len(self._signatures) >= self.max_size:
+            self._remove(next(iter(self._signatures)))
+        self._signatures[key] = signature
+        for band_key in self._band_keys(signature):
+            self._buckets.setdefault(band_key, []).append(key)
+        return key
+
+    def _band_keys(self, signature):
+        '''returns the bucket key of each band of signature'''
+        return [(band, signature[band * self.row_count:(band + 1) * self.row_count])
+                for band in range(self.band_count)]
+
+    def _find(self, signature):
+        '''returns the key of an indexed near duplicate of signature, or None; called holding the lock'''
+        if not signature:
+            return None
+        checked_keys = set()
+        for band_key in self._band_keys(signature):
+            for key in self._buckets.get(band_key, ()):
+                if key in checked_keys:
+                    continue
+                checked_keys.add(key)
+                matching_rows = sum(row == other_row for row, other_row
+                                    in zip(signature, self._signatures[key]))
+                if matching_rows >= self.threshold * len(signature):
+                    return key
+        return None
+
+    def _remove(self, key):
+        '''removes key from the index; called holding the lock'''
+        for band_key in self._band_keys(self._signatures.pop(key)):
+            bucket = self._buckets[band_key]
+            bucket.remove(key)
+            if not bucket:
+                del self._buckets[band_key]
+
+
+#functions
+def create_dedupe_function(index=None):
+    '''
+    Returns a function for the function_list of preprocess_text which returns its text as it is
+    the first time it is seen, and "" should it be a near duplicate of a text it has already seen
+    according to index, so that the functions which follow it are given nothing to process.
+    Place it ahead of expensive functions such as correct_spelling and lemmatize.
+
+    Keyword argument:
+
+    - index: MinHashIndex instance, defaulting to a new MinHashIndex
+
+    Exceptions raised:
+
+    - InputError: occurs should index not be a MinHashIndex
+    '''
+    index = MinHashIndex() if index is None else index
+    if not isinstance(index, MinHashIndex):
+        raise InputError("MinHashIndex not passed as argument for index")
+
+    def remove_near_duplicates(text_string):
+        '''returns "" should text_string be a near duplicate of a text already seen'''
+        return "" if index.check(text_string) is not None else text_string
+    return remove_near_duplicates
+
+def find_near_duplicates(text_list, index=None):
+    '''
+    Flags near duplicates within text_list, returning for each string the position within
+    text_list of the earlier string it is a near duplicate of, or None, as type list. Strings are
+    added to index under their position, so an index passed in should not already hold keys
+    which are positions.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - index: MinHashIndex instance, defaulting to a new MinHashIndex
+
+    Exceptions raised:
+
+    - InputError: occurs should text_list be non-list or contain non-string elements, or index
+      not be a MinHashIndex
+    '''
+    index = MinHashIndex() if index is None else index
+    if not isinstance(index, MinHashIndex):
+        raise InputError("MinHashIndex not passed as argument for index")
+    elif not isinstance(text_list, list):
+        raise InputError("list not passed as argument for text_list")
+    return [index.check(text_string, i) for i, text_string in enumerate(text_list)]
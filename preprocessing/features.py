@@ -0,0 +1,105 @@
+'''
+Feature hashing module:
+'''
+
+
+from array import array
+from collections import Counter
+from zlib import crc32
+
+from preprocessing.errors import InputError
+import preprocessing.batch as pbatch
+
+
+HASH_BUCKET_COUNT = 1 << 20
+
+
+#functions
+def hash_features(text_string, bucket_count=HASH_BUCKET_COUNT, ngram_range=(1, 1)):
+    '''
+    Hashes the whitespace-separated words of text_string, such as the output of keyword_tokenize,
+    and their n-grams for each n within ngram_range into bucket_count buckets using CRC-32, which
+    is fast and the same in every process. Returns the sparse features as a tuple of
+    (indices, counts), both array('I') instances, holding each non-empty bucket in increasing
+    order and the number of words or n-grams hashed into it.
+
+    With its default arguments hash_features can end the function_list of preprocess_text or
+    preprocess_batch; functools.partial can set its other arguments. preprocess_text returns ""
+    for an empty or None document without applying any function, so such documents come back as
+    "" rather than as empty features; hash_features_batch, which calls hash_features directly,
+    gives every document features and is to be preferred for building a feature matrix.
+
+    Keyword argument:
+
+    - text_string: string instance
+    - bucket_count: number of buckets to hash into
+    - ngram_range: tuple of the smallest and largest n-gram sizes to hash
+
+    Exceptions raised:
+
+    - InputError: occurs should a non-string argument be passed, bucket_count not be a positive
+      integer, or ngram_range not be a tuple of increasing positive integers
+    '''
+    _validate_arguments(bucket_count, ngram_range)
+    if text_string is None or text_string == "":
+        return array("I"), array("I")
+    elif isinstance(text_string, str):
+        bucket_counts = Counter(_hash_ngrams(text_string.split(), bucket_count, ngram_range))
+        indices = array("I", sorted(bucket_counts))
+        return indices, array("I", [bucket_counts[index] for index in indices])
+    else:
+        raise InputError("string not passed as argument for text_string")
+
+def hash_features_batch(text_list, bucket_count=HASH_BUCKET_COUNT, ngram_range=(1, 1),
+                        thread_count=None):
+    '''
+    Applies hash_features onto each string within text_list using run_batch, returning the
+    features of every string as a CSR matrix of shape (len(text_list), bucket_count) in the form
+    of a tuple of (indptr, indices, data): the buckets and counts of the i-th string are
+    indices[indptr[i]:indptr[i + 1]] and data[indptr[i]:indptr[i + 1]], indptr being an
+    array('Q') instance and indices and data array('I') instances.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - bucket_count: number of buckets to hash into
+    - ngram_range: tuple of the smallest and largest n-gram sizes to hash
+    - thread_count: number of threads to run, defaulting to the number of CPUs
+
+    Exceptions raised:
+
+    - InputError: occurs should text_list be non-list or contain non-string elements,
+      bucket_count not be a positive integer, or ngram_range not be a tuple of increasing
+      positive integers
+    '''
+    _validate_arguments(bucket_count, ngram_range)
+    feature_list = pbatch.run_batch(lambda text_string: hash_features(text_string, bucket_count,
+                                                                      ngram_range),
+                                    text_list, thread_count)
+    indptr = array("Q", [0])
+    indices = array("I")
+    data = array("I")
+    for feature_indices, feature_counts in feature_list:
+        indices.extend(feature_indices)
+        data.extend(feature_counts)
+        indptr.append(len(indices))
+    return indptr, indices, data
+
+def _hash_ngrams(word_list, bucket_count, ngram_range):
+    '''yields the bucket of each n-gram of word_list for each n within ngram_range'''
+    for n in range(ngram_range[0], ngram_range[1] + 1):
+        if n == 1:
+            for word in word_list:
+                yield crc32(word.encode("utf-8")) % bucket_count
+        else:
+            for i in range(len(word_list) - n + 1):
+                yield crc32(" ".join(word_list[i:i + n]).encode("utf-8")) % bucket_count
+
+def _validate_arguments(bucket_count, ngram_range):
+    '''raises InputError should bucket_count or ngram_range be invalid'''
+    if not isinstance(bucket_count, int) or not 0 < bucket_count <= 1 << 32:
+        raise InputError("positive integer not passed as argument for bucket_count")
+    elif (not isinstance(ngram_range, tuple) or len(ngram_range) != 2
+          or not all(isinstance(n, int) for n in ngram_range)
+          or not 1 <= ngram_range[0] <= ngram_range[1]):
+        raise InputError("tuple of increasing positive integers not passed as argument for ngram_range")
@@ -0,0 +1,246 @@
+'''
+Sharded batch job module:
+'''
+
+
+import argparse
+from concurrent.futures import ProcessPoolExecutor
+import json
+import os
+from os import path
+import tempfile
+
+from preprocessing.errors import InputError
+import preprocessing.reader as preader
+import preprocessing.text as ptext
+
+
+CHECKPOINT_RECORDS = 10000
+PLAN_FILE_NAME = "shards.json"
+SHARD_SIZE = 1 << 26
+
+
+#functions
+def main(argument_list=None):
+    '''
+    Command line entry point, run as python -m preprocessing.jobs on each worker or node: runs
+    run_job for one worker, or run_local_job with --processes, applying functions of
+    preprocessing.text named on the command line onto the files of a manifest file.
+
+    Keyword argument:
+
+    - argument_list: list of command line arguments, defaulting to sys.argv
+    '''
+    parser = argparse.ArgumentParser(prog="python -m preprocessing.jobs",
+                                     description="run a sharded, resumable pre-processing job")
+    parser.add_argument("manifest", help="file listing one input file per line")
+    parser.add_argument("functions", help="comma-separated names of preprocessing.text functions")
+    parser.add_argument("output_dir", help="directory shared by every worker for shard output")
+    parser.add_argument("--worker-index", type=int, default=0, help="index of this worker")
+    parser.add_argument("--worker-count", type=int, default=1, help="number of workers")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="run every worker within this many local processes instead")
+    parser.add_argument("--shard-size", type=int, default=SHARD_SIZE, help="bytes per shard")
+    arguments = parser.parse_args(argument_list)
+    function_list = []
+    for function_name in arguments.functions.split(","):
+        func = getattr(ptext, function_name.strip(), None)
+        if not callable(func):
+            parser.error("{} is not a function of preprocessing.text".format(function_name))
+        function_list.append(func)
+    if arguments.processes:
+        output_list = run_local_job(arguments.manifest, function_list, arguments.output_dir,
+                                    arguments.processes, shard_size=arguments.shard_size)
+    else:
+        output_list = run_job(arguments.manifest, function_list, arguments.output_dir,
+                              arguments.worker_index, arguments.worker_count,
+                              shard_size=arguments.shard_size)
+    print("\n".join(output_list))
+
+def plan_shards(manifest, shard_size=SHARD_SIZE, delimiter="\n", encoding="utf-8"):
+    '''
+    Splits the files of manifest into shards of roughly shard_size bytes starting on record
+    boundaries, using find_record_offsets. Returns the shards in order as type list of
+    (file_path, start, end) tuples; the plan depends only on the files and arguments, so every
+    worker computing it gets the same shards.
+
+    Keyword argument:
+
+    - manifest: list of file paths, or path to a file listing one file path per line, relative
+      paths being relative to the manifest's directory
+    - shard_size: number of bytes per shard
+    - delimiter: string separating records within the files
+    - encoding: encoding of the files
+
+    Exceptions raised:
+
+    - InputError: occurs should manifest be neither list nor string, contain non-string
+      elements, or shard_size not be a positive integer
+    '''
+    if not isinstance(shard_size, int) or shard_size < 1:
+        raise InputError("positive integer not passed as argument for shard_size")
+    shard_list = []
+    for file_path in _read_manifest(manifest):
+        part_count = max(-(-path.getsize(file_path) // shard_size), 1)
+        shard_list.extend((file_path, start, end) for start, end
+                          in preader.find_record_offsets(file_path, part_count, delimiter, encoding)
+                          if start < end)
+    return shard_list
+
+def run_job(manifest, function_list, output_dir, worker_index=0, worker_count=1,
+            shard_size=SHARD_SIZE, delimiter="\n", encoding="utf-8",
+            checkpoint_records=CHECKPOINT_RECORDS):
+    '''
+    Applies the functions of function_list with preprocess_text onto each record of the shards
+    of manifest assigned to this worker, the i-th shard of plan_shards going to worker
+    i % worker_count, so that workers on separate nodes sharing output_dir split the job without
+    talking to each other. Returns the output paths of this worker's shards as type list of str.
+
+    The processed records of shard i are written, each followed by delimiter, to
+    output_dir/shard-<i>.txt, which only appears once the whole shard is written. Until then they
+    go to a .part file, and every checkpoint_records records the .part file is synced to disk and
+    the input offset reached is recorded in a .checkpoint file, so that a restarted worker skips
+    finished shards and resumes unfinished ones from their last checkpoint. The plan is recorded
+    in output_dir/shards.json, and a job is refused should output_dir hold a different plan.
+
+    Keyword argument:
+
+    - manifest: list of file paths, or path to a file listing one file path per line
+    - function_list: list of functions available in preprocessing.text, returning strings
+    - output_dir: directory to write shard output and checkpoints to
+    - worker_index: index of this worker, from 0 to worker_count - 1
+    - worker_count: number of workers splitting the job
+    - shard_size: number of bytes per shard
+    - delimiter: string separating records within the input and output files
+    - encoding: encoding of the input and output files
+    - checkpoint_records: number of records processed between checkpoints
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should function_list be non-list, worker_index, worker_count or
+      checkpoint_records be invalid, or output_dir hold a job with a different plan
+    '''
+    if not isinstance(function_list, list):
+        raise InputError("list of functions not passed as argument for function_list")
+    elif not isinstance(worker_count, int) or worker_count < 1:
+        raise InputError("positive integer not passed as argument for worker_count")
+    elif not isinstance(worker_index, int) or not 0 <= worker_index < worker_count:
+        raise InputError("integer from 0 to worker_count - 1 not passed as argument for worker_index")
+    elif not isinstance(checkpoint_records, int) or checkpoint_records < 1:
+        raise InputError("positive integer not passed as argument for checkpoint_records")
+    shard_list = plan_shards(manifest, shard_size, delimiter, encoding)
+    os.makedirs(output_dir, exist_ok=True)
+    _record_plan(output_dir, shard_list, delimiter, encoding)
+    output_list = []
+    for shard_index in range(worker_index, len(shard_list), worker_count):
+        output_list.append(_run_shard(shard_list[shard_index], shard_index, function_list,
+                                      output_dir, delimiter, encoding, checkpoint_records))
+    return output_list
+
+def run_local_job(manifest, function_list, output_dir, process_count=None, **job_arguments):
+    '''
+    Runs a job with run_job across process_count local processes, each acting as one worker, and
+    returns the output paths of every shard in order as type list of str. The functions of
+    function_list must be picklable, such as those of preprocessing.text.
+
+    Keyword argument:
+
+    - manifest: list of file paths, or path to a file listing one file path per line
+    - function_list: list of functions available in preprocessing.text, returning strings
+    - output_dir: directory to write shard output and checkpoints to
+    - process_count: number of processes, defaulting to the number of CPUs
+    - job_arguments: shard_size, delimiter, encoding or checkpoint_records for run_job
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should run_job's arguments be invalid or process_count not be a
+      positive integer
+    '''
+    if process_count is not None and (not isinstance(process_count, int) or process_count < 1):
+        raise InputError("positive integer not passed as argument for process_count")
+    process_count = process_count or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=process_count) as executor:
+        future_list = [executor.submit(run_job, manifest, function_list, output_dir,
+                                       worker_index, process_count, **job_arguments)
+                       for worker_index in range(process_count)]
+        output_lists = [future.result() for future in future_list]
+    return [output_lists[i % process_count][i // process_count]
+            for i in range(sum(len(output_list) for output_list in output_lists))]
+
+def _read_manifest(manifest):
+    '''returns the file paths of manifest, a list of paths or the path of a file listing them'''
+    if isinstance(manifest, str):
+        manifest_dir = path.dirname(path.abspath(manifest))
+        with open(manifest, "r") as manifest_file:
+            return [path.join(manifest_dir, line.strip()) for line in manifest_file
+                    if line.strip()]
+    elif not isinstance(manifest, list):
+        raise InputError("list or file path not passed as argument for manifest")
+    elif not all(isinstance(file_path, str) for file_path in manifest):
+        raise InputError("string not passed as element of manifest")
+    return manifest
+
+def _record_plan(output_dir, shard_list, delimiter, encoding):
+    '''writes the plan of shard_list to output_dir, raising InputError should it differ'''
+    plan = {"delimiter": delimiter, "encoding": encoding,
+            "shards": [list(shard) for shard in shard_list]}
+    plan_path = path.join(output_dir, PLAN_FILE_NAME)
+    if path.exists(plan_path):
+        with open(plan_path, "r") as plan_file:
+            if json.load(plan_file) != plan:
+                raise InputError("output_dir passed holds a job with a different shard plan")
+    else:
+        _write_json(plan_path, plan)
+
+def _run_shard(shard, shard_index, function_list, output_dir, delimiter, encoding,
+               checkpoint_records):
+    '''processes shard from its last checkpoint, returning the path of its finished output'''
+    file_path, start, end = shard
+    output_path = path.join(output_dir, "shard-{:06d}.txt".format(shard_index))
+    part_path = output_path + ".part"
+    checkpoint_path = output_path + ".checkpoint"
+    if path.exists(output_path):
+        if path.exists(checkpoint_path):
+            os.remove(checkpoint_path)
+        return output_path
+    checkpoint = {"offset": start, "output_size": 0}
+    if path.exists(checkpoint_path) and path.exists(part_path):
+        with open(checkpoint_path, "r") as checkpoint_file:
+            checkpoint = json.load(checkpoint_file)
+    delimiter_bytes = delimiter.encode(encoding)
+    with open(part_path, "r+b" if path.exists(part_path) else "wb") as part_file:
+        part_file.truncate(checkpoint["output_size"])
+        part_file.seek(checkpoint["output_size"])
+        record_count = 0
+        for record, offset in preader.read_records_with_offsets(file_path, delimiter, encoding,
+                                                                  checkpoint["offset"], end):
+            part_file.write(ptext.preprocess_text(record, function_list).encode(encoding))
+            part_file.write(delimiter_bytes)
+            record_count += 1
+            if record_count % checkpoint_records == 0:
+                _sync(part_file)
+                _write_json(checkpoint_path, {"offset": offset, "output_size": part_file.tell()})
+        _sync(part_file)
+    os.replace(part_path, output_path)
+    if path.exists(checkpoint_path):
+        os.remove(checkpoint_path)
+    return output_path
+
+def _sync(output_file):
+    '''flushes output_file and syncs it to disk'''
+    output_file.flush()
+    os.fsync(output_file.fileno())
+
+def _write_json(file_path, value):
+    '''writes value to file_path as JSON, replacing file_path in one step once synced to disk'''
+    descriptor, temporary_path = tempfile.mkstemp(dir=path.dirname(file_path), suffix=".tmp")
+    with os.fdopen(descriptor, "w") as temporary_file:
+        json.dump(value, temporary_file)
+        _sync(temporary_file)
+    os.replace(temporary_path, file_path)
+
+
+if __name__ == "__main__":
+    main()
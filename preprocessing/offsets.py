@@ -0,0 +1,189 @@
+'''
+Offset mapping module:
+'''
+
+
+from array import array
+from bisect import bisect_right
+import re
+
+from preprocessing.errors import InputError
+
+
+COPY = 0
+NON_WHITESPACE = re.compile(r'\S+')
+REPLACE = 1
+WHITESPACE = re.compile(r'\s+')
+
+
+#classes
+class OffsetMap(object):
+    '''
+    Maps character offsets within processed text back to character offsets within the original
+    text. The map is stored as parallel arrays of segments, each covering a run of processed text
+    which is either copied verbatim from the original text (COPY) or which replaced a span of the
+    original text (REPLACE), so lookups are a binary search over the segment starts.
+
+    Keyword argument:
+
+    - text_length: length of the original text the map starts from
+    '''
+
+    def __init__(self, text_length=0):
+        self.length = 0
+        self.original_length = text_length
+        self._out_starts = array("q")
+        self._orig_starts = array("q")
+        self._orig_ends = array("q")
+        self._kinds = array("b")
+        if text_length > 0:
+            self._append(0, 0, text_length, COPY)
+            self.length = text_length
+
+    def __len__(self):
+        return len(self._out_starts)
+
+    def __repr__(self):
+        return "OffsetMap(length={}, original_length={}, segments={})".format(
+            self.length, self.original_length, len(self))
+
+    def _append(self, out_start, orig_start, orig_end, kind):
+        '''appends a segment, merging it into the previous segment where both are contiguous copies'''
+        if (kind == COPY and self._kinds and self._kinds[-1] == COPY
+                and self._orig_ends[-1] == orig_start):
+            self._orig_ends[-1] = orig_end
+        else:
+            self._out_starts.append(out_start)
+            self._orig_starts.append(orig_start)
+            self._orig_ends.append(orig_end)
+            self._kinds.append(kind)
+
+    def _find_segment(self, offset):
+        '''returns the index of the segment covering offset'''
+        return bisect_right(self._out_starts, offset) - 1
+
+    def compose(self, edit_log):
+        '''
+        Composes the map with edit_log, a list of non-overlapping (start, end, replacement_length)
+        tuples sorted by start and given in the coordinates of the text this map currently
+        produces. Returns the composed map as a new OffsetMap instance.
+        '''
+        composed = OffsetMap()
+        composed.original_length = self.original_length
+        position = 0
+        new_position = 0
+        for start, end, replacement_length in edit_log:
+            if start > position:
+                self._copy_into(composed, position, start, new_position)
+                new_position += start - position
+            if replacement_length > 0:
+                orig_start, orig_end = self.original_span(start, end)
+                composed._append(new_position, orig_start, orig_end, REPLACE)
+                new_position += replacement_length
+            position = end
+        if self.length > position:
+            self._copy_into(composed, position, self.length, new_position)
+            new_position += self.length - position
+        composed.length = new_position
+        return composed
+
+    def _copy_into(self, composed, start, end, new_position):
+        '''appends the segments covering [start, end) of this map onto composed'''
+        index = self._find_segment(start)
+        while start < end:
+            segment_start = self._out_starts[index]
+            segment_end = (self._out_starts[index + 1] if index + 1 < len(self._out_starts)
+                           else self.length)
+            stop = min(end, segment_end)
+            if self._kinds[index] == COPY:
+                orig_start = self._orig_starts[index] + start - segment_start
+                composed._append(new_position, orig_start, orig_start + stop - start, COPY)
+            else:
+                composed._append(new_position, self._orig_starts[index], self._orig_ends[index],
+                                 REPLACE)
+            new_position += stop - start
+            start = stop
+            index += 1
+
+    def original_offset(self, offset):
+        '''
+        Returns the offset within the original text corresponding to offset within the processed
+        text as type int. Offsets falling inside replaced text map to the start of the span it
+        replaced.
+        '''
+        if not isinstance(offset, int) or offset < 0 or offset > self.length:
+            raise InputError("offset outside of processed text passed as argument")
+        if not self._out_starts:
+            return 0
+        elif offset == self.length:
+            return self._orig_ends[-1]
+        index = self._find_segment(offset)
+        if self._kinds[index] == COPY:
+            return self._orig_starts[index] + offset - self._out_starts[index]
+        else:
+            return self._orig_starts[index]
+
+    def original_span(self, start, end):
+        '''
+        Returns the (start, end) span within the original text covering the processed text span
+        [start, end) as a tuple of int.
+        '''
+        if not isinstance(end, int) or end < start or end > self.length:
+            raise InputError("span outside of processed text passed as argument")
+        orig_start = self.original_offset(start)
+        if start == end:
+            return (orig_start, orig_start)
+        index = self._find_segment(end - 1)
+        if self._kinds[index] == COPY:
+            return (orig_start, self._orig_starts[index] + end - self._out_starts[index])
+        else:
+            return (orig_start, self._orig_ends[index])
+
+
+#functions
+def apply_edits(text_string, edits, offset_map):
+    '''
+    Applies edits, a list of non-overlapping (start, end, replacement) tuples sorted by start, to
+    text_string and composes offset_map with the resulting edit log. Returns the edited string
+    and the composed map as a tuple of (str, OffsetMap).
+    '''
+    pieces = []
+    edit_log = []
+    position = 0
+    for start, end, replacement in edits:
+        if text_string[start:end] == replacement:
+            continue
+        pieces.append(text_string[position:start])
+        pieces.append(replacement)
+        edit_log.append((start, end, len(replacement)))
+        position = end
+    if not edit_log:
+        return text_string, offset_map
+    pieces.append(text_string[position:])
+    return "".join(pieces), offset_map.compose(edit_log)
+
+def find_regex_edits(pattern, text_string, replacement=""):
+    '''
+    Returns the edits made by substituting every match of the compiled pattern within
+    text_string, as re.sub would, as a list of (start, end, replacement) tuples. replacement may
+    be a string or a function taking a match object.
+    '''
+    if callable(replacement):
+        return [(match.start(), match.end(), replacement(match))
+                for match in pattern.finditer(text_string)]
+    return [(match.start(), match.end(), replacement) for match in pattern.finditer(text_string)]
+
+def find_whitespace_edits(text_string):
+    '''
+    Returns the edits made by collapsing text_string via " ".join(text_string.split()) as a list
+    of (start, end, replacement) tuples.
+    '''
+    edits = []
+    text_length = len(text_string)
+    for match in WHITESPACE.finditer(text_string):
+        if match.start() == 0 or match.end() == text_length:
+            edits.append((match.start(), match.end(), ""))
+        else:
+            edits.append((match.start(), match.end(), " "))
+    return edits
+
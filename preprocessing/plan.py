@@ -0,0 +1,130 @@
+'''
+Pre-processing plan optimisation module:
+'''
+
+
+from preprocessing.errors import FunctionError, InputError
+from preprocessing.stream import WHITESPACE_COLLAPSING_FUNCTIONS
+import preprocessing.text as ptext
+
+
+CHARACTER_PRESERVING_FUNCTIONS = WHITESPACE_COLLAPSING_FUNCTIONS - {
+    ptext.correct_spelling,
+    ptext.normalize_characters
+} | {
+    ptext.convert_ligatures,
+    ptext.lowercase
+}
+EXPENSIVE_FUNCTIONS = {ptext.correct_spelling}
+SHRINKING_FUNCTIONS = {ptext.remove_esc_chars, ptext.remove_numbers, ptext.remove_urls}
+
+
+#functions
+def explain(function_list, text_string=None, reorder=False):
+    '''
+    Returns a description of the plan optimize_function_list would rewrite function_list into for
+    text_string, listing the original plan, the optimised plan and each rewrite made, as type str.
+    Rewrites which may change the processed string are marked as such.
+
+    Keyword argument:
+
+    - function_list: list of functions available in preprocessing.text
+    - text_string: string instance the plan will be applied to, or None should it be unknown
+    - reorder: whether to move functions ahead of correct_spelling
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should function_list be non-list, or text_string be non-string
+    '''
+    optimized_list, rewrites = _optimize(function_list, text_string, reorder)
+    lines = ["original plan: " + _describe_plan(function_list),
+             "optimized plan: " + _describe_plan(optimized_list)]
+    lines.extend("- " + rewrite for rewrite in rewrites)
+    return "\n".join(lines)
+
+def optimize_function_list(function_list, text_string=None, reorder=False):
+    '''
+    Rewrites function_list into a cheaper plan for preprocess_text, returning the rewritten list of
+    functions as type list:
+
+    - Drops remove_whitespace next to a function which already collapses whitespace
+    - Given text_string, drops convert_ligatures where the text it would receive is known to be
+      ASCII, and convert_html_entities where that text is known to contain no "&"
+    - Should reorder be True, moves remove_esc_chars, remove_numbers and remove_urls ahead of
+      correct_spelling, so that escape sequences, numbers and URLs are removed before spelling
+      candidates are searched for
+
+    Dropping a function never changes the processed string. Moving a function ahead of
+    correct_spelling changes the words correct_spelling is given, and so can change the processed
+    string of ordinary text: remove_numbers also strips full stops, commas and slashes from the
+    end of every word, so that "year." is looked up as "year" rather than corrected from "year.",
+    which may give "years". Functions not found in preprocessing.text are never moved or dropped.
+
+    Keyword argument:
+
+    - function_list: list of functions available in preprocessing.text
+    - text_string: string instance the plan will be applied to, or None should it be unknown
+    - reorder: whether to move functions ahead of correct_spelling, which may change the output
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should function_list be non-list, or text_string be non-string
+    '''
+    return _optimize(function_list, text_string, reorder)[0]
+
+def _describe_plan(function_list):
+    '''returns the names of the functions within function_list joined as type str'''
+    if not function_list:
+        return "(empty)"
+    return " -> ".join(_name(func) for func in function_list)
+
+def _name(func):
+    '''returns the name of func as type str'''
+    return getattr(func, "__name__", repr(func))
+
+def _optimize(function_list, text_string, reorder):
+    '''returns the optimised function_list and a list of the rewrites made as a tuple'''
+    if not isinstance(function_list, list):
+        raise InputError("list of functions not passed as argument for function_list")
+    elif text_string is not None and not isinstance(text_string, str):
+        raise InputError("string not passed as argument for text_string")
+    elif not all(callable(func) for func in function_list):
+        raise FunctionError("invalid function passed as element of function_list")
+    rewrites = []
+    collapsed_list = []
+    for i, func in enumerate(function_list):
+        following = function_list[i + 1] if i + 1 < len(function_list) else None
+        if func is ptext.remove_whitespace and collapsed_list and \
+                collapsed_list[-1] in WHITESPACE_COLLAPSING_FUNCTIONS:
+            rewrites.append("dropped remove_whitespace: whitespace already collapsed by " +
+                            _name(collapsed_list[-1]))
+        elif func is ptext.remove_whitespace and following in WHITESPACE_COLLAPSING_FUNCTIONS:
+            rewrites.append("dropped remove_whitespace: whitespace collapsed by " +
+                            _name(following))
+        else:
+            collapsed_list.append(func)
+    reordered_list = []
+    for func in collapsed_list:
+        position = len(reordered_list)
+        if reorder and func in SHRINKING_FUNCTIONS:
+            while position > 0 and reordered_list[position - 1] in EXPENSIVE_FUNCTIONS:
+                position -= 1
+        if position < len(reordered_list):
+            rewrites.append("moved {} ahead of {} (may change output)".format(
+                _name(func), _name(reordered_list[position])))
+        reordered_list.insert(position, func)
+    is_ascii = text_string is not None and ptext.NON_ASCII_PATTERN.search(text_string) is None
+    has_no_ampersand = text_string is not None and "&" not in text_string
+    optimized_list = []
+    for func in reordered_list:
+        if func is ptext.convert_ligatures and is_ascii:
+            rewrites.append("dropped convert_ligatures: text is ASCII")
+        elif func is ptext.convert_html_entities and has_no_ampersand:
+            rewrites.append("dropped convert_html_entities: text contains no '&'")
+        else:
+            optimized_list.append(func)
+            if func not in CHARACTER_PRESERVING_FUNCTIONS:
+                is_ascii = has_no_ampersand = False
+    return optimized_list, rewrites
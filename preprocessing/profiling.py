@@ -0,0 +1,316 @@
+'''
+Profiling module:
+'''
+
+
+import argparse
+import cProfile
+from functools import partial, wraps
+from os import path
+import threading
+from time import perf_counter
+import tracemalloc
+
+from preprocessing.errors import FunctionError, InputError
+import preprocessing.batch as pbatch
+import preprocessing.reader as preader
+import preprocessing.text as ptext
+
+
+PEAK_TRACKING = hasattr(tracemalloc, "reset_peak")
+
+
+#classes
+class PipelineProfiler(object):
+    '''
+    Context manager profiling the pipelines run within it whose function_list has been passed
+    through instrument. Each function of an instrumented function_list is a stage, attributed its
+    own calls, time, cProfile statistics and, should memory be True, the peak and net memory
+    allocated while it ran as traced by tracemalloc, the peak only from Python 3.9, whose
+    tracemalloc can reset it between calls, so that hotspots such as a slow regular
+    expression or the sets built by find_two_letter_edits are found under the stage calling them.
+
+    Stages run one at a time while profiled, including within the threads of preprocess_batch,
+    since cProfile and tracemalloc peaks cannot tell threads apart; profiled pipelines are slower
+    than unprofiled ones and the time of each stage is that of the stage alone.
+
+    Keyword argument:
+
+    - memory: whether to trace memory allocations with tracemalloc
+    - top_count: number of hotspots and allocation sites listed within the report
+    '''
+
+    def __init__(self, memory=True, top_count=10):
+        if not isinstance(top_count, int) or top_count < 1:
+            raise InputError("positive integer not passed as argument for top_count")
+        self.memory = memory
+        self.top_count = top_count
+        self.seconds = 0.0
+        self.snapshot = None
+        self._lock = threading.Lock()
+        self._stages = []
+        self._started_tracing = False
+        self._start = None
+
+    def __enter__(self):
+        if self.memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self._started_tracing = True
+        self._start = perf_counter()
+        return self
+
+    def __exit__(self, *exc_info):
+        self.seconds += perf_counter() - self._start
+        if self.memory and tracemalloc.is_tracing():
+            self.snapshot = tracemalloc.take_snapshot().filter_traces([
+                tracemalloc.Filter(False, tracemalloc.__file__),
+                tracemalloc.Filter(False, __file__)
+            ])
+        if self._started_tracing:
+            tracemalloc.stop()
+            self._started_tracing = False
+        return False
+
+    def get_stage_stats(self):
+        '''
+        Returns the figures of each stage instrumented so far as type list of dict, in order, each
+        with the keys name, calls, seconds, peak_bytes and net_bytes and the stage's
+        cProfile.Profile instance under profile. The bytes are None should memory be False, and
+        peak_bytes should tracemalloc lack reset_peak, before Python 3.9.
+        '''
+        return [dict(stage) for stage in self._stages]
+
+    def instrument(self, function_list):
+        '''
+        Returns a list of functions wrapping each function within function_list, for
+        preprocess_text, preprocess_batch or run_batch, so that each is profiled as its own stage
+        named by its position and name, e.g. "3:remove_urls". The wrappers are new functions, so
+        functions which recognise pre-processing functions by identity, such as
+        preprocess_text_with_offsets and preprocess_stream, treat them as unknown.
+
+        Keyword argument:
+
+        - function_list: list of functions taking a string instance
+
+        Exceptions raised:
+
+        - FunctionError: occurs should a non-callable element be passed within function_list
+        - InputError: occurs should function_list be non-list
+        '''
+        if not isinstance(function_list, list):
+            raise InputError("list not passed as argument for function_list")
+        instrumented_list = []
+        for func in function_list:
+            if not callable(func):
+                raise FunctionError("non-callable element passed within function_list")
+            stage = {
+                "name": "{}:{}".format(len(self._stages) + 1, _get_function_name(func)),
+                "calls": 0,
+                "seconds": 0.0,
+                "peak_bytes": 0 if self.memory and PEAK_TRACKING else None,
+                "net_bytes": 0 if self.memory else None,
+                "profile": cProfile.Profile()
+            }
+            self._stages.append(stage)
+            instrumented_list.append(self._wrap(func, stage))
+        return instrumented_list
+
+    def report(self):
+        '''
+        Returns a summary of the profiled stages as type str: a table of the calls, time, share of
+        stage time and peak and net memory of each stage, the functions each stage spent the most
+        time within, and the largest allocations still held when the context exited.
+        '''
+        stage_seconds = sum(stage["seconds"] for stage in self._stages)
+        line_list = [
+            "profiled {:.3f}s, {:.3f}s within {} stage(s)".format(self.seconds, stage_seconds,
+                                                                  len(self._stages)),
+            "",
+            "{:<32} {:>8} {:>10} {:>7} {:>12} {:>12}".format("stage", "calls", "seconds", "share",
+                                                             "peak KiB", "net KiB")
+        ]
+        for stage in self._stages:
+            line_list.append("{:<32} {:>8} {:>10.4f} {:>7.1%} {:>12} {:>12}".format(
+                stage["name"][:32], stage["calls"], stage["seconds"],
+                stage["seconds"] / (stage_seconds or 1.0), _format_kib(stage["peak_bytes"]),
+                _format_kib(stage["net_bytes"])))
+        for stage in self._stages:
+            function_stats = _get_function_stats(stage["profile"])
+            if not function_stats:
+                continue
+            line_list.extend(["", "hotspots of {}:".format(stage["name"]),
+                              "  {:>10} {:>10} {:>10}  function".format("calls", "tottime",
+                                                                         "cumtime")])
+            hotspot_list = sorted(function_stats.items(), key=lambda item: item[1][2], reverse=True)
+            for function_key, (_, call_count, total_time, cumulative_time, _) \
+                    in hotspot_list[:self.top_count]:
+                line_list.append("  {:>10} {:>10.4f} {:>10.4f}  {}".format(
+                    call_count, total_time, cumulative_time, _format_frame(function_key)))
+        if self.snapshot is not None:
+            line_list.extend(["", "largest allocations held at exit:"])
+            for statistic in self.snapshot.statistics("lineno")[:self.top_count]:
+                frame = statistic.traceback[0]
+                line_list.append("  {:>12} {:>8}  {}:{}".format(
+                    _format_kib(statistic.size), statistic.count,
+                    path.basename(frame.filename), frame.lineno))
+        return "\n".join(line_list) + "\n"
+
+    def write_collapsed_stacks(self, output_file):
+        '''
+        Writes the call stacks of every stage to output_file in the collapsed-stack format read by
+        flamegraph.pl and speedscope, one "stage;caller;callee microseconds" line per stack. cProfile
+        records callers one level deep, so the time of stacks deeper than two calls is apportioned
+        by the share of each function's time its callers account for.
+
+        Keyword argument:
+
+        - output_file: path of the file to write, or file object with a write method
+
+        Exceptions raised:
+
+        - InputError: occurs should output_file be neither a string nor have a write method
+        '''
+        if isinstance(output_file, str):
+            with open(output_file, "w") as stack_file:
+                self.write_collapsed_stacks(stack_file)
+            return
+        elif not hasattr(output_file, "write"):
+            raise InputError("path or file object not passed as argument for output_file")
+        for stage in self._stages:
+            function_stats = _get_function_stats(stage["profile"])
+            callee_map = {}
+            for function_key, (_, _, _, _, caller_map) in function_stats.items():
+                for caller_key, edge_stats in caller_map.items():
+                    callee_map.setdefault(caller_key, []).append((function_key, edge_stats))
+            for function_key, stats in function_stats.items():
+                if not any(caller_key in function_stats for caller_key in stats[4]):
+                    _write_stacks(output_file, [stage["name"], _format_frame(function_key)],
+                                  function_key, 1.0, function_stats, callee_map)
+
+    def write_report(self, output_file):
+        '''
+        Writes the summary returned by report to output_file.
+
+        Keyword argument:
+
+        - output_file: path of the file to write, or file object with a write method
+
+        Exceptions raised:
+
+        - InputError: occurs should output_file be neither a string nor have a write method
+        '''
+        if isinstance(output_file, str):
+            with open(output_file, "w") as report_file:
+                report_file.write(self.report())
+        elif hasattr(output_file, "write"):
+            output_file.write(self.report())
+        else:
+            raise InputError("path or file object not passed as argument for output_file")
+
+    def _wrap(self, func, stage):
+        '''returns func wrapped to run one call at a time, attributing its costs to stage'''
+        @wraps(func)
+        def profiled(text_string):
+            '''runs func onto text_string as a profiled stage'''
+            with self._lock:
+                if self.memory and tracemalloc.is_tracing():
+                    if PEAK_TRACKING:
+                        tracemalloc.reset_peak()
+                    start_bytes = tracemalloc.get_traced_memory()[0]
+                else:
+                    start_bytes = None
+                start = perf_counter()
+                stage["profile"].enable()
+                try:
+                    return func(text_string)
+                finally:
+                    stage["profile"].disable()
+                    stage["seconds"] += perf_counter() - start
+                    stage["calls"] += 1
+                    if start_bytes is not None:
+                        current_bytes, peak_bytes = tracemalloc.get_traced_memory()
+                        if stage["peak_bytes"] is not None:
+                            stage["peak_bytes"] = max(stage["peak_bytes"],
+                                                      peak_bytes - start_bytes)
+                        stage["net_bytes"] += current_bytes - start_bytes
+        return profiled
+
+
+#functions
+def main(argument_list=None):
+    '''
+    Command line entry point, run as python -m preprocessing.profiling: applies functions of
+    preprocessing.text named on the command line onto each record of a file with
+    preprocess_batch under a PipelineProfiler, printing or writing its report and optionally
+    writing collapsed stacks.
+
+    Keyword argument:
+
+    - argument_list: list of command line arguments, defaulting to sys.argv
+    '''
+    parser = argparse.ArgumentParser(prog="python -m preprocessing.profiling",
+                                     description="profile a pre-processing pipeline over a file")
+    parser.add_argument("file_path", help="file of records to pre-process")
+    parser.add_argument("functions", help="comma-separated names of preprocessing.text functions")
+    parser.add_argument("--delimiter", default="\n", help="record delimiter, a newline by default")
+    parser.add_argument("--threads", type=int, default=None, help="preprocess_batch thread_count")
+    parser.add_argument("--no-memory", action="store_true", help="skip tracing with tracemalloc")
+    parser.add_argument("--top", type=int, default=10, help="hotspots listed per stage")
+    parser.add_argument("--report", help="file to write the report to instead of printing it")
+    parser.add_argument("--collapsed", help="file to write collapsed stacks to")
+    arguments = parser.parse_args(argument_list)
+    function_list = []
+    for function_name in arguments.functions.split(","):
+        func = getattr(ptext, function_name.strip(), None)
+        if not callable(func):
+            parser.error("{} is not a function of preprocessing.text".format(function_name))
+        function_list.append(func)
+    record_iterator = preader.read_records(arguments.file_path, arguments.delimiter)
+    with PipelineProfiler(not arguments.no_memory, arguments.top) as profiler:
+        pbatch.preprocess_batch(record_iterator, profiler.instrument(function_list),
+                                arguments.threads)
+    if arguments.report:
+        profiler.write_report(arguments.report)
+    else:
+        print(profiler.report(), end="")
+    if arguments.collapsed:
+        profiler.write_collapsed_stacks(arguments.collapsed)
+
+def _format_frame(function_key):
+    '''returns a collapsed-stack frame name for a cProfile function key'''
+    file_name, line_number, function_name = function_key
+    if file_name == "~":
+        return function_name
+    return "{} ({}:{})".format(function_name, path.basename(file_name), line_number)
+
+def _format_kib(byte_count):
+    '''returns byte_count in KiB as type str, or "-" should it be None'''
+    return "-" if byte_count is None else "{:.1f}".format(byte_count / 1024)
+
+def _get_function_name(func):
+    '''returns the name of func, looking through functools.partial'''
+    if isinstance(func, partial):
+        return _get_function_name(func.func)
+    return getattr(func, "__name__", type(func).__name__)
+
+def _get_function_stats(profile):
+    '''returns the cProfile statistics of profile keyed by function, less its own disable call'''
+    profile.create_stats()
+    return {function_key: stats for function_key, stats in profile.stats.items()
+            if "_lsprof.Profiler" not in function_key[2]}
+
+def _write_stacks(output_file, frame_list, function_key, share, function_stats, callee_map):
+    '''writes the stacks from frame_list down, the last frame making up share of function_key'''
+    microseconds = int(round(function_stats[function_key][2] * share * 1e6))
+    if microseconds:
+        output_file.write("{} {}\n".format(";".join(frame_list), microseconds))
+    for callee_key, edge_stats in callee_map.get(function_key, []):
+        callee_frame = _format_frame(callee_key)
+        cumulative_time = function_stats[callee_key][3]
+        if cumulative_time and callee_frame not in frame_list:
+            _write_stacks(output_file, frame_list + [callee_frame], callee_key,
+                          share * edge_stats[3] / cumulative_time, function_stats, callee_map)
+
+
+if __name__ == "__main__":
+    main()
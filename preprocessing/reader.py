@@ -0,0 +1,143 @@
+'''
+Memory-mapped text reading module:
+'''
+
+
+import mmap
+from os import path
+
+from preprocessing.errors import InputError
+import preprocessing.text as ptext
+
+
+#functions
+def find_record_offsets(file_path, part_count, delimiter="\n", encoding="utf-8"):
+    '''
+    Splits the file at file_path into part_count byte ranges of roughly equal size, each moved
+    forward to start on a record boundary, so that separate workers can each read a range with
+    read_records. Returns the ranges as a list of (start, end) tuples of int; ranges may be empty
+    should records be larger than a range.
+
+    Keyword argument:
+
+    - file_path: path to a text file
+    - part_count: number of ranges to split the file into
+    - delimiter: string separating records within the file
+    - encoding: encoding of the file
+
+    Exceptions raised:
+
+    - InputError: occurs should file_path or delimiter be non-string, or part_count not be a
+      positive integer
+    '''
+    if not isinstance(part_count, int) or part_count < 1:
+        raise InputError("positive integer not passed as argument for part_count")
+    delimiter_bytes = _encode_delimiter(file_path, delimiter, encoding)
+    file_size = path.getsize(file_path)
+    if file_size == 0:
+        return [(0, 0)] * part_count
+    offsets = [0]
+    with open(file_path, "rb") as text_file, \
+            mmap.mmap(text_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        position = 0
+        for i in range(1, part_count):
+            while position < file_size * i // part_count:
+                position = mapped_file.find(delimiter_bytes, position)
+                position = file_size if position == -1 else position + len(delimiter_bytes)
+            offsets.append(min(position, file_size))
+    offsets.append(file_size)
+    return list(zip(offsets[:-1], offsets[1:]))
+
+def preprocess_file(file_path, function_list, delimiter="\n", encoding="utf-8", start=0, end=None):
+    '''
+    Given each function within function_list, applies the order of functions put forward onto
+    each record read from file_path by read_records, yielding each processed record as type str.
+
+    Keyword argument:
+
+    - file_path: path to a text file
+    - function_list: list of functions available in preprocessing.text
+    - delimiter: string separating records within the file
+    - encoding: encoding of the file
+    - start: byte offset of the first record to read
+    - end: byte offset at or past which no new record is read, defaulting to the end of the file
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should file_path or delimiter be non-string, or function_list be non-list
+    '''
+    if not isinstance(function_list, list):
+        raise InputError("list of functions not passed as argument for function_list")
+    for record in read_records(file_path, delimiter, encoding, start, end):
+        yield ptext.preprocess_text(record, function_list)
+
+def read_records(file_path, delimiter="\n", encoding="utf-8", start=0, end=None):
+    '''
+    Memory-maps the file at file_path read-only and yields each record separated by delimiter as
+    type str, without the delimiter. Only the bytes of the record being yielded are copied and
+    decoded, and the mapped pages are shared through the page cache by every process reading the
+    same file.
+
+    Records starting at or past end are not read, so that ranges from find_record_offsets can be
+    read by separate workers. A delimiter at the very end of the file does not start a record.
+
+    Keyword argument:
+
+    - file_path: path to a text file
+    - delimiter: string separating records within the file
+    - encoding: encoding of the file
+    - start: byte offset of the first record to read
+    - end: byte offset at or past which no new record is read, defaulting to the end of the file
+
+    Exceptions raised:
+
+    - InputError: occurs should file_path or delimiter be non-string, or start or end be invalid
+    '''
+    for record, _ in read_records_with_offsets(file_path, delimiter, encoding, start, end):
+        yield record
+
+def read_records_with_offsets(file_path, delimiter="\n", encoding="utf-8", start=0, end=None):
+    '''
+    Yields each record read_records would as a tuple of (record, offset), offset being the byte
+    offset as type int just past the record and its delimiter, from which reading resumes with
+    the record after it.
+
+    Keyword argument:
+
+    - file_path: path to a text file
+    - delimiter: string separating records within the file
+    - encoding: encoding of the file
+    - start: byte offset of the first record to read
+    - end: byte offset at or past which no new record is read, defaulting to the end of the file
+
+    Exceptions raised:
+
+    - InputError: occurs should file_path or delimiter be non-string, or start or end be invalid
+    '''
+    delimiter_bytes = _encode_delimiter(file_path, delimiter, encoding)
+    file_size = path.getsize(file_path)
+    end = file_size if end is None else end
+    if not isinstance(start, int) or not isinstance(end, int) or start < 0 or end < start:
+        raise InputError("invalid byte range passed as arguments for start and end")
+    end = min(end, file_size)
+    if start >= end:
+        return
+    with open(file_path, "rb") as text_file, \
+            mmap.mmap(text_file.fileno(), 0, access=mmap.ACCESS_READ) as mapped_file:
+        position = start
+        while position < end:
+            next_position = mapped_file.find(delimiter_bytes, position)
+            if next_position == -1:
+                next_position = file_size
+            record = mapped_file[position:next_position].decode(encoding)
+            position = min(next_position + len(delimiter_bytes), file_size)
+            yield record, position
+
+def _encode_delimiter(file_path, delimiter, encoding):
+    '''validates file_path and delimiter, returning delimiter encoded as type bytes'''
+    if not isinstance(file_path, str):
+        raise InputError("string not passed as argument for file_path")
+    elif not isinstance(delimiter, str) or delimiter == "":
+        raise InputError("non-empty string not passed as argument for delimiter")
+    return delimiter.encode(encoding)
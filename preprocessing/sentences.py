@@ -0,0 +1,211 @@
+'''
+Sentence splitting module:
+'''
+
+
+import json
+from os import path
+import re
+import threading
+
+from preprocessing.errors import InputError
+
+
+CANDIDATE_PATTERN = re.compile(r'(?<!\S)(\S*[.?!])(["\')\]}]*)\s+(?=(\S+))')
+CLOSING_CHARS = frozenset("\"')]}")
+ELLIPSIS_PATTERN = re.compile(r'\.\.+$')
+FINAL_CANDIDATE_PATTERN = re.compile(r'(\S*[.?!])([)";}\]*:@\'({\[?!])$')
+INITIAL_PATTERN = re.compile(r'[^\W\d]\.$')
+LAST_WORD_PATTERN = re.compile(r'\S*$')
+NUMERIC_PATTERN = re.compile(r'^-?[\.,]?\d[\d,\.-]*\.?$')
+ORTHO_BEG_LC = 1 << 4
+ORTHO_LC = (1 << 4) | (1 << 5) | (1 << 6)
+ORTHO_MID_UC = 1 << 2
+ORTHO_UC = (1 << 1) | (1 << 2) | (1 << 3)
+OPENING_RUN_PATTERN = re.compile(r'[.?!][?!]')
+PARAMETERS_LOCK = threading.Lock()
+PARAMETERS_PATH = path.join(path.dirname(__file__), "data/tokenizers/punkt/english_parameters.json")
+REALIGNMENT_PATTERN = re.compile(r'["\')\]}]+?(?:\s+|(?=--)|$)', re.MULTILINE)
+SENTENCE_PARAMETERS = None
+WORD_TOKEN_PATTERN = re.compile(r'%(MultiChar)s|(?=[^("`{\[:;&#*@)}\]\-,])\S+?'
+                                r'(?=\s|$|%(NonWord)s|%(MultiChar)s|,(?=$|\s|%(NonWord)s|%(MultiChar)s))|\S'
+                                % {"MultiChar": r'(?:-{2,}|\.{2,}|(?:\.\s){2,}\.)',
+                                   "NonWord": r'[)";}\]*:@\'({\[?!]'})
+
+
+#functions
+def extract_punkt_parameters(tokenizer, file_path=PARAMETERS_PATH):
+    '''
+    Extracts from tokenizer, an unpickled NLTK PunktSentenceTokenizer, the abbreviations,
+    collocations and frequent sentence starters it learnt along with the orthographic context of
+    each word type reduced to the sets split_sentences looks words up in, and writes them to
+    file_path as JSON. Run once whenever the bundled english.pickle changes, with the tokenizer
+    returned by load_sentence_tokenizer in preprocessing.text.
+
+    Keyword argument:
+
+    - tokenizer: PunktSentenceTokenizer instance
+    - file_path: path of the JSON file to write
+    '''
+    params = tokenizer._params
+    ortho_context = params.ortho_context
+    parameters = {
+        "abbreviations": sorted(params.abbrev_types),
+        "collocations": sorted(list(collocation) for collocation in params.collocations),
+        "sentence_starters": sorted(params.sent_starters),
+        "lowercase_types": sorted(word_type for word_type, context in ortho_context.items()
+                                  if context & ORTHO_LC),
+        "mid_uppercase_types": sorted(word_type for word_type, context in ortho_context.items()
+                                      if context & ORTHO_LC and context & ORTHO_MID_UC),
+        "uncertain_lowercase_types": sorted(word_type for word_type, context
+                                            in ortho_context.items()
+                                            if context & ORTHO_BEG_LC and not context & ORTHO_UC)
+    }
+    with open(file_path, "w") as parameter_file:
+        json.dump(parameters, parameter_file, separators=(",", ":"))
+
+def load_sentence_parameters():
+    '''
+    Loads the JSON file written by extract_punkt_parameters into SENTENCE_PARAMETERS as a dict of
+    frozenset instances, should it not have been loaded yet, and returns SENTENCE_PARAMETERS.
+    '''
+    global SENTENCE_PARAMETERS
+    with PARAMETERS_LOCK:
+        if SENTENCE_PARAMETERS is None:
+            with open(PARAMETERS_PATH, "r") as parameter_file:
+                parameters = json.load(parameter_file)
+            parameters["collocations"] = [tuple(collocation)
+                                          for collocation in parameters["collocations"]]
+            SENTENCE_PARAMETERS = {key: frozenset(value) for key, value in parameters.items()}
+    return SENTENCE_PARAMETERS
+
+def split_sentences(text_string):
+    '''
+    Splits text_string into a list of sentences with the parameters of NLTK's english.pickle
+    tokenizer, returning said list as type list of str. Candidate boundaries, words ending in a
+    full stop, question mark or exclamation mark followed by whitespace, or by punctuation at the
+    end of text_string, are found with compiled regular expressions, and each is decided by set
+    lookups following the rules of NLTK's PunktSentenceTokenizer, without tokenizing the rest of
+    text_string. Closing quotes and brackets after a boundary are then moved onto the sentence
+    before, as the punkt tokenizer moves them, so that 'He left. " She stayed.' gives
+    ['He left. "', 'She stayed.'].
+
+    The result only differs from the punkt tokenizer's where a full stop, question mark or
+    exclamation mark is followed, past any closing quotes or brackets, by a character other than
+    whitespace before the end of text_string, as in "end.)next" or "a.,b", which the punkt
+    tokenizer may split within; see sentence_agreement in preprocessing.benchmark.
+
+    Keyword argument:
+
+    - text_string: string instance
+
+    Exceptions raised:
+
+    - InputError: occurs should a non-string argument be passed
+    '''
+    if text_string is None or text_string == "":
+        return []
+    elif not isinstance(text_string, str):
+        raise InputError("non-string passed as argument for split_sentences")
+    parameters = SENTENCE_PARAMETERS or load_sentence_parameters()
+    span_list = []
+    start = 0
+    for match in CANDIDATE_PATTERN.finditer(text_string):
+        word, closers, next_word = match.groups()
+        if OPENING_RUN_PATTERN.match(word):
+            span_list.append((start, match.start() + 1))
+            start = match.start() + 1
+        if _is_sentence_break(word, closers, next_word, parameters):
+            span_list.append((start, match.end(1)))
+            start = match.start(2) if closers else match.end()
+    end = len(text_string.rstrip())
+    word_start = LAST_WORD_PATTERN.search(text_string, start, end).start()
+    if OPENING_RUN_PATTERN.match(text_string, word_start, end):
+        span_list.append((start, word_start + 1))
+        start = word_start = word_start + 1
+    final_candidate = FINAL_CANDIDATE_PATTERN.match(text_string, word_start, end)
+    if final_candidate and _is_sentence_break(final_candidate.group(1),
+                                              final_candidate.group(2), None, parameters):
+        span_list.append((start, final_candidate.end(1)))
+        start = final_candidate.end(1)
+    span_list.append((start, end))
+    sentence_list = []
+    start, end = span_list[0]
+    for next_start, next_end in span_list[1:]:
+        realignment = (text_string[next_start:next_start + 1] in CLOSING_CHARS
+                       and REALIGNMENT_PATTERN.match(text_string, next_start, next_end))
+        if realignment:
+            end = next_start + len(realignment.group(0).rstrip())
+            next_start = realignment.end()
+        if start < end:
+            sentence_list.append(text_string[start:end])
+        start, end = next_start, next_end
+    if start < end:
+        sentence_list.append(text_string[start:end])
+    return sentence_list
+
+def _first_pass(token, parameters):
+    '''returns whether token is a sentence break, abbreviation and ellipsis before its context'''
+    if token in (".", "?", "!"):
+        return True, False, False
+    elif ELLIPSIS_PATTERN.match(token):
+        return False, False, True
+    elif token[-1] == "." and not token.endswith(".."):
+        word_type = token[:-1].lower()
+        abbreviation = (word_type in parameters["abbreviations"]
+                        or word_type.split("-")[-1] in parameters["abbreviations"])
+        return not abbreviation, abbreviation, False
+    return False, False, False
+
+def _is_sentence_break(word, closers, next_word, parameters):
+    '''returns True should a token of word, closers and next_word other than the last break'''
+    if (word[-1] == "." and not closers and len(word) > 2 and word[:-1].isalpha()
+            and next_word.isalpha() and word[:-1].lower() not in parameters["abbreviations"]):
+        return (word[:-1].lower(), next_word.lower()) not in parameters["collocations"]
+    token_list = WORD_TOKEN_PATTERN.findall(word + (closers[:1] or " " + next_word))
+    annotation_list = [_first_pass(token, parameters) for token in token_list]
+    for i in range(len(token_list) - 1):
+        if _second_pass(token_list[i], annotation_list[i], token_list[i + 1],
+                        annotation_list[i + 1][0], parameters):
+            return True
+    return False
+
+def _second_pass(token, annotation, next_token, next_break, parameters):
+    '''returns whether token is a sentence break given the token following it'''
+    sentence_break, abbreviation, ellipsis = annotation
+    if token[-1] != ".":
+        return sentence_break
+    word_type = _strip_period(NUMERIC_PATTERN.sub("##number##", token.lower()))
+    next_type = NUMERIC_PATTERN.sub("##number##", next_token.lower())
+    if next_break:
+        next_type = _strip_period(next_type)
+    is_initial = INITIAL_PATTERN.match(token)
+    if (word_type, next_type) in parameters["collocations"]:
+        return False
+    elif (abbreviation or ellipsis) and not is_initial:
+        if (_starts_sentence(next_token, next_type, parameters) is True
+                or next_token[0].isupper() and next_type in parameters["sentence_starters"]):
+            return True
+    if is_initial or word_type == "##number##":
+        starts_sentence = _starts_sentence(next_token, next_type, parameters)
+        if starts_sentence is False:
+            return False
+        elif (starts_sentence is None and is_initial and next_token[0].isupper()
+              and next_type not in parameters["lowercase_types"]):
+            return False
+    return sentence_break
+
+def _starts_sentence(token, word_type, parameters):
+    '''returns True, False or None should orthographic context not decide if token starts a sentence'''
+    if token in (";", ":", ",", ".", "!", "?"):
+        return False
+    elif (token[0].isupper() and word_type in parameters["lowercase_types"]
+          and word_type not in parameters["mid_uppercase_types"]):
+        return True
+    elif token[0].islower() and word_type not in parameters["uncertain_lowercase_types"]:
+        return False
+    return None
+
+def _strip_period(word_type):
+    '''returns word_type less its final full stop, should it be longer than one character'''
+    return word_type[:-1] if len(word_type) > 1 and word_type[-1] == "." else word_type
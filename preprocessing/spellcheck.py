@@ -3,30 +3,58 @@ Spelling checker module:
 '''
 
 
+import argparse
+import math
 import re
 from os import path
 from collections import Counter
+from functools import lru_cache
 
 from preprocessing.errors import InputError
 
 
+CORPUS_PATH = path.join(path.dirname(__file__), 'data/bnc_wiktionary_corpus.txt')
+CORRECTION_CACHE_SIZE = 1 << 16
+DISTRIBUTION_PATH = path.join(path.dirname(__file__), 'data/word_distribution.txt')
 EN_ALPHABET = 'abcdefghijklmnopqrstuvwxyz'
-WORD_DISTRIBUTION = Counter(re.findall(r'\w+', open(path.join(path.dirname(__file__), 'data/bnc_wiktionary_corpus.txt')).read().lower()))
+QUANTIZATION_STEPS = 8
+WORD_DISTRIBUTION = Counter()
+WORD_TOTAL = 0
 
 
 #functions
 def correct_word(word_string):
     '''
     Finds all valid one and two letter corrections for word_string, returning the word
-    with the highest relative probability as type str.
+    with the highest relative probability as type str. Corrections are memoised for the
+    CORRECTION_CACHE_SIZE most recently corrected words, and the memo is safe to share
+    between threads.
     '''
     if word_string is None:
         return ""
     elif isinstance(word_string, str):
-        return max(find_candidates(word_string), key=find_word_prob)
+        return memoised_correction(word_string)
     else:
         raise InputError("string or none type variable not passed as argument to correct_word")
 
+def count_corpus_words(file_path=CORPUS_PATH):
+    '''
+    Counts the lowercased words of the text file at file_path, by default the full corpus the
+    module corrects words against, returning the counts as a Counter instance.
+
+    Keyword argument:
+
+    - file_path: path of a text file
+
+    Exceptions raised:
+
+    - InputError: occurs should file_path be non-string
+    '''
+    if not isinstance(file_path, str):
+        raise InputError("string not passed as argument for file_path")
+    with open(file_path, "r") as corpus_file:
+        return Counter(re.findall(r'\w+', corpus_file.read().lower()))
+
 def find_candidates(word_string):
     '''
     Finds all potential words word_string could have intended to mean. If a word is not incorrectly
@@ -88,18 +116,154 @@ def find_two_letter_edits(word_string):
     else:
         raise InputError("string or none type variable not passed as argument to find_two_letter_edits")
 
-def find_word_prob(word_string, word_total=sum(WORD_DISTRIBUTION.values())):
+def find_word_prob(word_string, word_total=None):
     '''
     Finds the relative probability of the word appearing given context of a base corpus.
-    Returns this probability value as a float instance.
+    Returns this probability value as a float instance. word_total defaults to WORD_TOTAL, the
+    total count of WORD_DISTRIBUTION.
     '''
     if word_string is None:
         return 0
     elif isinstance(word_string, str):
-        return WORD_DISTRIBUTION[word_string] / word_total
+        return WORD_DISTRIBUTION[word_string] / (word_total or WORD_TOTAL)
     else:
         raise InputError("string or none type variable not passed as argument to find_word_prob")
 
+def load_word_distribution(file_path=DISTRIBUTION_PATH):
+    '''
+    Reads a file of word counts written by write_word_distribution, returning the counts as a
+    Counter instance. On import, the module loads its WORD_DISTRIBUTION from DISTRIBUTION_PATH
+    should that file exist, and counts the words of the full corpus with count_corpus_words
+    otherwise.
+
+    Keyword argument:
+
+    - file_path: path of the file of word counts
+
+    Exceptions raised:
+
+    - InputError: occurs should file_path be non-string, or the file not hold one word and count
+      per line
+    '''
+    if not isinstance(file_path, str):
+        raise InputError("string not passed as argument for file_path")
+    with open(file_path, "r", encoding="utf-8") as distribution_file:
+        try:
+            return Counter({word: int(count) for word, count
+                            in (line.split() for line in distribution_file if line.strip())})
+        except ValueError:
+            raise InputError("file of word counts not passed as argument for file_path")
+
+def main(argument_list=None):
+    '''
+    Command line entry point, run as python -m preprocessing.spellcheck: counts the words of the
+    full corpus, prunes them with prune_word_distribution and writes them with
+    write_word_distribution, by default to DISTRIBUTION_PATH so that the module loads the pruned
+    distribution in place of the corpus from then on.
+
+    Keyword argument:
+
+    - argument_list: list of command line arguments, defaulting to sys.argv
+    '''
+    parser = argparse.ArgumentParser(prog="python -m preprocessing.spellcheck",
+                                     description="write a pruned word distribution to load")
+    parser.add_argument("--corpus", default=CORPUS_PATH, help="text file to count words of")
+    parser.add_argument("--output", default=DISTRIBUTION_PATH, help="file to write counts to")
+    parser.add_argument("--min-count", type=int, default=1, help="smallest count of a word kept")
+    parser.add_argument("--top-count", type=int, default=None, help="largest number of words kept")
+    parser.add_argument("--quantize", action="store_true", help="round counts to log-scale levels")
+    arguments = parser.parse_args(argument_list)
+    word_distribution = prune_word_distribution(count_corpus_words(arguments.corpus),
+                                                arguments.min_count, arguments.top_count,
+                                                arguments.quantize)
+    write_word_distribution(word_distribution, arguments.output)
+    print("wrote {} words to {}".format(len(word_distribution), arguments.output))
+
+@lru_cache(maxsize=CORRECTION_CACHE_SIZE)
+def memoised_correction(word_string):
+    '''
+    Returns the word with the highest relative probability amongst the candidates for
+    word_string as type str, memoising the result.
+    '''
+    return max(find_candidates(word_string), key=find_word_prob)
+
+def prune_word_distribution(word_distribution, min_count=1, top_count=None, quantize=False):
+    '''
+    Returns a copy of word_distribution as a Counter instance keeping only words counted at least
+    min_count times and, should top_count be given, only the top_count most frequent of those,
+    so that rare tokens of the corpus neither take up memory nor pass validate_words. Should
+    quantize be True, each count is rounded to a log-scale level, QUANTIZATION_STEPS to each
+    doubling, with quantize_count, and words of the same level share one int object. Counts stay
+    Python ints within the Counter, so quantizing only saves the int objects of distinct counts,
+    not the dictionary entries or words.
+
+    Pass the result to set_word_distribution to correct words with it, or to
+    write_word_distribution to have the module load it in place of the full corpus.
+
+    Keyword argument:
+
+    - word_distribution: Counter instance of word counts, such as WORD_DISTRIBUTION
+    - min_count: smallest count of a word kept
+    - top_count: largest number of words kept, defaulting to every word of min_count or more
+    - quantize: whether to round counts to log-scale levels
+
+    Exceptions raised:
+
+    - InputError: occurs should word_distribution be non-Counter, or min_count or top_count not
+      be positive integers
+    '''
+    if not isinstance(word_distribution, Counter):
+        raise InputError("Counter not passed as argument for word_distribution")
+    elif not isinstance(min_count, int) or min_count < 1:
+        raise InputError("positive integer not passed as argument for min_count")
+    elif top_count is not None and (not isinstance(top_count, int) or top_count < 1):
+        raise InputError("positive integer not passed as argument for top_count")
+    word_counts = [(word, count) for word, count in word_distribution.most_common(top_count)
+                   if count >= min_count]
+    if quantize:
+        levels = {}
+        word_counts = [(word, levels.setdefault(level, level))
+                       for word, level in ((word, quantize_count(count))
+                                           for word, count in word_counts)]
+    return Counter(dict(word_counts))
+
+def quantize_count(count):
+    '''
+    Rounds count to the nearest of 256 log-scale levels, QUANTIZATION_STEPS to each doubling,
+    returning the level as type int. The level of a count is round(log2(count) *
+    QUANTIZATION_STEPS), capped at 255, and rounds counts by at most 4.4% at eight steps.
+
+    Exceptions raised:
+
+    - InputError: occurs should count not be a positive integer
+    '''
+    if not isinstance(count, int) or count < 1:
+        raise InputError("positive integer not passed as argument for count")
+    level_byte = min(round(math.log2(count) * QUANTIZATION_STEPS), 255)
+    return max(round(2 ** (level_byte / QUANTIZATION_STEPS)), 1)
+
+def set_word_distribution(word_distribution):
+    '''
+    Replaces WORD_DISTRIBUTION, the word counts every function of the module corrects and
+    validates words with, by word_distribution, such as the output of prune_word_distribution,
+    updating WORD_TOTAL and clearing the memoised corrections. Processes started afterwards by
+    correct_spelling_batch only see the replacement on platforms which fork them.
+
+    Keyword argument:
+
+    - word_distribution: Counter instance of word counts
+
+    Exceptions raised:
+
+    - InputError: occurs should word_distribution be non-Counter
+    '''
+    global WORD_DISTRIBUTION, WORD_TOTAL
+    if not isinstance(word_distribution, Counter):
+        raise InputError("Counter not passed as argument for word_distribution")
+    WORD_DISTRIBUTION = word_distribution
+    WORD_TOTAL = sum(word_distribution.values())
+    memoised_correction.cache_clear()
+
 def validate_words(word_list):
     '''
     Checks for each edited word in word_list if that word is a valid english word.abs
@@ -114,3 +278,33 @@ def validate_words(word_list):
             return set(word for word in word_list if word in WORD_DISTRIBUTION)
     else:
         raise InputError("list variable not passed as argument to validate_words")
+
+def write_word_distribution(word_distribution, file_path=DISTRIBUTION_PATH):
+    '''
+    Writes word_distribution, such as the output of prune_word_distribution, to file_path as one
+    word and count per line, most frequent first, for load_word_distribution to read.
+
+    Keyword argument:
+
+    - word_distribution: Counter instance of word counts
+    - file_path: path of the file to write
+
+    Exceptions raised:
+
+    - InputError: occurs should word_distribution be non-Counter or file_path be non-string
+    '''
+    if not isinstance(word_distribution, Counter):
+        raise InputError("Counter not passed as argument for word_distribution")
+    elif not isinstance(file_path, str):
+        raise InputError("string not passed as argument for file_path")
+    with open(file_path, "w", encoding="utf-8") as distribution_file:
+        for word, count in word_distribution.most_common():
+            distribution_file.write("{} {}\n".format(word, count))
+
+
+set_word_distribution(load_word_distribution() if path.exists(DISTRIBUTION_PATH)
+                      else count_corpus_words())
+
+
+if __name__ == "__main__":
+    main()
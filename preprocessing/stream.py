@@ -0,0 +1,119 @@
+'''
+Chunked text pre-processing module:
+'''
+
+
+from preprocessing.errors import InputError
+import preprocessing.text as ptext
+
+
+CHUNK_SIZE = 1 << 20
+SAFE_BOUNDARY_CHARS = (" ", "\t", "\n", "\f")
+WHITESPACE_COLLAPSING_FUNCTIONS = {
+    ptext.correct_spelling,
+    ptext.keyword_tokenize,
+    ptext.normalize_characters,
+    ptext.remove_esc_chars,
+    ptext.remove_numbers,
+    ptext.remove_number_words,
+    ptext.remove_time_words,
+    ptext.remove_unbound_punct,
+    ptext.remove_urls,
+    ptext.remove_whitespace
+}
+
+
+#functions
+def preprocess_stream(text_source, function_list, output_file, chunk_size=CHUNK_SIZE):
+    '''
+    Given each function within function_list, applies the order of functions put forward onto
+    text_source chunk by chunk, writing the processed text to output_file as it goes so that
+    memory use is bounded by chunk_size rather than the size of text_source. The written text is
+    the same as preprocess_text would return for the whole of text_source. Returns the number of
+    characters written as type int.
+
+    Chunks are cut only at whitespace the built-in functions never match across; see
+    split_chunks. Functions not found in preprocessing.text are assumed to keep whitespace
+    between chunks as it is. Whitespace within HTML can fall inside a tag or script, so
+    convert_html_to_text may only lead function_list, in which case text_source is parsed with
+    iter_html_text as a whole and the text it yields is chunked for the functions which follow.
+
+    Keyword argument:
+
+    - text_source: string instance, file-like object opened in text mode, or iterator of string
+      instances such as iter_html_text
+    - function_list: list of functions available in preprocessing.text
+    - output_file: file-like object opened in text mode
+    - chunk_size: number of characters read from text_source at a time
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should text_source be neither string, readable nor an iterator,
+      function_list be non-list or hold convert_html_to_text other than first, or output_file
+      not be writable
+    '''
+    if not isinstance(function_list, list):
+        raise InputError("list of functions not passed as argument for function_list")
+    elif not hasattr(output_file, "write"):
+        raise InputError("writable file-like object not passed as argument for output_file")
+    elif ptext.convert_html_to_text in function_list[1:]:
+        raise InputError("convert_html_to_text passed other than first within function_list")
+    if function_list and function_list[0] is ptext.convert_html_to_text:
+        text_source = ptext.iter_html_text(text_source, chunk_size)
+        function_list = function_list[1:]
+    collapses_whitespace = any(func in WHITESPACE_COLLAPSING_FUNCTIONS for func in function_list)
+    written = 0
+    for chunk in split_chunks(text_source, chunk_size):
+        clean_chunk = ptext.preprocess_text(chunk, function_list)
+        if clean_chunk == "":
+            continue
+        elif collapses_whitespace and written > 0:
+            output_file.write(" ")
+            written += 1
+        output_file.write(clean_chunk)
+        written += len(clean_chunk)
+    return written
+
+def split_chunks(text_source, chunk_size=CHUNK_SIZE):
+    '''
+    Reads text_source chunk_size characters at a time, or a string at a time from an iterator,
+    yielding chunks of type str which each end just after a space, tab, newline or form feed
+    character. The remainder of a read past its last such character is carried over into the
+    next chunk, so that URLs, numbers, number words and character references are never split
+    across chunks; a chunk only grows past chunk_size while no such character has been found.
+
+    Keyword argument:
+
+    - text_source: string instance, file-like object opened in text mode, or iterator of string
+      instances such as iter_html_text
+    - chunk_size: number of characters read from text_source at a time
+
+    Exceptions raised:
+
+    - InputError: occurs should text_source be neither string, readable nor an iterator, or
+      chunk_size not be a positive integer
+    '''
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InputError("positive integer not passed as argument for chunk_size")
+    elif text_source is None:
+        return
+    elif isinstance(text_source, str):
+        blocks = (text_source[i:i + chunk_size] for i in range(0, len(text_source), chunk_size))
+    elif hasattr(text_source, "read"):
+        blocks = iter(lambda: text_source.read(chunk_size), "")
+    elif hasattr(text_source, "__next__"):
+        blocks = text_source
+    else:
+        raise InputError("string, readable file-like object or iterator not passed as argument for text_source")
+    carry = ""
+    for block in blocks:
+        block = carry + block
+        boundary = max(block.rfind(char) for char in SAFE_BOUNDARY_CHARS) + 1
+        if boundary > 0:
+            yield block[:boundary]
+            carry = block[boundary:]
+        else:
+            carry = block
+    if carry:
+        yield carry
@@ -4,29 +4,95 @@ Text pre-processing module:
 
 
 from preprocessing.errors import FunctionError, InputError
+import preprocessing.offsets as offsets
+import preprocessing.sentences as sentences
 import preprocessing.spellcheck as spellcheck
+from preprocessing.vocabulary import Vocabulary
 
+from array import array
 import html
+from html.parser import HTMLParser
 import json
 from os import path
 import re
 import string
+import threading
 
 import nltk.data
 nltk.data.path = [path.join(path.dirname(__file__), "data")]
-from nltk.corpus import stopwords
+from nltk.corpus import stopwords, wordnet
 from nltk.stem import WordNetLemmatizer
 from nltk.tokenize import RegexpTokenizer
 
 
-KEYWORD_TOKENIZER = RegexpTokenizer(r'\b[\w.\/,-]+\b|[-.,\/()]')
-LEMMATIZER = WordNetLemmatizer()
+ESC_CHAR_PATTERN = re.compile(r'\\\w')
+HTML_BLOCK_TAGS = frozenset(["address", "article", "aside", "blockquote", "br", "dd", "div", "dl",
+                             "dt", "figcaption", "figure", "footer", "form", "h1", "h2", "h3", "h4",
+                             "h5", "h6", "header", "hr", "li", "main", "nav", "ol", "p", "pre",
+                             "section", "table", "td", "th", "title", "tr", "ul"])
+HTML_CHARREF_PATTERN = re.compile(r'&(#[0-9]+;?|#[xX][0-9a-fA-F]+;?|[^\t\n\f <&#;]{1,32};?)')
+HTML_CHUNK_SIZE = 1 << 16
+HTML_SKIPPED_TAGS = frozenset(["script", "style"])
+KEYWORD_PATTERN = re.compile(r'\b[\w.\/,-]+\b|[-.,\/()]', re.UNICODE | re.MULTILINE | re.DOTALL)
+KEYWORD_TOKENIZER = RegexpTokenizer(KEYWORD_PATTERN.pattern)
+LAZY_LOAD_LOCK = threading.Lock()
+LEMMATIZER = None
 LIGATURES = json.load(open(path.join(path.dirname(__file__), "data/latin_characters.json"), "r"))
+LIGATURE_TERMS = {LIGATURES[str(i)]["ligature"]: LIGATURES[str(i)]["term"] for i in range(0, len(LIGATURES))}
+LIGATURE_PATTERN = re.compile("[" + "".join(re.escape(ligature) for ligature in LIGATURE_TERMS) + "]")
+NON_ASCII_PATTERN = re.compile(r'[^\x00-\x7f]')
+NUMBER_PATTERN = re.compile(r'\b[\d.\/,]+')
 NUMBER_WORDS = [NUMBER_WORD.replace("\n", "") for NUMBER_WORD in open(path.join(path.dirname(__file__), "data/word_numbers.txt"), "r").readlines()]
+NUMBER_WORD_PATTERN = re.compile(r'[\S]*\b(?=[' + "".join(sorted({word[0] for word in NUMBER_WORDS}))
+                               + r'])(?:' + "|".join(NUMBER_WORDS) + r')[\S]*')
 PUNCT = string.punctuation
+QUOT_PATTERN = re.compile(r'&quot;')
 STOPWORDS = stopwords.words("english")
-SENTENCE_TOKENIZER = nltk.data.load("tokenizers/punkt/english.pickle")
+STOPWORD_SET = frozenset(STOPWORDS)
+SENTENCE_ENGINES = ("punkt", "regex")
+SENTENCE_TOKENIZER = None
 TIME_WORDS = [TIME_WORD.replace("\n", "") for TIME_WORD in open(path.join(path.dirname(__file__), "data/word_time.txt"), "r").readlines()]
+TIME_WORD_PATTERN = re.compile(r'[\S]*\b(?=[' + "".join(sorted({word[0] for word in TIME_WORDS}))
+                             + r'])(?:' + "|".join(TIME_WORDS) + r')[\S]*')
+UNBOUND_PUNCT_PATTERN = re.compile(r''.join([r'[', PUNCT, r'][', PUNCT, r']+|\B[', PUNCT, r']+']))
+URL_PATTERN = re.compile(r'http\S+')
+
+
+#classes
+class _HTMLTextParser(HTMLParser):
+    '''HTMLParser collecting the text fed to it less tags, comments and script and style content'''
+
+    def __init__(self):
+        super().__init__(convert_charrefs=True)
+        self.piece_list = []
+        self.skipped_tag = None
+
+    def handle_data(self, data):
+        if self.skipped_tag is None:
+            self.piece_list.append(data)
+
+    def handle_endtag(self, tag):
+        if tag == self.skipped_tag:
+            self.skipped_tag = None
+        elif tag in HTML_BLOCK_TAGS:
+            self.piece_list.append("\n")
+
+    def handle_starttag(self, tag, attrs):
+        if tag in HTML_SKIPPED_TAGS:
+            self.skipped_tag = tag
+        elif tag in HTML_BLOCK_TAGS:
+            self.piece_list.append("\n")
+
+    def pop_text(self, final=False):
+        '''
+        returns the text collected since the last call as convert_html_entities would decode it,
+        holding back a partial "&quot;" at its end until final
+        '''
+        text_string = "".join(self.piece_list)
+        held = 0 if final else next((i for i in range(5, 0, -1)
+                                     if text_string.endswith("&quot;"[:i])), 0)
+        self.piece_list = [text_string[len(text_string) - held:]] if held else []
+        return text_string[:len(text_string) - held].replace("&quot;", "'")
 
 
 #functions
@@ -50,6 +116,32 @@ def convert_html_entities(text_string):
     else:
         raise InputError("string not passed as argument for text_string")
 
+def convert_html_to_text(text_string):
+    '''
+    Strips the tags and comments of the HTML document text_string and the content of its script
+    and style elements, converting character references as convert_html_entities does, and
+    returns the text as type str. Block-level tags such as p, div, br and li are replaced by a
+    newline so that the words either side of them stay apart; other tags are removed.
+
+    The text is parsed in a single pass with html.parser.HTMLParser without building a tree. For
+    documents too large to hold as one string, lead the function_list of preprocess_stream with
+    convert_html_to_text, which then parses the stream with iter_html_text.
+
+    Keyword argument:
+
+    - text_string: string instance
+
+    Exceptions raised:
+
+    - InputError: occurs should a non-string argument be passed
+    '''
+    if text_string is None or text_string == "":
+        return ""
+    elif isinstance(text_string, str):
+        return "".join(iter_html_text(text_string, max(len(text_string), 1)))
+    else:
+        raise InputError("string not passed as argument for text_string")
+
 def convert_ligatures(text_string):
     '''
     Coverts Latin character references within text_string to their corresponding unicode characters
@@ -97,25 +189,79 @@ def correct_spelling(text_string):
     else:
         raise InputError("none type or string not passed as an argument")
 
-def create_sentence_list(text_string):
+def create_sentence_list(text_string, engine="punkt"):
     '''
     Splits text_string into a list of sentences based on NLTK's english.pickle tokenizer, and
-    returns said list as type list of str.
+    returns said list as type list of str. The "punkt" engine runs the unpickled tokenizer, while
+    the "regex" engine runs split_sentences from preprocessing.sentences, which decides the same
+    boundaries from the tokenizer's parameters with a compiled regular expression and set lookups
+    and is faster, above all on short texts. The engines only differ where a full stop, question
+    mark or exclamation mark is followed, past any closing quotes or brackets, by a character
+    other than whitespace before the end of text_string, as in "end.)next" or "a.,b".
 
     Keyword argument:
 
     - text_string: string instance
+    - engine: "punkt" or "regex"
 
     Exceptions raised:
 
-    - InputError: occurs should a non-string argument be passed
+    - InputError: occurs should a non-string argument be passed, or engine not be found within
+      SENTENCE_ENGINES
     '''
-    if text_string is None or text_string == "":
+    if engine not in SENTENCE_ENGINES:
+        raise InputError("engine not found within SENTENCE_ENGINES passed as argument for engine")
+    elif text_string is None or text_string == "":
         return []
-    elif isinstance(text_string, str):
-        return SENTENCE_TOKENIZER.tokenize(text_string)
-    else:
+    elif not isinstance(text_string, str):
         raise InputError("non-string passed as argument for create_sentence_list")
+    elif engine == "regex":
+        return sentences.split_sentences(text_string)
+    else:
+        return (SENTENCE_TOKENIZER or load_sentence_tokenizer()).tokenize(text_string)
+
+def iter_html_text(html_source, chunk_size=HTML_CHUNK_SIZE):
+    '''
+    Feeds html_source to an incremental HTML parser chunk_size characters at a time, or a string
+    at a time from an iterator, yielding the
+    text of each chunk as convert_html_to_text would convert it as type str, so that memory use
+    is bounded by chunk_size and the longest run of text or tag rather than by the document. The
+    strings yielded join into the output of convert_html_to_text for the whole document, and
+    can be passed on as the text_source of preprocess_stream.
+
+    Keyword argument:
+
+    - html_source: string instance, file-like object opened in text mode, or iterator of string
+      instances
+    - chunk_size: number of characters fed to the parser at a time
+
+    Exceptions raised:
+
+    - InputError: occurs should html_source be neither string, readable nor an iterator, or
+      chunk_size not be a positive integer
+    '''
+    if not isinstance(chunk_size, int) or chunk_size < 1:
+        raise InputError("positive integer not passed as argument for chunk_size")
+    elif html_source is None:
+        return
+    elif isinstance(html_source, str):
+        blocks = (html_source[i:i + chunk_size] for i in range(0, len(html_source), chunk_size))
+    elif hasattr(html_source, "read"):
+        blocks = iter(lambda: html_source.read(chunk_size), "")
+    elif hasattr(html_source, "__next__"):
+        blocks = html_source
+    else:
+        raise InputError("string, readable file-like object or iterator not passed as argument for html_source")
+    parser = _HTMLTextParser()
+    for block in blocks:
+        parser.feed(block)
+        text_string = parser.pop_text()
+        if text_string:
+            yield text_string
+    parser.close()
+    text_string = parser.pop_text(True)
+    if text_string:
+        yield text_string
 
 def keyword_tokenize(text_string):
     '''
@@ -133,10 +279,70 @@ def keyword_tokenize(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        return " ".join([word for word in KEYWORD_TOKENIZER.tokenize(text_string) if word not in STOPWORDS and len(word) >= 3])
+        return " ".join([word for word in KEYWORD_TOKENIZER.tokenize(text_string) if word not in STOPWORD_SET and len(word) >= 3])
     else:
         raise InputError("string not passed as argument for text_string")
 
+def keyword_tokenize_ids(text_string, vocabulary, grow=True):
+    '''
+    Extracts keywords from text_string as keyword_tokenize does, returning the ID of each keyword
+    within vocabulary as an array('I') instance rather than joining the keywords into a string.
+    Keywords not found within vocabulary are added to it should grow be True, and skipped
+    otherwise.
+
+    Keyword argument:
+
+    - text_string: string instance
+    - vocabulary: Vocabulary instance
+    - grow: whether keywords not found within vocabulary are added to it
+
+    Exceptions raised:
+
+    - InputError: occurs should a non-string argument be passed, or vocabulary not be a Vocabulary
+    '''
+    if not isinstance(vocabulary, Vocabulary):
+        raise InputError("Vocabulary not passed as argument for vocabulary")
+    elif text_string is None or text_string == "":
+        return array("I")
+    elif isinstance(text_string, str):
+        return vocabulary.encode([word for word in KEYWORD_PATTERN.findall(text_string)
+                                  if word not in STOPWORD_SET and len(word) >= 3], grow)
+    else:
+        raise InputError("string not passed as argument for text_string")
+
+def keyword_tokenize_ids_batch(text_list, vocabulary, grow=True):
+    '''
+    Applies keyword_tokenize_ids onto each string within text_list, returning the IDs of all
+    keywords in CSR form as a tuple of (offsets, ids): ids is an array('I') instance holding every
+    string's IDs back to back, and the IDs of the i-th string are ids[offsets[i]:offsets[i + 1]],
+    offsets being an array('Q') instance of length len(text_list) + 1.
+
+    Keyword argument:
+
+    - text_list: list of string instances
+    - vocabulary: Vocabulary instance
+    - grow: whether keywords not found within vocabulary are added to it
+
+    Exceptions raised:
+
+    - InputError: occurs should text_list be non-list or contain non-string elements, or
+      vocabulary not be a Vocabulary
+    '''
+    if not isinstance(vocabulary, Vocabulary):
+        raise InputError("Vocabulary not passed as argument for vocabulary")
+    elif not isinstance(text_list, list):
+        raise InputError("list not passed as argument for text_list")
+    offsets = array("Q", [0])
+    ids = array("I")
+    for text_string in text_list:
+        if isinstance(text_string, str):
+            vocabulary.encode([word for word in KEYWORD_PATTERN.findall(text_string)
+                               if word not in STOPWORD_SET and len(word) >= 3], grow, ids)
+        elif text_string is not None:
+            raise InputError("string not passed as element of text_list")
+        offsets.append(len(ids))
+    return offsets, ids
+
 def lemmatize(text_string):
     '''
         Returns base from of text_string using NLTK's WordNetLemmatizer as type str.
@@ -152,10 +358,35 @@ def lemmatize(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        return LEMMATIZER.lemmatize(text_string)
+        return (LEMMATIZER or load_lemmatizer()).lemmatize(text_string)
     else:
         raise InputError("string not passed as primary argument")
 
+def load_lemmatizer():
+    '''
+    Loads NLTK's WordNetLemmatizer along with the WordNet corpus it reads into LEMMATIZER, should
+    it not have been loaded yet, and returns LEMMATIZER. Loading happens once under
+    LAZY_LOAD_LOCK, so that threads calling lemmatize only read LEMMATIZER once it is loaded.
+    '''
+    global LEMMATIZER
+    with LAZY_LOAD_LOCK:
+        if LEMMATIZER is None:
+            wordnet.get_version()
+            LEMMATIZER = WordNetLemmatizer()
+    return LEMMATIZER
+
+def load_sentence_tokenizer():
+    '''
+    Unpickles NLTK's english.pickle tokenizer into SENTENCE_TOKENIZER, should it not have been
+    loaded yet, and returns SENTENCE_TOKENIZER. Loading happens once under LAZY_LOAD_LOCK, so that
+    threads calling create_sentence_list only read SENTENCE_TOKENIZER once it is loaded.
+    '''
+    global SENTENCE_TOKENIZER
+    with LAZY_LOAD_LOCK:
+        if SENTENCE_TOKENIZER is None:
+            SENTENCE_TOKENIZER = nltk.data.load("tokenizers/punkt/english.pickle")
+    return SENTENCE_TOKENIZER
+
 def lowercase(text_string):
     '''
     Converts text_string into lowercase and returns the converted string as type str.
@@ -175,6 +406,37 @@ def lowercase(text_string):
     else:
         raise InputError("string not passed as argument for text_string")
 
+def normalize_characters(text_string):
+    '''
+    Applies convert_html_entities, convert_ligatures, lowercase, remove_esc_chars and
+    remove_whitespace onto text_string in that order, returning the same string as type str as
+    the chained functions would. Each conversion runs at most once over the string, ligatures are
+    converted in a single pass, and conversions the string provably needs none of (entities
+    without an "&", ligatures in ASCII text, escape characters without a backslash) are skipped.
+
+    Keyword argument:
+
+    - text_string: string instance
+
+    Exceptions raised:
+
+    - InputError: occurs should a string or NoneType not be passed as an argument
+    '''
+    if text_string is None or text_string == "":
+        return ""
+    elif isinstance(text_string, str):
+        if "&" in text_string:
+            text_string = html.unescape(text_string).replace("&quot;", "'")
+        if not _is_ascii(text_string):
+            text_string = LIGATURE_PATTERN.sub(lambda match: LIGATURE_TERMS[match.group(0)],
+                                               text_string)
+        text_string = text_string.lower()
+        if "\\" in text_string:
+            text_string = ESC_CHAR_PATTERN.sub("", text_string)
+        return " ".join(text_string.split())
+    else:
+        raise InputError("none type or string not passed as an argument")
+
 def preprocess_text(text_string, function_list):
     '''
     Given each function within function_list, applies the order of functions put forward onto
@@ -207,6 +469,48 @@ def preprocess_text(text_string, function_list):
     else:
         raise InputError("string not passed as argument for text_string")
 
+def preprocess_text_with_offsets(text_string, function_list):
+    '''
+    Given each function within function_list, applies the order of functions put forward onto
+    text_string as preprocess_text does, while each function logs the edits it makes. The edit
+    logs are composed into an OffsetMap as the functions run, returning the processed string and
+    the map from its character offsets to those of text_string as a tuple of (str, OffsetMap).
+
+    Functions not found in preprocessing.text are applied as-is and logged as replacing the whole
+    of their input string.
+
+    Keyword argument:
+
+    - function_list: list of functions available in preprocessing.text
+    - text_string: string instance
+
+    Exceptions raised:
+
+    - FunctionError: occurs should an invalid function be passed within the list of functions
+    - InputError: occurs should text_string be non-string, or function_list be non-list
+    '''
+    if text_string is None or text_string == "":
+        return "", offsets.OffsetMap()
+    elif isinstance(text_string, str):
+        if isinstance(function_list, list):
+            offset_map = offsets.OffsetMap(len(text_string))
+            for func in function_list:
+                try:
+                    if func in OFFSET_FUNCTIONS:
+                        text_string, offset_map = OFFSET_FUNCTIONS[func](text_string, offset_map)
+                    else:
+                        text_string, offset_map = offsets.apply_edits(
+                            text_string, [(0, len(text_string), func(text_string))], offset_map)
+                except (NameError, TypeError):
+                    raise FunctionError("invalid function passed as element of function_list")
+                except:
+                    raise
+            return text_string, offset_map
+        else:
+            raise InputError("list of functions not passed as argument for function_list")
+    else:
+        raise InputError("string not passed as argument for text_string")
+
 def remove_esc_chars(text_string):
     '''
     Removes any escape character within text_string and returns the new string as type str.
@@ -222,7 +526,7 @@ def remove_esc_chars(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        return " ".join(re.sub(r'\\\w', "", text_string).split())
+        return " ".join(ESC_CHAR_PATTERN.sub("", text_string).split())
     else:
         raise InputError("string not passed as argument")
 
@@ -241,7 +545,7 @@ def remove_numbers(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        return " ".join(re.sub(r'\b[\d.\/,]+', "", text_string).split())
+        return " ".join(NUMBER_PATTERN.sub("", text_string).split())
     else:
         raise InputError("string not passed as argument")
 
@@ -261,9 +565,7 @@ def remove_number_words(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        for word in NUMBER_WORDS:
-            text_string = re.sub(r'[\S]*\b'+word+r'[\S]*', "", text_string)
-        return " ".join(text_string.split())
+        return " ".join(NUMBER_WORD_PATTERN.sub("", text_string).split())
     else:
         raise InputError("string not passed as argument")
 
@@ -283,9 +585,7 @@ def remove_time_words(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        for word in TIME_WORDS:
-            text_string = re.sub(r'[\S]*\b'+word+r'[\S]*', "", text_string)
-        return " ".join(text_string.split())
+        return " ".join(TIME_WORD_PATTERN.sub("", text_string).split())
     else:
         raise InputError("string not passed as argument")
 
@@ -305,8 +605,7 @@ def remove_unbound_punct(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        return " ".join(re.sub(r''.join([r'[', PUNCT, r'][', PUNCT, r']+|\B[', PUNCT, r']+']), "",
-                               text_string).split())
+        return " ".join(UNBOUND_PUNCT_PATTERN.sub("", text_string).split())
     else:
         raise InputError("string not passed as argument")
 
@@ -325,7 +624,7 @@ def remove_urls(text_string):
     if text_string is None or text_string == "":
         return ""
     elif isinstance(text_string, str):
-        return " ".join(re.sub(r'http\S+', "", text_string).split())
+        return " ".join(URL_PATTERN.sub("", text_string).split())
     else:
         raise InputError("string not passed as argument")
 
@@ -347,3 +646,93 @@ def remove_whitespace(text_string):
         return " ".join(text_string.split())
     else:
         raise InputError("none type or string not passed as an argument")
+
+
+#offset-preserving functions
+def _collapse_whitespace_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of " ".join(text_string.split())'''
+    return offsets.apply_edits(text_string, offsets.find_whitespace_edits(text_string), offset_map)
+
+def _convert_html_entities_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of convert_html_entities'''
+    text_string, offset_map = offsets.apply_edits(text_string, offsets.find_regex_edits(
+        HTML_CHARREF_PATTERN, text_string, lambda match: html.unescape(match.group(0))), offset_map)
+    return offsets.apply_edits(text_string, offsets.find_regex_edits(QUOT_PATTERN, text_string, "'"),
+                               offset_map)
+
+def _convert_ligatures_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of convert_ligatures'''
+    return offsets.apply_edits(text_string, offsets.find_regex_edits(
+        LIGATURE_PATTERN, text_string, lambda match: LIGATURE_TERMS[match.group(0)]), offset_map)
+
+def _correct_spelling_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of correct_spelling'''
+    text_string, offset_map = _collapse_whitespace_with_offsets(text_string, offset_map)
+    return offsets.apply_edits(text_string, offsets.find_regex_edits(
+        offsets.NON_WHITESPACE, text_string, lambda match: spellcheck.correct_word(match.group(0))),
+                               offset_map)
+
+def _is_ascii(text_string):
+    '''returns whether text_string only holds ASCII characters, with str.isascii from Python 3.7'''
+    if hasattr(text_string, "isascii"):
+        return text_string.isascii()
+    return NON_ASCII_PATTERN.search(text_string) is None
+
+def _keyword_tokenize_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of keyword_tokenize'''
+    edits = []
+    position = 0
+    for match in KEYWORD_PATTERN.finditer(text_string):
+        word = match.group(0)
+        if word not in STOPWORD_SET and len(word) >= 3:
+            edits.append((position, match.start(), " " if edits else ""))
+            position = match.end()
+    if edits:
+        edits.append((position, len(text_string), ""))
+    else:
+        edits.append((0, len(text_string), ""))
+    return offsets.apply_edits(text_string, edits, offset_map)
+
+def _lowercase_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of lowercase'''
+    lowercase_string = text_string.lower()
+    if len(lowercase_string) == len(text_string):
+        return lowercase_string, offset_map
+    edit_log = []
+    for i, char in enumerate(text_string):
+        char_length = len(char.lower())
+        if char_length != 1:
+            edit_log.append((i, i + 1, char_length))
+    return lowercase_string, offset_map.compose(edit_log)
+
+def _normalize_characters_with_offsets(text_string, offset_map):
+    '''offset-preserving equivalent of normalize_characters'''
+    text_string, offset_map = _convert_html_entities_with_offsets(text_string, offset_map)
+    text_string, offset_map = _convert_ligatures_with_offsets(text_string, offset_map)
+    text_string, offset_map = _lowercase_with_offsets(text_string, offset_map)
+    return _remove_pattern_with_offsets(ESC_CHAR_PATTERN)(text_string, offset_map)
+
+def _remove_pattern_with_offsets(pattern):
+    '''returns an offset-preserving function removing pattern then collapsing whitespace'''
+    def remove_with_offsets(text_string, offset_map):
+        text_string, offset_map = offsets.apply_edits(
+            text_string, offsets.find_regex_edits(pattern, text_string), offset_map)
+        return _collapse_whitespace_with_offsets(text_string, offset_map)
+    return remove_with_offsets
+
+
+OFFSET_FUNCTIONS = {
+    convert_html_entities: _convert_html_entities_with_offsets,
+    convert_ligatures: _convert_ligatures_with_offsets,
+    correct_spelling: _correct_spelling_with_offsets,
+    keyword_tokenize: _keyword_tokenize_with_offsets,
+    lowercase: _lowercase_with_offsets,
+    normalize_characters: _normalize_characters_with_offsets,
+    remove_esc_chars: _remove_pattern_with_offsets(ESC_CHAR_PATTERN),
+    remove_numbers: _remove_pattern_with_offsets(NUMBER_PATTERN),
+    remove_number_words: _remove_pattern_with_offsets(NUMBER_WORD_PATTERN),
+    remove_time_words: _remove_pattern_with_offsets(TIME_WORD_PATTERN),
+    remove_unbound_punct: _remove_pattern_with_offsets(UNBOUND_PUNCT_PATTERN),
+    remove_urls: _remove_pattern_with_offsets(URL_PATTERN),
+    remove_whitespace: _collapse_whitespace_with_offsets
+}
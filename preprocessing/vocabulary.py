@@ -0,0 +1,122 @@
+'''
+Vocabulary module:
+'''
+
+
+from array import array
+
+from preprocessing.errors import InputError
+
+
+#classes
+class Vocabulary(object):
+    '''
+    Growable vocabulary interning words as consecutive integer IDs, starting from 0 in the order
+    words are added. Pickles as its list of words alone.
+
+    Keyword argument:
+
+    - word_list: list of words to add to the vocabulary in order
+    '''
+
+    def __init__(self, word_list=None):
+        self._ids = {}
+        self._words = []
+        if word_list is not None:
+            if not isinstance(word_list, list):
+                raise InputError("list not passed as argument for word_list")
+            for word in word_list:
+                self.add(word)
+
+    def __contains__(self, word):
+        return word in self._ids
+
+    def __eq__(self, other):
+        return isinstance(other, Vocabulary) and self._words == other._words
+
+    def __getstate__(self):
+        return self._words
+
+    def __iter__(self):
+        return iter(self._words)
+
+    def __len__(self):
+        return len(self._words)
+
+    def __repr__(self):
+        return "Vocabulary(size={})".format(len(self._words))
+
+    def __setstate__(self, state):
+        self._words = state
+        self._ids = {word: word_id for word_id, word in enumerate(state)}
+
+    def add(self, word):
+        '''
+        Adds word to the vocabulary should it not be found within it, returning the ID of word as
+        type int.
+
+        Exceptions raised:
+
+        - InputError: occurs should a non-string argument be passed
+        '''
+        word_id = self._ids.get(word)
+        if word_id is None:
+            if not isinstance(word, str):
+                raise InputError("string not passed as argument for word")
+            word_id = self._ids[word] = len(self._words)
+            self._words.append(word)
+        return word_id
+
+    def decode(self, id_list):
+        '''
+        Returns the words for each ID within id_list as type list of str.
+
+        Exceptions raised:
+
+        - InputError: occurs should an ID, negative IDs included, not be found within the
+          vocabulary
+        '''
+        word_list = []
+        try:
+            for word_id in id_list:
+                if word_id < 0:
+                    raise IndexError(word_id)
+                word_list.append(self._words[word_id])
+        except (IndexError, TypeError):
+            raise InputError("ID not found within vocabulary passed as element of id_list")
+        return word_list
+
+    def encode(self, word_list, grow=True, id_array=None):
+        '''
+        Returns the ID of each word within word_list as an array('I') instance, appending to
+        id_array should one be given. Words not found within the vocabulary are added should grow
+        be True, and skipped otherwise.
+
+        Exceptions raised:
+
+        - InputError: occurs should a non-string word be passed
+        '''
+        if id_array is None:
+            id_array = array("I")
+        if grow:
+            ids = self._ids
+            id_array.extend([ids[word] if word in ids else self.add(word) for word in word_list])
+        else:
+            id_array.extend([self._ids[word] for word in word_list if word in self._ids])
+        return id_array
+
+    def get_id(self, word):
+        '''returns the ID of word as type int, or None should it not be found within the vocabulary'''
+        return self._ids.get(word)
+
+    def get_word(self, word_id):
+        '''
+        Returns the word with ID word_id as type str.
+
+        Exceptions raised:
+
+        - InputError: occurs should word_id not be found within the vocabulary
+        '''
+        if not isinstance(word_id, int) or not 0 <= word_id < len(self._words):
+            raise InputError("ID not found within vocabulary passed as argument for word_id")
+        return self._words[word_id]
@@ -30,6 +30,7 @@ setup(name="preprocessing",
           "preprocessing": [
               "data/tokenizers/punkt/PY3/english.pickle",
               "data/tokenizers/punkt/english.pickle",
+              "data/tokenizers/punkt/english_parameters.json",
               "data/corpora/stopwords/english",
           ],
           "preprocessing.data": ["*"],
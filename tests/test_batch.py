@@ -0,0 +1,115 @@
+'''unit tests for batch module'''
+
+from os import path
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.batch as pbatch
+from preprocessing.text import (correct_spelling, lowercase, preprocess_text, remove_numbers,
+                                remove_urls)
+
+
+class TestCorrectSpellingBatchBadInput(TestCase):
+    '''tests for bad input to correct_spelling_batch'''
+
+    def test_non_list_input(self):
+        '''correct_spelling_batch should fail given non-list input'''
+        self.assertRaises(pbatch.InputError, pbatch.correct_spelling_batch, "test")
+
+    def test_non_string_element(self):
+        '''correct_spelling_batch should fail given non-string elements'''
+        self.assertRaises(pbatch.InputError, pbatch.correct_spelling_batch, [[]])
+
+    def test_invalid_process_count(self):
+        '''correct_spelling_batch should fail given a non-positive process count'''
+        self.assertRaises(pbatch.InputError, pbatch.correct_spelling_batch, ["test"], 0)
+
+
+class TestCorrectSpellingBatchGoodInput(TestCase):
+    '''tests for good input to correct_spelling_batch'''
+
+    def test_expected_outcome(self):
+        '''correct_spelling_batch should return what correct_spelling returns given known input'''
+        text_list = ["ten terts", None, "", "terts  ten"]
+        self.assertEqual(pbatch.correct_spelling_batch(text_list, 1),
+                         ["ten terms", "", "", "terms ten"])
+        self.assertEqual(pbatch.correct_spelling_batch(text_list, 2, 1),
+                         [correct_spelling(text_string) for text_string in text_list])
+
+
+class TestPreprocessBatchBadInput(TestCase):
+    '''tests for bad input to preprocess_batch'''
+
+    def test_non_list_input(self):
+        '''preprocess_batch should fail given non-list input'''
+        self.assertRaises(pbatch.InputError, pbatch.preprocess_batch, "test", [lowercase])
+        self.assertRaises(pbatch.InputError, pbatch.preprocess_batch, ["test"], lowercase)
+
+    def test_invalid_function(self):
+        '''preprocess_batch should fail given invalid function'''
+        self.assertRaises(pbatch.FunctionError, pbatch.preprocess_batch, ["test"] * 10, ["test"],
+                          4, 1)
+
+
+class TestPreprocessBatchGoodInput(TestCase):
+    '''tests for good input to preprocess_batch'''
+
+    def test_expected_outcome(self):
+        '''preprocess_batch should return what preprocess_text returns given known input'''
+        text_list = ["Test {} at http://example.com/{}".format(i, i) for i in range(100)]
+        function_list = [lowercase, remove_urls, remove_numbers]
+        expected_list = [preprocess_text(text_string, function_list) for text_string in text_list]
+        for thread_count in (1, 2, 8):
+            self.assertEqual(pbatch.preprocess_batch(text_list, function_list, thread_count, 3),
+                             expected_list)
+        self.assertEqual(pbatch.preprocess_batch([], function_list), [])
+        self.assertEqual(pbatch.preprocess_batch(iter(text_list), function_list, 4, 3),
+                         expected_list)
+
+
+class TestRunBatchBadInput(TestCase):
+    '''tests for bad input to run_batch'''
+
+    def test_invalid_function(self):
+        '''run_batch should fail given a non-callable function'''
+        self.assertRaises(pbatch.FunctionError, pbatch.run_batch, "test", [])
+
+    def test_invalid_counts(self):
+        '''run_batch should fail given non-positive thread counts or chunk sizes'''
+        self.assertRaises(pbatch.InputError, pbatch.run_batch, len, [], 0)
+        self.assertRaises(pbatch.InputError, pbatch.run_batch, len, [], 2, 0)
+
+    def test_non_iterable_input(self):
+        '''run_batch should fail given a string or non-iterable item_list'''
+        self.assertRaises(pbatch.InputError, pbatch.run_batch, len, "test")
+        self.assertRaises(pbatch.InputError, pbatch.run_batch, len, 1)
+
+    def test_failing_function(self):
+        '''run_batch should re-raise the exception of a failing function given an iterator'''
+        self.assertRaises(ZeroDivisionError, pbatch.run_batch, lambda i: 1 // (i - 25),
+                          iter(range(50)), 4, 2)
+
+
+class TestRunBatchGoodInput(TestCase):
+    '''tests for good input to run_batch'''
+
+    def test_expected_outcome(self):
+        '''run_batch should return results in order given known input'''
+        self.assertEqual(pbatch.run_batch(len, ["a" * i for i in range(50)], 4, 2),
+                         list(range(50)))
+
+    def test_iterable_input(self):
+        '''run_batch should consume a generator lazily and return results in order'''
+        pulled = []
+
+        def generate():
+            for i in range(50):
+                pulled.append(i)
+                yield "a" * i
+
+        for thread_count in (1, 4):
+            pulled.clear()
+            self.assertEqual(pbatch.run_batch(len, generate(), thread_count, 2), list(range(50)))
+            self.assertEqual(pulled, list(range(50)))
+        self.assertEqual(pbatch.run_batch(len, iter([]), 4), [])
@@ -0,0 +1,178 @@
+'''unit tests for benchmark module'''
+
+from collections import Counter
+from os import path
+import sys
+import tempfile
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.benchmark as pbenchmark
+from preprocessing.text import lowercase
+
+
+class TestBenchmarkBatchGoodInput(TestCase):
+    '''tests for good input to benchmark_batch'''
+
+    def test_expected_outcome(self):
+        '''benchmark_batch should time each thread count given known input'''
+        timings = pbenchmark.benchmark_batch(["Test"] * 10, [lowercase], (1, 2), 1)
+        self.assertEqual(sorted(timings), [1, 2])
+
+
+class TestBenchmarkNormalizeGoodInput(TestCase):
+    '''tests for good input to benchmark_normalize'''
+
+    def test_expected_outcome(self):
+        '''benchmark_normalize should time the chained and fused functions given known input'''
+        self.assertEqual(sorted(pbenchmark.benchmark_normalize(["Test"] * 10, 1)),
+                         ["chained", "fused"])
+
+
+class TestBenchmarkPruningBadInput(TestCase):
+    '''tests for bad input to benchmark_pruning'''
+
+    def test_non_list_input(self):
+        '''benchmark_pruning should fail given non-list input'''
+        self.assertRaises(pbenchmark.InputError, pbenchmark.benchmark_pruning, ("terts", "terms"))
+        self.assertRaises(pbenchmark.InputError, pbenchmark.benchmark_pruning, [], {})
+
+
+class TestBenchmarkPruningGoodInput(TestCase):
+    '''tests for good input to benchmark_pruning'''
+
+    def test_expected_outcome(self):
+        '''benchmark_pruning should report memory and accuracy for each setting'''
+        word_distribution = Counter({"terms": 9, "tests": 3, "texts": 1, "words": 5})
+        original_distribution = pbenchmark.spellcheck.WORD_DISTRIBUTION
+        report = pbenchmark.benchmark_pruning([("terts", "terms"), ("wards", "words"),
+                                               ("texst", "texts")],
+                                              [{"min_count": 2}, {"top_count": 1}],
+                                              word_distribution)
+        self.assertIs(pbenchmark.spellcheck.WORD_DISTRIBUTION, original_distribution)
+        self.assertEqual([row["words"] for row in report], [4, 3, 1])
+        self.assertEqual([row["setting"] for row in report], [{}, {"min_count": 2}, {"top_count": 1}])
+        self.assertEqual(report[0]["accuracy"], 1.0)
+        self.assertAlmostEqual(report[1]["accuracy_change"], -1 / 3)
+        self.assertGreater(report[2]["saved"], report[1]["saved"])
+
+
+class TestBenchmarkSentencesGoodInput(TestCase):
+    '''tests for good input to benchmark_sentences'''
+
+    def test_expected_outcome(self):
+        '''benchmark_sentences should time each engine given known input'''
+        self.assertEqual(sorted(pbenchmark.benchmark_sentences(["Test. Test."] * 10, 1)),
+                         ["punkt", "regex"])
+
+
+class TestMakeBenchmarkTextsGoodInput(TestCase):
+    '''tests for good input to make_benchmark_texts'''
+
+    def test_expected_outcome(self):
+        '''make_benchmark_texts should return the requested number of documents'''
+        self.assertEqual(len(pbenchmark.make_benchmark_texts(3, 2)), 3)
+        self.assertEqual(pbenchmark.make_benchmark_texts(0), [])
+        self.assertEqual(pbenchmark.make_benchmark_texts(1, 2, ["{}.", "Test."]), ["0. Test."])
+
+
+class TestMakeMisspellingPairsBadInput(TestCase):
+    '''tests for bad input to make_misspelling_pairs'''
+
+    def test_invalid_word_list(self):
+        '''make_misspelling_pairs should fail given a non-list or no usable word'''
+        self.assertRaises(pbenchmark.InputError, pbenchmark.make_misspelling_pairs, "word")
+        self.assertRaises(pbenchmark.InputError, pbenchmark.make_misspelling_pairs, ["a", "42"])
+
+
+class TestMakeMisspellingPairsGoodInput(TestCase):
+    '''tests for good input to make_misspelling_pairs'''
+
+    def test_expected_outcome(self):
+        '''make_misspelling_pairs should return the same one letter misspellings given a seed'''
+        word_list = ["terms", "tests", "an", "words"]
+        pair_list = pbenchmark.make_misspelling_pairs(word_list, 20, 1)
+        self.assertEqual(pair_list, pbenchmark.make_misspelling_pairs(word_list, 20, 1))
+        self.assertEqual(len(pair_list), 20)
+        for misspelling, word in pair_list:
+            self.assertIn(word, ("terms", "tests", "words"))
+            self.assertNotIn(misspelling, word_list)
+            self.assertIn(misspelling, pbenchmark.spellcheck.find_one_letter_edits(word))
+
+
+class TestReadMisspellingPairsBadInput(TestCase):
+    '''tests for bad input to read_misspelling_pairs'''
+
+    def test_invalid_file(self):
+        '''read_misspelling_pairs should fail given a non-string path or malformed lines'''
+        self.assertRaises(pbenchmark.InputError, pbenchmark.read_misspelling_pairs, None)
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "misspellings.txt")
+            with open(file_path, "w") as pair_file:
+                pair_file.write("terts terms\nwards\n")
+            self.assertRaises(pbenchmark.InputError, pbenchmark.read_misspelling_pairs, file_path)
+
+
+class TestReadMisspellingPairsGoodInput(TestCase):
+    '''tests for good input to read_misspelling_pairs'''
+
+    def test_expected_outcome(self):
+        '''read_misspelling_pairs should return lowercased pairs, skipping blank lines'''
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "misspellings.txt")
+            with open(file_path, "w") as pair_file:
+                pair_file.write("Terts terms\n\nwards  words\n")
+            self.assertEqual(pbenchmark.read_misspelling_pairs(file_path),
+                             [("terts", "terms"), ("wards", "words")])
+
+
+class TestSentenceAgreementBadInput(TestCase):
+    '''tests for bad input to sentence_agreement'''
+
+    def test_non_list_input(self):
+        '''sentence_agreement should fail given non-list input'''
+        self.assertRaises(pbenchmark.InputError, pbenchmark.sentence_agreement, "test")
+
+
+class TestSentenceAgreementGoodInput(TestCase):
+    '''tests for good input to sentence_agreement'''
+
+    def test_expected_outcome(self):
+        '''sentence_agreement should report full agreement on the agreement sentences'''
+        report = pbenchmark.sentence_agreement(
+            pbenchmark.make_benchmark_texts(10, 5, pbenchmark.AGREEMENT_SENTENCES))
+        self.assertEqual((report["texts"], report["agreeing"], report["rate"]), (10, 10, 1.0))
+        self.assertEqual(pbenchmark.sentence_agreement(["end.)next"])["disagreements"],
+                         ["end.)next"])
+
+
+class TestTimeBaselineBadInput(TestCase):
+    '''tests for bad input to time_baseline'''
+
+    def test_invalid_repeat(self):
+        '''time_baseline should fail given a non-positive repeat'''
+        self.assertRaises(pbenchmark.InputError, pbenchmark.time_baseline, 0)
+
+
+class TestTimeBaselineGoodInput(TestCase):
+    '''tests for good input to time_baseline'''
+
+    def test_expected_outcome(self):
+        '''time_baseline should return a positive time'''
+        self.assertGreater(pbenchmark.time_baseline(1), 0)
+
+
+class TestTimeCallBadInput(TestCase):
+    '''tests for bad input to time_call'''
+
+    def test_invalid_repeat(self):
+        '''time_call should fail given a non-positive repeat'''
+        self.assertRaises(pbenchmark.InputError, pbenchmark.time_call, list, 0)
+
+
+class TestTimeCallGoodInput(TestCase):
+    '''tests for good input to time_call'''
+
+    def test_expected_outcome(self):
+        '''time_call should return a non-negative time given known input'''
+        self.assertGreaterEqual(pbenchmark.time_call(list, 2), 0)
@@ -0,0 +1,126 @@
+'''unit tests for dedupe module'''
+
+from os import path
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+from preprocessing.batch import preprocess_batch
+import preprocessing.dedupe as pdedupe
+from preprocessing.text import lowercase, preprocess_text
+
+
+BASE_TEXT = " ".join("word{}".format(i) for i in range(100))
+HALF_TEXT = " ".join("word{}".format(i) if i < 80 else "half{}".format(i) for i in range(100))
+NEAR_TEXT = BASE_TEXT.replace("word50", "changed")
+OTHER_TEXT = " ".join("other{}".format(i) for i in range(100))
+
+
+class TestMinHashIndexBadInput(TestCase):
+    '''tests for bad input to MinHashIndex'''
+
+    def test_invalid_arguments(self):
+        '''MinHashIndex should fail given an invalid threshold, count or size'''
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex, 0)
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex, 1.5)
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex, 0.8, 0)
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex, 0.8, 16, 12, 3, -1)
+
+    def test_distant_band_threshold(self):
+        '''MinHashIndex should fail given bands and rows far from threshold'''
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex, 0.8, 16, 8)
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex, 0.5, 16, 12)
+
+    def test_non_string_input(self):
+        '''MinHashIndex should fail given non-string text'''
+        self.assertRaises(pdedupe.InputError, pdedupe.MinHashIndex().check, [])
+
+
+class TestMinHashIndexGoodInput(TestCase):
+    '''tests for good input to MinHashIndex'''
+
+    def test_expected_outcome(self):
+        '''MinHashIndex should find near duplicates and not distinct texts'''
+        index = pdedupe.MinHashIndex()
+        self.assertEqual(index.add(BASE_TEXT), 0)
+        self.assertEqual(index.find_duplicate(NEAR_TEXT), 0)
+        self.assertEqual(index.find_duplicate(OTHER_TEXT), None)
+        self.assertEqual(index.check(OTHER_TEXT, "other"), None)
+        self.assertEqual(index.check(OTHER_TEXT), "other")
+        self.assertEqual(len(index), 2)
+        self.assertEqual(index.signature(""), ())
+
+    def test_threshold(self):
+        '''MinHashIndex should derive rows from its threshold and find texts above it'''
+        index = pdedupe.MinHashIndex(0.5)
+        self.assertEqual(index.row_count, 4)
+        self.assertEqual(pdedupe.MinHashIndex().row_count, 12)
+        self.assertEqual(pdedupe.MinHashIndex(0.75, 16, 10).row_count, 10)
+        index.add(BASE_TEXT)
+        self.assertEqual(index.find_duplicate(HALF_TEXT), 0)
+        self.assertEqual(index.find_duplicate(OTHER_TEXT), None)
+        default_index = pdedupe.MinHashIndex()
+        default_index.add(BASE_TEXT)
+        self.assertEqual(default_index.find_duplicate(HALF_TEXT), None)
+
+    def test_bounded_size(self):
+        '''MinHashIndex should drop its oldest texts past max_size'''
+        index = pdedupe.MinHashIndex(max_size=1)
+        index.add(BASE_TEXT)
+        index.add(OTHER_TEXT)
+        self.assertEqual(len(index), 1)
+        self.assertFalse(0 in index)
+        self.assertEqual(index.find_duplicate(NEAR_TEXT), None)
+
+
+class TestCreateDedupeFunctionBadInput(TestCase):
+    '''tests for bad input to create_dedupe_function'''
+
+    def test_non_index_input(self):
+        '''create_dedupe_function should fail given a non-MinHashIndex index'''
+        self.assertRaises(pdedupe.InputError, pdedupe.create_dedupe_function, {})
+
+
+class TestCreateDedupeFunctionGoodInput(TestCase):
+    '''tests for good input to create_dedupe_function'''
+
+    def test_expected_outcome(self):
+        '''create_dedupe_function should return a function blanking near duplicates'''
+        function_list = [lowercase, pdedupe.create_dedupe_function()]
+        self.assertEqual(preprocess_text(BASE_TEXT, function_list), BASE_TEXT)
+        self.assertEqual(preprocess_text(NEAR_TEXT.upper(), function_list), "")
+        self.assertEqual(preprocess_text(OTHER_TEXT, function_list), OTHER_TEXT)
+
+    def test_threads(self):
+        '''the function should let one of each set of near duplicates through across threads'''
+        text_list = [" ".join("word{}x{}".format(i % 100, j) for j in range(30))
+                     for i in range(1000)]
+        switch_interval = sys.getswitchinterval()
+        sys.setswitchinterval(1e-6)
+        try:
+            bounded_index = pdedupe.MinHashIndex(max_size=5)
+            preprocess_batch(text_list, [pdedupe.create_dedupe_function(bounded_index)], 8, 1)
+            self.assertEqual(len(bounded_index), 5)
+            output_list = preprocess_batch(text_list, [pdedupe.create_dedupe_function()], 8, 1)
+        finally:
+            sys.setswitchinterval(switch_interval)
+        self.assertEqual(sorted(output for output in output_list if output),
+                         sorted(set(text_list)))
+
+
+class TestFindNearDuplicatesBadInput(TestCase):
+    '''tests for bad input to find_near_duplicates'''
+
+    def test_non_list_input(self):
+        '''find_near_duplicates should fail given non-list input'''
+        self.assertRaises(pdedupe.InputError, pdedupe.find_near_duplicates, "test")
+        self.assertRaises(pdedupe.InputError, pdedupe.find_near_duplicates, [1])
+
+
+class TestFindNearDuplicatesGoodInput(TestCase):
+    '''tests for good input to find_near_duplicates'''
+
+    def test_expected_outcome(self):
+        '''find_near_duplicates should return the positions of earlier near duplicates'''
+        self.assertEqual(pdedupe.find_near_duplicates([BASE_TEXT, OTHER_TEXT, NEAR_TEXT, None]),
+                         [None, None, 0, None])
@@ -0,0 +1,72 @@
+'''unit tests for features module'''
+
+from os import path
+import sys
+from unittest import TestCase
+from zlib import crc32
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.features as pfeatures
+from preprocessing.batch import preprocess_batch
+from preprocessing.text import keyword_tokenize, lowercase, preprocess_text
+
+
+class TestHashFeaturesBadInput(TestCase):
+    '''tests for bad input to hash_features'''
+
+    def test_non_string_input(self):
+        '''hash_features should fail given non-string input'''
+        self.assertRaises(pfeatures.InputError, pfeatures.hash_features, [])
+
+    def test_invalid_arguments(self):
+        '''hash_features should fail given invalid bucket counts or n-gram ranges'''
+        self.assertRaises(pfeatures.InputError, pfeatures.hash_features, "test", 0)
+        self.assertRaises(pfeatures.InputError, pfeatures.hash_features, "test", 8, (2, 1))
+        self.assertRaises(pfeatures.InputError, pfeatures.hash_features, "test", 8, [1, 2])
+
+
+class TestHashFeaturesGoodInput(TestCase):
+    '''tests for good input to hash_features'''
+
+    def test_expected_outcome(self):
+        '''hash_features should return expected sparse features given known input'''
+        indices, counts = pfeatures.hash_features("test string test", 1 << 20)
+        expected = sorted([(crc32(b"test") % (1 << 20), 2), (crc32(b"string") % (1 << 20), 1)])
+        self.assertEqual(list(zip(indices, counts)), expected)
+        indices, counts = pfeatures.hash_features("test string test", 1, (1, 2))
+        self.assertEqual((list(indices), list(counts)), ([0], [5]))
+        self.assertEqual([list(feature_array) for feature_array in pfeatures.hash_features(None)], [[], []])
+        self.assertEqual(preprocess_text("A TEST string test", [lowercase, keyword_tokenize,
+                                                                pfeatures.hash_features]),
+                         pfeatures.hash_features("test string test"))
+
+    def test_empty_document(self):
+        '''hash_features should leave empty documents as "" at the end of a function_list'''
+        feature_list = preprocess_batch(["hello world", ""], [keyword_tokenize,
+                                                              pfeatures.hash_features], 1)
+        self.assertEqual(feature_list[0], pfeatures.hash_features(keyword_tokenize("hello world")))
+        self.assertEqual(feature_list[1], "")
+        indptr, _, _ = pfeatures.hash_features_batch(["hello world", ""], thread_count=1)
+        self.assertGreater(indptr[1], indptr[0])
+        self.assertEqual(indptr[2], indptr[1])
+
+
+class TestHashFeaturesBatchBadInput(TestCase):
+    '''tests for bad input to hash_features_batch'''
+
+    def test_non_list_input(self):
+        '''hash_features_batch should fail given non-list input'''
+        self.assertRaises(pfeatures.InputError, pfeatures.hash_features_batch, "test")
+        self.assertRaises(pfeatures.InputError, pfeatures.hash_features_batch, [1])
+
+
+class TestHashFeaturesBatchGoodInput(TestCase):
+    '''tests for good input to hash_features_batch'''
+
+    def test_expected_outcome(self):
+        '''hash_features_batch should return expected CSR arrays given known input'''
+        indptr, indices, data = pfeatures.hash_features_batch(["test test", "", "test string"],
+                                                              1 << 20, (1, 1), 2)
+        self.assertEqual(list(indptr), [0, 1, 1, 3])
+        self.assertEqual(list(data[:1]), [2])
+        self.assertEqual(list(indices[1:]), list(pfeatures.hash_features("test string")[0]))
@@ -0,0 +1,150 @@
+'''unit tests for jobs module'''
+
+import json
+from os import listdir, path
+import sys
+from tempfile import TemporaryDirectory
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.jobs as pjobs
+from preprocessing.reader import preprocess_file
+from preprocessing.text import lowercase, remove_numbers
+
+
+RECORD_LIST = ["Record {} of THE job".format(i) for i in range(40)]
+
+
+def crash_on_record_25(text_string):
+    '''lowercases text_string, failing on the 26th record as though the worker crashed'''
+    if text_string == "Record 25 of THE job":
+        raise RuntimeError("worker crashed")
+    return text_string.lower()
+
+
+class JobTestCase(TestCase):
+    '''base test case writing two input files and a manifest listing them'''
+
+    def setUp(self):
+        self.directory = TemporaryDirectory()
+        self.file_list = []
+        for i in range(2):
+            file_path = path.join(self.directory.name, "input{}.txt".format(i))
+            with open(file_path, "w", encoding="utf-8") as text_file:
+                text_file.write("\n".join(RECORD_LIST[i * 20:(i + 1) * 20]) + "\n")
+            self.file_list.append(file_path)
+        self.manifest_path = path.join(self.directory.name, "manifest.txt")
+        with open(self.manifest_path, "w") as manifest_file:
+            manifest_file.write("input0.txt\n\ninput1.txt\n")
+        self.output_dir = path.join(self.directory.name, "output")
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def read_output(self, output_list):
+        '''returns the records written to the files of output_list in order'''
+        record_list = []
+        for output_path in output_list:
+            with open(output_path, "r", encoding="utf-8") as output_file:
+                record_list.extend(output_file.read().splitlines())
+        return record_list
+
+
+class TestPlanShardsBadInput(JobTestCase):
+    '''tests for bad input to plan_shards'''
+
+    def test_invalid_arguments(self):
+        '''plan_shards should fail given an invalid manifest or shard size'''
+        self.assertRaises(pjobs.InputError, pjobs.plan_shards, None)
+        self.assertRaises(pjobs.InputError, pjobs.plan_shards, [1])
+        self.assertRaises(pjobs.InputError, pjobs.plan_shards, self.file_list, 0)
+
+
+class TestPlanShardsGoodInput(JobTestCase):
+    '''tests for good input to plan_shards'''
+
+    def test_expected_outcome(self):
+        '''plan_shards should cover every file with the same record-aligned shards every time'''
+        shard_list = pjobs.plan_shards(self.manifest_path, 100)
+        self.assertEqual(shard_list, pjobs.plan_shards(self.file_list, 100))
+        self.assertEqual([shard[0] for shard in shard_list].count(self.file_list[1]),
+                         len(shard_list) // 2)
+        self.assertEqual(pjobs.plan_shards(self.file_list),
+                         [(file_path, 0, path.getsize(file_path)) for file_path in self.file_list])
+
+
+class TestRunJobBadInput(JobTestCase):
+    '''tests for bad input to run_job'''
+
+    def test_invalid_arguments(self):
+        '''run_job should fail given an invalid function list or worker'''
+        self.assertRaises(pjobs.InputError, pjobs.run_job, self.file_list, lowercase,
+                          self.output_dir)
+        self.assertRaises(pjobs.InputError, pjobs.run_job, self.file_list, [lowercase],
+                          self.output_dir, 2, 2)
+        self.assertRaises(pjobs.InputError, pjobs.run_job, self.file_list, [lowercase],
+                          self.output_dir, checkpoint_records=0)
+
+    def test_different_plan(self):
+        '''run_job should refuse an output directory holding a different plan'''
+        pjobs.run_job(self.file_list, [lowercase], self.output_dir, shard_size=100)
+        self.assertRaises(pjobs.InputError, pjobs.run_job, self.file_list, [lowercase],
+                          self.output_dir, shard_size=200)
+
+
+class TestRunJobGoodInput(JobTestCase):
+    '''tests for good input to run_job'''
+
+    def test_expected_outcome(self):
+        '''run_job should write each record processed, shard by shard'''
+        function_list = [lowercase, remove_numbers]
+        output_list = pjobs.run_job(self.manifest_path, function_list, self.output_dir,
+                                    shard_size=100)
+        self.assertEqual(len(output_list), len(pjobs.plan_shards(self.file_list, 100)))
+        self.assertEqual(self.read_output(output_list),
+                         [record for file_path in self.file_list
+                          for record in preprocess_file(file_path, function_list)])
+        with open(path.join(self.output_dir, pjobs.PLAN_FILE_NAME), "r") as plan_file:
+            self.assertEqual(len(json.load(plan_file)["shards"]), len(output_list))
+
+    def test_split_workers(self):
+        '''workers should split the shards between them without overlap'''
+        output_lists = [pjobs.run_job(self.file_list, [lowercase], self.output_dir, i, 3,
+                                      shard_size=100) for i in range(3)]
+        output_list = sorted(output for output_list in output_lists for output in output_list)
+        self.assertEqual(len(output_list), len(set(output_list)))
+        self.assertEqual(self.read_output(output_list),
+                         [record.lower() for record in RECORD_LIST])
+
+    def test_resumed_job(self):
+        '''a restarted worker should resume from its last checkpoint'''
+        self.assertRaises(RuntimeError, pjobs.run_job, self.file_list, [crash_on_record_25],
+                          self.output_dir, checkpoint_records=2)
+        self.assertEqual(sorted(listdir(self.output_dir)),
+                         ["shard-000000.txt", "shard-000001.txt.checkpoint",
+                          "shard-000001.txt.part", "shards.json"])
+        processed_list = []
+
+        def record_lowercase(text_string):
+            '''lowercases text_string, recording it as processed'''
+            processed_list.append(text_string)
+            return text_string.lower()
+        output_list = pjobs.run_job(self.file_list, [record_lowercase], self.output_dir,
+                                    checkpoint_records=2)
+        self.assertEqual(processed_list, RECORD_LIST[24:])
+        self.assertEqual(self.read_output(output_list),
+                         [record.lower() for record in RECORD_LIST])
+        self.assertEqual(sorted(listdir(self.output_dir)),
+                         ["shard-000000.txt", "shard-000001.txt", "shards.json"])
+
+
+class TestRunLocalJobGoodInput(JobTestCase):
+    '''tests for good input to run_local_job'''
+
+    def test_expected_outcome(self):
+        '''run_local_job should process every shard across processes, returning them in order'''
+        output_list = pjobs.run_local_job(self.manifest_path, [lowercase], self.output_dir, 2,
+                                          shard_size=100)
+        self.assertEqual(output_list, sorted(output_list))
+        self.assertEqual(self.read_output(output_list),
+                         [record.lower() for record in RECORD_LIST])
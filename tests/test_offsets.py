@@ -0,0 +1,69 @@
+'''unit tests for offsets module'''
+
+from os import path
+import re
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.offsets as poffsets
+
+
+class TestOffsetMapBadInput(TestCase):
+    '''tests for bad input to OffsetMap'''
+
+    def test_out_of_range_input(self):
+        '''OffsetMap lookups should fail given offsets outside of the processed text'''
+        offset_map = poffsets.OffsetMap(4)
+        self.assertRaises(poffsets.InputError, offset_map.original_offset, 5)
+        self.assertRaises(poffsets.InputError, offset_map.original_offset, -1)
+        self.assertRaises(poffsets.InputError, offset_map.original_span, 2, 1)
+
+
+class TestOffsetMapGoodInput(TestCase):
+    '''tests for good input to OffsetMap'''
+
+    def test_expected_outcome(self):
+        '''OffsetMap should map offsets back through composed edit logs'''
+        offset_map = poffsets.OffsetMap(10)
+        self.assertEqual(offset_map.original_offset(3), 3)
+        offset_map = offset_map.compose([(0, 2, 0), (5, 7, 1)])
+        self.assertEqual(offset_map.length, 7)
+        self.assertEqual(offset_map.original_offset(0), 2)
+        self.assertEqual(offset_map.original_span(3, 4), (5, 7))
+        self.assertEqual(offset_map.original_span(4, 7), (7, 10))
+        offset_map = offset_map.compose([(3, 4, 0)])
+        self.assertEqual(offset_map.original_span(0, 6), (2, 10))
+        self.assertEqual(poffsets.OffsetMap().original_offset(0), 0)
+
+
+class TestApplyEditsGoodInput(TestCase):
+    '''tests for good input to apply_edits'''
+
+    def test_expected_outcome(self):
+        '''apply_edits should return the edited string and composed map given known input'''
+        text_string, offset_map = poffsets.apply_edits("an example", [(0, 3, ""), (3, 5, "EX")],
+                                                       poffsets.OffsetMap(10))
+        self.assertEqual(text_string, "EXample")
+        self.assertEqual(offset_map.original_span(0, 2), (3, 5))
+        self.assertEqual(offset_map.original_span(2, 7), (5, 10))
+
+
+class TestFindRegexEditsGoodInput(TestCase):
+    '''tests for good input to find_regex_edits'''
+
+    def test_expected_outcome(self):
+        '''find_regex_edits should return the edits re.sub would make given known input'''
+        self.assertEqual(poffsets.find_regex_edits(re.compile(r'\d+'), "a 10 b 2"),
+                         [(2, 4, ""), (7, 8, "")])
+        self.assertEqual(poffsets.find_regex_edits(re.compile(r'b'), "abc", lambda m: "B"),
+                         [(1, 2, "B")])
+
+
+class TestFindWhitespaceEditsGoodInput(TestCase):
+    '''tests for good input to find_whitespace_edits'''
+
+    def test_expected_outcome(self):
+        '''find_whitespace_edits should return the edits whitespace collapsing would make'''
+        self.assertEqual(poffsets.find_whitespace_edits(" a\n\tb c "),
+                         [(0, 1, ""), (2, 4, " "), (5, 6, " "), (7, 8, "")])
@@ -0,0 +1,300 @@
+'''
+performance regression tests for preprocessing package: operation counts, such as the regular
+expression passes each function makes, run every time, while the tests timing functions in
+multiples of the baseline loop of preprocessing.benchmark only run with
+PREPROCESSING_PERFORMANCE_TESTS set, as in
+PREPROCESSING_PERFORMANCE_TESTS=1 python -m pytest tests/test_performance.py, on a machine
+otherwise idle
+'''
+
+from functools import partial
+from io import StringIO
+import os
+from os import path
+import re
+import sys
+from unittest import mock, skipUnless, TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.batch as pbatch
+import preprocessing.benchmark as pbenchmark
+import preprocessing.dedupe as pdedupe
+import preprocessing.features as pfeatures
+import preprocessing.spellcheck as pspell
+import preprocessing.stream as pstream
+import preprocessing.text as ptext
+from preprocessing.vocabulary import Vocabulary
+
+
+COST_BUDGETS = {
+    "convert_html_entities": 1.5,
+    "convert_html_to_text": 1.5,
+    "convert_ligatures": 2.5,
+    "create_sentence_list": 25.0,
+    "create_sentence_list_regex": 15.0,
+    "keyword_tokenize": 10.0,
+    "keyword_tokenize_ids": 10.0,
+    "keyword_tokenize_ids_batch": 12.0,
+    "lemmatize": 10.0,
+    "lowercase": 0.8,
+    "normalize_characters": 4.0,
+    "remove_esc_chars": 1.5,
+    "remove_numbers": 6.0,
+    "remove_number_words": 35.0,
+    "remove_time_words": 30.0,
+    "remove_unbound_punct": 7.5,
+    "remove_urls": 1.5,
+    "remove_whitespace": 1.5,
+    "correct_word": 3.0,
+    "find_candidates": 1.5,
+    "find_one_letter_edits": 10.0,
+    "find_two_letter_edits": 120.0,
+    "find_word_prob": 3.0,
+    "validate_words": 1.0,
+    "preprocess_text": 40.0,
+    "preprocess_text_with_offsets": 200.0,
+    "preprocess_batch": 55.0,
+    "preprocess_stream": 40.0,
+    "hash_features_batch": 25.0,
+    "find_near_duplicates": 120.0
+}
+DOCUMENT_SENTENCES = 1000
+PATTERN_TYPE = type(re.compile(""))
+REGEX_PASS_LIMITS = {
+    "convert_html_entities": 1,
+    "convert_html_to_text": 2,
+    "keyword_tokenize": 1,
+    "keyword_tokenize_ids": 1,
+    "normalize_characters": 2,
+    "remove_esc_chars": 1,
+    "remove_numbers": 1,
+    "remove_number_words": 1,
+    "remove_time_words": 1,
+    "remove_unbound_punct": 1,
+    "remove_urls": 1
+}
+REPEAT = 3
+SCALING_FACTOR = 4
+SCALING_LIMIT = 10.0
+SPELLING_WORDS = ("the", "quick", "brown", "fox", "jumps", "over", "lazy", "dog", "terts", "speling")
+TIMED_TESTS = bool(os.environ.get("PREPROCESSING_PERFORMANCE_TESTS"))
+TIMED_TESTS_REASON = "timed tests run only with PREPROCESSING_PERFORMANCE_TESTS set"
+TEXT_FUNCTIONS = {
+    "convert_html_entities": ptext.convert_html_entities,
+    "convert_html_to_text": ptext.convert_html_to_text,
+    "convert_ligatures": ptext.convert_ligatures,
+    "create_sentence_list": ptext.create_sentence_list,
+    "create_sentence_list_regex": partial(ptext.create_sentence_list, engine="regex"),
+    "keyword_tokenize": ptext.keyword_tokenize,
+    "keyword_tokenize_ids": lambda text_string: ptext.keyword_tokenize_ids(text_string,
+                                                                           Vocabulary()),
+    "keyword_tokenize_ids_batch": lambda text_string: ptext.keyword_tokenize_ids_batch(
+        text_string.split(". "), Vocabulary()),
+    "lowercase": ptext.lowercase,
+    "normalize_characters": ptext.normalize_characters,
+    "remove_esc_chars": ptext.remove_esc_chars,
+    "remove_numbers": ptext.remove_numbers,
+    "remove_number_words": ptext.remove_number_words,
+    "remove_time_words": ptext.remove_time_words,
+    "remove_unbound_punct": ptext.remove_unbound_punct,
+    "remove_urls": ptext.remove_urls,
+    "remove_whitespace": ptext.remove_whitespace
+}
+PIPELINE_FUNCTIONS = {
+    "preprocess_text": lambda text_string: ptext.preprocess_text(
+        text_string, pbenchmark.BENCHMARK_FUNCTIONS),
+    "preprocess_text_with_offsets": lambda text_string: ptext.preprocess_text_with_offsets(
+        text_string, pbenchmark.BENCHMARK_FUNCTIONS),
+    "preprocess_batch": lambda text_string: pbatch.preprocess_batch(
+        text_string.split(". "), pbenchmark.BENCHMARK_FUNCTIONS, 2),
+    "preprocess_stream": lambda text_string: pstream.preprocess_stream(
+        text_string, pbenchmark.BENCHMARK_FUNCTIONS, StringIO(), 1 << 12),
+    "hash_features_batch": lambda text_string: pfeatures.hash_features_batch(
+        text_string.split(". "), ngram_range=(1, 2), thread_count=2),
+    "find_near_duplicates": lambda text_string: pdedupe.find_near_duplicates(
+        text_string.split(". ")[::4])
+}
+
+
+class CountingFrozenset(frozenset):
+    '''frozenset counting the membership tests made against it'''
+
+    def __contains__(self, item):
+        self.lookups = getattr(self, "lookups", 0) + 1
+        return super().__contains__(item)
+
+
+class CountingList(list):
+    '''list counting the membership tests made against it'''
+
+    def __contains__(self, item):
+        self.lookups = getattr(self, "lookups", 0) + 1
+        return super().__contains__(item)
+
+
+def count_regex_passes(func, *args):
+    '''returns the number of calls func(*args) makes to methods of compiled regular expressions'''
+    pass_count = 0
+
+    def count_call(frame, event, arg):
+        '''counts calls to C methods bound to compiled regular expressions'''
+        nonlocal pass_count
+        if event == "c_call" and isinstance(getattr(arg, "__self__", None), PATTERN_TYPE):
+            pass_count += 1
+    sys.setprofile(count_call)
+    try:
+        func(*args)
+    finally:
+        sys.setprofile(None)
+    return pass_count
+
+def make_document(sentence_count):
+    '''returns a single document of sentence_count benchmark sentences'''
+    return pbenchmark.make_benchmark_texts(1, sentence_count)[0]
+
+def make_spelling_document(word_count):
+    '''returns a document of word_count words, a few of them misspelt'''
+    return " ".join(SPELLING_WORDS[i % len(SPELLING_WORDS)] for i in range(word_count))
+
+def measure_cost(func, *args):
+    '''
+    returns the fastest time of func(*args) in multiples of the fastest baseline loop, timing
+    both in turn so that both see the same load on the machine
+    '''
+    baseline = cost = float("inf")
+    for _ in range(REPEAT):
+        baseline = min(baseline, pbenchmark.time_baseline(1))
+        cost = min(cost, pbenchmark.time_call(lambda: func(*args), 1))
+    return cost / baseline
+
+def measure_scaling(func, document_func, size):
+    '''returns how many times longer func takes given SCALING_FACTOR times the input'''
+    small_document = document_func(size)
+    large_document = document_func(size * SCALING_FACTOR)
+    func(small_document)
+    return measure_cost(func, large_document) / measure_cost(func, small_document)
+
+
+class TestTextPerformance(TestCase):
+    '''performance tests for the functions of preprocessing.text'''
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_cost(self):
+        '''each function should process a document within its budget of baseline loops'''
+        document = make_document(DOCUMENT_SENTENCES)
+        for name, func in TEXT_FUNCTIONS.items():
+            with self.subTest(function=name):
+                func(document)
+                self.assertLess(measure_cost(func, document), COST_BUDGETS[name])
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_scaling(self):
+        '''each function should take time linear in the size of its input'''
+        for name, func in TEXT_FUNCTIONS.items():
+            with self.subTest(function=name):
+                self.assertLess(measure_scaling(func, make_document, DOCUMENT_SENTENCES // 4),
+                                SCALING_LIMIT)
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_lemmatize_cost(self):
+        '''lemmatize should process the words of a document within its budget of baseline loops'''
+        word_list = make_spelling_document(2000).split()
+
+        def lemmatize_words():
+            '''lemmatizes each word of word_list'''
+            return [ptext.lemmatize(word) for word in word_list]
+        lemmatize_words()
+        self.assertLess(measure_cost(lemmatize_words), COST_BUDGETS["lemmatize"])
+
+    def test_regex_passes(self):
+        '''functions should pass over a document a fixed number of times, not once per listed word'''
+        document = make_document(DOCUMENT_SENTENCES)
+        for name, pass_limit in REGEX_PASS_LIMITS.items():
+            with self.subTest(function=name):
+                TEXT_FUNCTIONS[name](document)
+                self.assertLessEqual(count_regex_passes(TEXT_FUNCTIONS[name], document),
+                                     pass_limit)
+
+    def test_stopword_lookups(self):
+        '''keyword functions should look stopwords up within STOPWORD_SET, not scan STOPWORDS'''
+        self.assertIsInstance(ptext.STOPWORD_SET, frozenset)
+        document = make_document(10)
+        stopword_list = CountingList(ptext.STOPWORDS)
+        stopword_set = CountingFrozenset(ptext.STOPWORD_SET)
+        with mock.patch.object(ptext, "STOPWORDS", stopword_list), \
+                mock.patch.object(ptext, "STOPWORD_SET", stopword_set):
+            for name in ("keyword_tokenize", "keyword_tokenize_ids", "keyword_tokenize_ids_batch"):
+                TEXT_FUNCTIONS[name](document)
+            ptext.preprocess_text_with_offsets(document, [ptext.keyword_tokenize])
+        self.assertEqual(getattr(stopword_list, "lookups", 0), 0)
+        self.assertGreater(getattr(stopword_set, "lookups", 0), 0)
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_correct_spelling_scaling(self):
+        '''correct_spelling should take time linear in the size of its input'''
+        def correct_spelling(text_string):
+            '''corrects text_string without corrections memoised beforehand'''
+            pspell.memoised_correction.cache_clear()
+            return ptext.correct_spelling(text_string)
+        self.assertLess(measure_scaling(correct_spelling, make_spelling_document, 2000),
+                        SCALING_LIMIT)
+
+
+class TestSpellcheckPerformance(TestCase):
+    '''performance tests for the functions of preprocessing.spellcheck'''
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_cost(self):
+        '''each function should process its words within its budget of baseline loops'''
+        word_list = list(SPELLING_WORDS) * 1000
+        cases = {
+            "correct_word": lambda: [pspell.correct_word(word) for word in word_list],
+            "find_candidates": lambda: [pspell.find_candidates("terts") for _ in range(10)],
+            "find_one_letter_edits": lambda: [pspell.find_one_letter_edits(word)
+                                              for word in word_list[:100]],
+            "find_two_letter_edits": lambda: set(pspell.find_two_letter_edits("speling")),
+            "find_word_prob": lambda: [pspell.find_word_prob(word) for word in word_list],
+            "validate_words": lambda: pspell.validate_words(word_list)
+        }
+        for name, func in cases.items():
+            with self.subTest(function=name):
+                func()
+                self.assertLess(measure_cost(func), COST_BUDGETS[name])
+
+    def test_memoised_corrections(self):
+        '''correct_word should search for the candidates of each word only once'''
+        pspell.memoised_correction.cache_clear()
+        with mock.patch.object(pspell, "find_candidates",
+                               wraps=pspell.find_candidates) as find_candidates:
+            for _ in range(10):
+                pspell.correct_word("terts")
+        self.assertEqual(find_candidates.call_count, 1)
+
+    def test_batch_corrections(self):
+        '''correct_spelling_batch should correct each unknown word once per batch'''
+        text_list = [make_spelling_document(50)] * 20
+        unknown_words = {word for word in SPELLING_WORDS if word not in pspell.WORD_DISTRIBUTION}
+        with mock.patch.object(pspell, "correct_word", wraps=pspell.correct_word) as correct_word:
+            pbatch.correct_spelling_batch(text_list, 1)
+        self.assertEqual(correct_word.call_count, len(unknown_words))
+
+
+class TestPipelinePerformance(TestCase):
+    '''performance tests for representative pipelines'''
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_cost(self):
+        '''each pipeline should process a document within its budget of baseline loops'''
+        document = make_document(DOCUMENT_SENTENCES)
+        for name, func in PIPELINE_FUNCTIONS.items():
+            with self.subTest(pipeline=name):
+                func(document)
+                self.assertLess(measure_cost(func, document), COST_BUDGETS[name])
+
+    @skipUnless(TIMED_TESTS, TIMED_TESTS_REASON)
+    def test_scaling(self):
+        '''each pipeline should take time linear in the size of its input'''
+        for name, func in PIPELINE_FUNCTIONS.items():
+            with self.subTest(pipeline=name):
+                self.assertLess(measure_scaling(func, make_document, DOCUMENT_SENTENCES // 4),
+                                SCALING_LIMIT)
@@ -0,0 +1,98 @@
+'''unit tests for plan module'''
+
+from os import path
+from collections import Counter
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.plan as pplan
+import preprocessing.spellcheck as pspell
+from preprocessing.text import (convert_html_entities, convert_ligatures, correct_spelling,
+                                lowercase, preprocess_text, remove_numbers, remove_urls,
+                                remove_whitespace)
+
+
+class TestExplainBadInput(TestCase):
+    '''tests for bad input to explain'''
+
+    def test_non_list_input(self):
+        '''explain should fail given non-list input'''
+        self.assertRaises(pplan.InputError, pplan.explain, lowercase)
+
+
+class TestExplainGoodInput(TestCase):
+    '''tests for good input to explain'''
+
+    def test_expected_outcome(self):
+        '''explain should describe the rewritten plan given known input'''
+        self.assertEqual(pplan.explain([correct_spelling, remove_urls]),
+                         "original plan: correct_spelling -> remove_urls\n"
+                         "optimized plan: correct_spelling -> remove_urls")
+        self.assertEqual(pplan.explain([correct_spelling, remove_urls], reorder=True),
+                         "original plan: correct_spelling -> remove_urls\n"
+                         "optimized plan: remove_urls -> correct_spelling\n"
+                         "- moved remove_urls ahead of correct_spelling (may change output)")
+        self.assertEqual(pplan.explain([]), "original plan: (empty)\noptimized plan: (empty)")
+
+
+class TestOptimizeFunctionListBadInput(TestCase):
+    '''tests for bad input to optimize_function_list'''
+
+    def test_non_list_input(self):
+        '''optimize_function_list should fail given non-list input'''
+        self.assertRaises(pplan.InputError, pplan.optimize_function_list, "test")
+
+    def test_non_string_input(self):
+        '''optimize_function_list should fail given non-string text'''
+        self.assertRaises(pplan.InputError, pplan.optimize_function_list, [lowercase], [])
+
+    def test_invalid_function(self):
+        '''optimize_function_list should fail given invalid function'''
+        self.assertRaises(pplan.FunctionError, pplan.optimize_function_list, ["test"])
+
+
+class TestOptimizeFunctionListGoodInput(TestCase):
+    '''tests for good input to optimize_function_list'''
+
+    def test_expected_outcome(self):
+        '''optimize_function_list should return expected plan given known input'''
+        function_list = [convert_html_entities, convert_ligatures, correct_spelling, remove_urls,
+                         remove_whitespace, remove_numbers, lowercase]
+        self.assertEqual(pplan.optimize_function_list(function_list),
+                         [convert_html_entities, convert_ligatures, correct_spelling, remove_urls,
+                          remove_numbers, lowercase])
+        self.assertEqual(pplan.optimize_function_list(function_list, reorder=True),
+                         [convert_html_entities, convert_ligatures, remove_urls, remove_numbers,
+                          correct_spelling, lowercase])
+        self.assertEqual(pplan.optimize_function_list(function_list, "ascii text", True),
+                         [remove_urls, remove_numbers, correct_spelling, lowercase])
+        self.assertEqual(pplan.optimize_function_list(function_list, "&amp; ﬁ", True),
+                         function_list[:2] + [remove_urls, remove_numbers, correct_spelling,
+                                              lowercase])
+
+    def test_same_outcome(self):
+        '''optimize_function_list should not change the processed string given known input'''
+        text_string = "Some  TEXT with http://example.com and 40 numbers"
+        function_list = [remove_whitespace, lowercase, convert_html_entities, remove_urls,
+                         remove_whitespace, convert_ligatures, remove_numbers]
+        self.assertEqual(preprocess_text(text_string, function_list),
+                         preprocess_text(text_string,
+                                         pplan.optimize_function_list(function_list, text_string)))
+
+    def test_reordered_outcome(self):
+        '''optimize_function_list should only reorder, changing punctuated text, given reorder'''
+        function_list = [correct_spelling, remove_numbers]
+        original_distribution = pspell.WORD_DISTRIBUTION
+        try:
+            pspell.set_word_distribution(Counter({"last": 10, "year": 50, "years": 60}))
+            self.assertEqual(preprocess_text("Last year.", function_list), "last years")
+            self.assertEqual(preprocess_text("Last year.",
+                                             pplan.optimize_function_list(function_list)),
+                             "last years")
+            self.assertEqual(preprocess_text("Last year.",
+                                             pplan.optimize_function_list(function_list,
+                                                                          reorder=True)),
+                             "last year")
+        finally:
+            pspell.set_word_distribution(original_distribution)
@@ -0,0 +1,132 @@
+'''unit tests for profiling module'''
+
+from functools import partial
+from io import StringIO
+from os import path
+import sys
+import tempfile
+from unittest import mock, TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+from preprocessing.batch import preprocess_batch
+import preprocessing.profiling as pprofile
+from preprocessing.text import keyword_tokenize, lowercase, preprocess_text, remove_numbers
+
+
+FUNCTION_LIST = [lowercase, remove_numbers, keyword_tokenize]
+TEXT_LIST = ["The 3 Quick Brown Foxes", "jumped 42 times over the LAZY dog"] * 5
+
+
+class TestPipelineProfilerBadInput(TestCase):
+    '''tests for bad input to PipelineProfiler'''
+
+    def test_invalid_top_count(self):
+        '''PipelineProfiler should fail given a non-positive top_count'''
+        self.assertRaises(pprofile.InputError, pprofile.PipelineProfiler, True, 0)
+
+    def test_invalid_function_list(self):
+        '''instrument should fail given a non-list or non-callable elements'''
+        profiler = pprofile.PipelineProfiler()
+        self.assertRaises(pprofile.InputError, profiler.instrument, lowercase)
+        self.assertRaises(pprofile.FunctionError, profiler.instrument, [lowercase, "lowercase"])
+
+    def test_invalid_output_file(self):
+        '''write_report and write_collapsed_stacks should fail given neither path nor file'''
+        profiler = pprofile.PipelineProfiler()
+        self.assertRaises(pprofile.InputError, profiler.write_report, 1)
+        self.assertRaises(pprofile.InputError, profiler.write_collapsed_stacks, 1)
+
+
+class TestPipelineProfilerGoodInput(TestCase):
+    '''tests for good input to PipelineProfiler'''
+
+    def test_unchanged_output(self):
+        '''instrumented functions should return what the functions they wrap return'''
+        with pprofile.PipelineProfiler() as profiler:
+            function_list = profiler.instrument(FUNCTION_LIST)
+            self.assertEqual(preprocess_batch(TEXT_LIST, function_list, 2),
+                             preprocess_batch(TEXT_LIST, FUNCTION_LIST, 2))
+            self.assertEqual(preprocess_text(TEXT_LIST[0], function_list),
+                             preprocess_text(TEXT_LIST[0], FUNCTION_LIST))
+
+    def test_stage_stats(self):
+        '''PipelineProfiler should attribute calls, time and memory to each stage'''
+        with pprofile.PipelineProfiler() as profiler:
+            preprocess_batch(TEXT_LIST, profiler.instrument(FUNCTION_LIST), 2)
+        stage_list = profiler.get_stage_stats()
+        self.assertEqual([stage["name"] for stage in stage_list],
+                         ["1:lowercase", "2:remove_numbers", "3:keyword_tokenize"])
+        for stage in stage_list:
+            self.assertEqual(stage["calls"], len(TEXT_LIST))
+            self.assertGreater(stage["seconds"], 0)
+            if pprofile.PEAK_TRACKING:
+                self.assertGreaterEqual(stage["peak_bytes"], 0)
+            else:
+                self.assertIsNone(stage["peak_bytes"])
+        self.assertIsNotNone(profiler.snapshot)
+
+    def test_without_peak_tracking(self):
+        '''PipelineProfiler should leave peaks out where tracemalloc cannot reset them'''
+        with mock.patch.object(pprofile, "PEAK_TRACKING", False):
+            with pprofile.PipelineProfiler() as profiler:
+                preprocess_text(TEXT_LIST[0], profiler.instrument([lowercase]))
+        stage = profiler.get_stage_stats()[0]
+        self.assertIsNone(stage["peak_bytes"])
+        self.assertIsNotNone(stage["net_bytes"])
+        self.assertIn("1:lowercase", profiler.report())
+
+    def test_without_memory(self):
+        '''PipelineProfiler should leave memory figures out should memory be False'''
+        with pprofile.PipelineProfiler(memory=False) as profiler:
+            preprocess_text(TEXT_LIST[0], profiler.instrument([partial(remove_numbers)]))
+        stage = profiler.get_stage_stats()[0]
+        self.assertEqual(stage["name"], "1:remove_numbers")
+        self.assertIsNone(stage["peak_bytes"])
+        self.assertIsNone(profiler.snapshot)
+
+    def test_report(self):
+        '''report should list each stage and the hotspots found within it'''
+        with pprofile.PipelineProfiler() as profiler:
+            preprocess_batch(TEXT_LIST, profiler.instrument(FUNCTION_LIST), 1)
+        report = profiler.report()
+        self.assertIn("hotspots of 2:remove_numbers:", report)
+        self.assertIn("<method 'sub' of ", report)
+        self.assertIn("largest allocations held at exit:", report)
+        output_file = StringIO()
+        profiler.write_report(output_file)
+        self.assertEqual(output_file.getvalue(), report)
+
+    def test_collapsed_stacks(self):
+        '''write_collapsed_stacks should write stacks rooted at each stage with integer weights'''
+        with pprofile.PipelineProfiler() as profiler:
+            preprocess_batch(TEXT_LIST, profiler.instrument(FUNCTION_LIST), 1)
+        output_file = StringIO()
+        profiler.write_collapsed_stacks(output_file)
+        line_list = output_file.getvalue().splitlines()
+        self.assertTrue(line_list)
+        for line in line_list:
+            stack, weight = line.rsplit(" ", 1)
+            self.assertTrue(stack.split(";")[0] in ("1:lowercase", "2:remove_numbers",
+                                                    "3:keyword_tokenize"))
+            self.assertGreater(int(weight), 0)
+        self.assertTrue(any(line.startswith("3:keyword_tokenize;keyword_tokenize (text.py:")
+                            for line in line_list))
+
+
+class TestMainGoodInput(TestCase):
+    '''tests for good input to main'''
+
+    def test_expected_outcome(self):
+        '''main should write a report and collapsed stacks for a file of records'''
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "records.txt")
+            with open(file_path, "w") as record_file:
+                record_file.write("\n".join(TEXT_LIST))
+            report_path = path.join(directory, "report.txt")
+            stack_path = path.join(directory, "stacks.txt")
+            pprofile.main([file_path, "lowercase,remove_numbers", "--threads", "1",
+                           "--report", report_path, "--collapsed", stack_path])
+            with open(report_path, "r") as report_file:
+                self.assertIn("2:remove_numbers", report_file.read())
+            with open(stack_path, "r") as stack_file:
+                self.assertTrue(stack_file.read().startswith("1:lowercase;"))
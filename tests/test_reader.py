@@ -0,0 +1,102 @@
+'''unit tests for reader module'''
+
+from os import path, remove
+import sys
+from tempfile import NamedTemporaryFile
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.reader as preader
+from preprocessing.text import lowercase, remove_numbers
+
+
+class ReaderTestCase(TestCase):
+    '''base test case writing a temporary text file of records'''
+
+    def setUp(self):
+        with NamedTemporaryFile("w", encoding="utf-8", suffix=".txt", delete=False) as text_file:
+            text_file.write("First Record 1\nséCOND record\n\nthird record 3\n")
+        self.file_path = text_file.name
+
+    def tearDown(self):
+        remove(self.file_path)
+
+
+class TestFindRecordOffsetsBadInput(ReaderTestCase):
+    '''tests for bad input to find_record_offsets'''
+
+    def test_invalid_part_count(self):
+        '''find_record_offsets should fail given a non-positive part count'''
+        self.assertRaises(preader.InputError, preader.find_record_offsets, self.file_path, 0)
+
+    def test_non_string_input(self):
+        '''find_record_offsets should fail given non-string input'''
+        self.assertRaises(preader.InputError, preader.find_record_offsets, None, 2)
+
+
+class TestFindRecordOffsetsGoodInput(ReaderTestCase):
+    '''tests for good input to find_record_offsets'''
+
+    def test_expected_outcome(self):
+        '''find_record_offsets should return record-aligned ranges given known input'''
+        self.assertEqual(preader.find_record_offsets(self.file_path, 1), [(0, 46)])
+        self.assertEqual(preader.find_record_offsets(self.file_path, 2), [(0, 30), (30, 46)])
+        records = [record for start, end in preader.find_record_offsets(self.file_path, 5)
+                   for record in preader.read_records(self.file_path, start=start, end=end)]
+        self.assertEqual(records, list(preader.read_records(self.file_path)))
+
+
+class TestPreprocessFileBadInput(ReaderTestCase):
+    '''tests for bad input to preprocess_file'''
+
+    def test_non_list_input(self):
+        '''preprocess_file should fail given non-list input'''
+        self.assertRaises(preader.InputError, list,
+                          preader.preprocess_file(self.file_path, lowercase))
+
+
+class TestPreprocessFileGoodInput(ReaderTestCase):
+    '''tests for good input to preprocess_file'''
+
+    def test_expected_outcome(self):
+        '''preprocess_file should return processed records given known input'''
+        self.assertEqual(list(preader.preprocess_file(self.file_path, [lowercase, remove_numbers])),
+                         ["first record", "sécond record", "", "third record"])
+
+
+class TestReadRecordsBadInput(ReaderTestCase):
+    '''tests for bad input to read_records'''
+
+    def test_empty_delimiter(self):
+        '''read_records should fail given an empty delimiter'''
+        self.assertRaises(preader.InputError, list, preader.read_records(self.file_path, ""))
+
+    def test_invalid_range(self):
+        '''read_records should fail given an invalid byte range'''
+        self.assertRaises(preader.InputError, list,
+                          preader.read_records(self.file_path, start=10, end=5))
+
+
+class TestReadRecordsGoodInput(ReaderTestCase):
+    '''tests for good input to read_records'''
+
+    def test_expected_outcome(self):
+        '''read_records should return expected records given known input'''
+        self.assertEqual(list(preader.read_records(self.file_path)),
+                         ["First Record 1", "séCOND record", "", "third record 3"])
+        self.assertEqual(list(preader.read_records(self.file_path, "\n\n")),
+                         ["First Record 1\nséCOND record", "third record 3\n"])
+        self.assertEqual(list(preader.read_records(self.file_path, start=15, end=16)),
+                         ["séCOND record"])
+
+
+class TestReadRecordsWithOffsetsGoodInput(ReaderTestCase):
+    '''tests for good input to read_records_with_offsets'''
+
+    def test_expected_outcome(self):
+        '''read_records_with_offsets should return each record with the offset following it'''
+        self.assertEqual(list(preader.read_records_with_offsets(self.file_path)),
+                         [("First Record 1", 15), ("séCOND record", 30), ("", 31),
+                          ("third record 3", 46)])
+        self.assertEqual(list(preader.read_records_with_offsets(self.file_path, start=30)),
+                         [("", 31), ("third record 3", 46)])
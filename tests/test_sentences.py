@@ -0,0 +1,71 @@
+'''unit tests for sentences module'''
+
+import json
+from os import path
+import sys
+import tempfile
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.sentences as psentences
+from preprocessing.text import load_sentence_tokenizer
+
+
+class TestExtractPunktParametersGoodInput(TestCase):
+    '''tests for good input to extract_punkt_parameters'''
+
+    def test_expected_outcome(self):
+        '''extract_punkt_parameters should write the bundled parameters given english.pickle'''
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "parameters.json")
+            psentences.extract_punkt_parameters(load_sentence_tokenizer(), file_path)
+            with open(file_path, "r") as parameter_file, \
+                    open(psentences.PARAMETERS_PATH, "r") as bundled_file:
+                self.assertEqual(json.load(parameter_file), json.load(bundled_file))
+
+
+class TestLoadSentenceParametersGoodInput(TestCase):
+    '''tests for good input to load_sentence_parameters'''
+
+    def test_expected_outcome(self):
+        '''load_sentence_parameters should return frozensets of the bundled parameters'''
+        parameters = psentences.load_sentence_parameters()
+        self.assertIs(parameters, psentences.SENTENCE_PARAMETERS)
+        self.assertIn("dr", parameters["abbreviations"])
+        self.assertTrue(all(isinstance(value, frozenset) for value in parameters.values()))
+
+
+class TestSplitSentencesBadInput(TestCase):
+    '''tests for bad input to split_sentences'''
+
+    def test_non_string_input(self):
+        '''split_sentences should fail given non-string input'''
+        self.assertRaises(psentences.InputError, psentences.split_sentences, [])
+
+
+class TestSplitSentencesGoodInput(TestCase):
+    '''tests for good input to split_sentences'''
+
+    def test_expected_outcome(self):
+        '''split_sentences should provide expected sentence list given known input'''
+        self.assertEqual(psentences.split_sentences("test sentence. another test sentence. 10.0 "
+                                                    "test sentences."),
+                         ['test sentence.', 'another test sentence.', '10.0 test sentences.'])
+        self.assertEqual(psentences.split_sentences("Dr. Smith arrived at 3 p.m. (Late.) "
+                                                    "\"Why?\" he asked... Then he left!!"),
+                         ['Dr. Smith arrived at 3 p.m.', '(Late.)', '"Why?"',
+                          'he asked... Then he left!', '!'])
+        self.assertEqual(psentences.split_sentences(None), [])
+
+    def test_punkt_agreement(self):
+        '''split_sentences should split punctuation runs and closing quotes as punkt does'''
+        tokenizer = load_sentence_tokenizer()
+        for text_string in ["Really...?", "Really...? Yes.", "Hi!?", "x ?!?!", "!!!",
+                            "He left. \" She stayed.", "The end. ' Next one.",
+                            "The end. ) Next one.", "He left.  \"  She", "a. \" \" b",
+                            "a. \" x. \" y", "a. \"", "end.\") Next", "a. \"b\" c"]:
+            with self.subTest(text_string=text_string):
+                self.assertEqual(psentences.split_sentences(text_string),
+                                 tokenizer.tokenize(text_string))
+        self.assertEqual(psentences.split_sentences("He left. \" She stayed."),
+                         ['He left. "', 'She stayed.'])
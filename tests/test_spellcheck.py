@@ -1,7 +1,9 @@
 '''unit tests for spellcheck module'''
 
+from collections import Counter
 from os import path
 import sys
+import tempfile
 from unittest import TestCase
 
 sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
@@ -25,6 +27,27 @@ class TestCorrectWordGoodInput(TestCase):
         self.assertEqual(pspell.correct_word(None), "")
 
 
+class TestCountCorpusWordsBadInput(TestCase):
+    '''tests for bad input to count_corpus_words'''
+
+    def test_non_string_input(self):
+        '''count_corpus_words should fail given a non-string path'''
+        self.assertRaises(pspell.InputError, pspell.count_corpus_words, None)
+
+
+class TestCountCorpusWordsGoodInput(TestCase):
+    '''tests for good input to count_corpus_words'''
+
+    def test_expected_outcome(self):
+        '''count_corpus_words should count the lowercased words of a file'''
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "corpus.txt")
+            with open(file_path, "w") as corpus_file:
+                corpus_file.write("The terms, the TESTS\nand the tests.")
+            self.assertEqual(pspell.count_corpus_words(file_path),
+                             Counter({"the": 3, "tests": 2, "terms": 1, "and": 1}))
+
+
 class TestFindCandidatesBadInput(TestCase):
     '''tests for bad input to find_candidates'''
 
@@ -106,6 +129,123 @@ class TestFindWordProbGoodInput(TestCase):
         self.assertEqual(pspell.find_word_prob("reliable"), 1.7927813658304835e-05)
 
 
+class TestLoadWordDistributionBadInput(TestCase):
+    '''tests for bad input to load_word_distribution'''
+
+    def test_invalid_file(self):
+        '''load_word_distribution should fail given a non-string path or a file of other text'''
+        self.assertRaises(pspell.InputError, pspell.load_word_distribution, None)
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "corpus.txt")
+            with open(file_path, "w") as corpus_file:
+                corpus_file.write("some running text\n")
+            self.assertRaises(pspell.InputError, pspell.load_word_distribution, file_path)
+
+
+class TestMainGoodInput(TestCase):
+    '''tests for good input to main'''
+
+    def test_expected_outcome(self):
+        '''main should write a pruned distribution of a corpus which loads back'''
+        with tempfile.TemporaryDirectory() as directory:
+            corpus_path = path.join(directory, "corpus.txt")
+            with open(corpus_path, "w") as corpus_file:
+                corpus_file.write("the " * 1000 + "terms " * 3 + "tests " * 2 + "teres")
+            output_path = path.join(directory, "distribution.txt")
+            pspell.main(["--corpus", corpus_path, "--output", output_path, "--min-count", "2",
+                         "--quantize"])
+            self.assertEqual(pspell.load_word_distribution(output_path),
+                             Counter({"the": pspell.quantize_count(1000), "terms": 3, "tests": 2}))
+
+
+class TestMemoisedCorrectionGoodInput(TestCase):
+    '''tests for good input to memoised_correction'''
+
+    def test_expected_outcome(self):
+        '''memoised_correction should memoise corrections given known input'''
+        pspell.memoised_correction.cache_clear()
+        self.assertEqual(pspell.memoised_correction("terts"), "terms")
+        self.assertEqual(pspell.memoised_correction("terts"), "terms")
+        self.assertEqual(pspell.memoised_correction.cache_info().hits, 1)
+
+
+class TestPruneWordDistributionBadInput(TestCase):
+    '''tests for bad input to prune_word_distribution'''
+
+    def test_invalid_arguments(self):
+        '''prune_word_distribution should fail given a non-Counter or non-positive sizes'''
+        word_distribution = Counter({"terms": 3})
+        self.assertRaises(pspell.InputError, pspell.prune_word_distribution, {"terms": 3})
+        self.assertRaises(pspell.InputError, pspell.prune_word_distribution, word_distribution, 0)
+        self.assertRaises(pspell.InputError, pspell.prune_word_distribution, word_distribution, 1, 0)
+
+
+class TestPruneWordDistributionGoodInput(TestCase):
+    '''tests for good input to prune_word_distribution'''
+
+    def test_expected_outcome(self):
+        '''prune_word_distribution should keep frequent words and quantize their counts'''
+        word_distribution = Counter({"the": 1000, "of": 700, "terms": 300, "tests": 2, "xqz": 1})
+        self.assertEqual(pspell.prune_word_distribution(word_distribution, 2),
+                         Counter({"the": 1000, "of": 700, "terms": 300, "tests": 2}))
+        self.assertEqual(pspell.prune_word_distribution(word_distribution, top_count=2),
+                         Counter({"the": 1000, "of": 700}))
+        self.assertEqual(pspell.prune_word_distribution(word_distribution, 2, 1), Counter({"the": 1000}))
+        quantized_distribution = pspell.prune_word_distribution(Counter({"a": 1000, "b": 1001}),
+                                                                quantize=True)
+        self.assertEqual(quantized_distribution, Counter({"a": 1024, "b": 1024}))
+        self.assertIs(quantized_distribution["a"], quantized_distribution["b"])
+        self.assertEqual(word_distribution["xqz"], 1)
+
+
+class TestQuantizeCountBadInput(TestCase):
+    '''tests for bad input to quantize_count'''
+
+    def test_non_positive_input(self):
+        '''quantize_count should fail given a non-positive count'''
+        self.assertRaises(pspell.InputError, pspell.quantize_count, 0)
+        self.assertRaises(pspell.InputError, pspell.quantize_count, 1.5)
+
+
+class TestQuantizeCountGoodInput(TestCase):
+    '''tests for good input to quantize_count'''
+
+    def test_expected_outcome(self):
+        '''quantize_count should round counts to within 4.4% on 256 levels'''
+        self.assertEqual(pspell.quantize_count(1), 1)
+        self.assertEqual(pspell.quantize_count(100), 99)
+        self.assertEqual(pspell.quantize_count(1 << 40), pspell.quantize_count(1 << 50))
+        self.assertLessEqual(len({pspell.quantize_count(count) for count in range(1, 1 << 16)}), 129)
+        for count in range(1, 1 << 16, 997):
+            self.assertLessEqual(abs(pspell.quantize_count(count) - count), 0.044 * count + 0.5)
+
+
+class TestSetWordDistributionBadInput(TestCase):
+    '''tests for bad input to set_word_distribution'''
+
+    def test_non_counter_input(self):
+        '''set_word_distribution should fail given a non-Counter'''
+        self.assertRaises(pspell.InputError, pspell.set_word_distribution, {"terms": 3})
+
+
+class TestSetWordDistributionGoodInput(TestCase):
+    '''tests for good input to set_word_distribution'''
+
+    def test_expected_outcome(self):
+        '''set_word_distribution should replace the words corrected and validated against'''
+        original_distribution = pspell.WORD_DISTRIBUTION
+        try:
+            pspell.correct_word("terts")
+            pspell.set_word_distribution(Counter({"tests": 3, "test": 1}))
+            self.assertEqual(pspell.WORD_TOTAL, 4)
+            self.assertEqual(pspell.find_word_prob("tests"), 0.75)
+            self.assertEqual(pspell.correct_word("terts"), "tests")
+            self.assertEqual(pspell.validate_words(["test", "terms"]), {"test"})
+        finally:
+            pspell.set_word_distribution(original_distribution)
+        self.assertEqual(pspell.WORD_TOTAL, sum(original_distribution.values()))
+
+
 class TestValidateWordsBadInput(TestCase):
     '''tests for bad input to validate_words'''
     
@@ -122,3 +262,26 @@ class TestValidateWordsGoodInput(TestCase):
         self.assertEqual(pspell.validate_words(None), {})
         self.assertEqual(pspell.validate_words([]), {})
         
+
+
+class TestWriteWordDistributionBadInput(TestCase):
+    '''tests for bad input to write_word_distribution'''
+
+    def test_invalid_arguments(self):
+        '''write_word_distribution should fail given a non-Counter or non-string path'''
+        self.assertRaises(pspell.InputError, pspell.write_word_distribution, {"terms": 3})
+        self.assertRaises(pspell.InputError, pspell.write_word_distribution, Counter(), None)
+
+
+class TestWriteWordDistributionGoodInput(TestCase):
+    '''tests for good input to write_word_distribution'''
+
+    def test_expected_outcome(self):
+        '''write_word_distribution should write counts most frequent first, loading back the same'''
+        word_distribution = Counter({"terms": 3, "the": 1000, "tests": 2})
+        with tempfile.TemporaryDirectory() as directory:
+            file_path = path.join(directory, "distribution.txt")
+            pspell.write_word_distribution(word_distribution, file_path)
+            with open(file_path, "r", encoding="utf-8") as distribution_file:
+                self.assertEqual(distribution_file.read(), "the 1000\nterms 3\ntests 2\n")
+            self.assertEqual(pspell.load_word_distribution(file_path), word_distribution)
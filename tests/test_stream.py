@@ -0,0 +1,107 @@
+'''unit tests for stream module'''
+
+from io import StringIO
+from os import path
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+from preprocessing.errors import FunctionError
+import preprocessing.stream as pstream
+from preprocessing.text import (convert_html_entities, convert_html_to_text, iter_html_text,
+                                keyword_tokenize, lowercase, preprocess_text, remove_numbers,
+                                remove_urls)
+
+
+class TestPreprocessStreamBadInput(TestCase):
+    '''tests for bad input to preprocess_stream'''
+
+    def test_non_string_input(self):
+        '''preprocess_stream should fail given non-string, non-readable input'''
+        self.assertRaises(pstream.InputError, pstream.preprocess_stream, [], [], StringIO())
+
+    def test_non_list_input(self):
+        '''preprocess_stream should fail given non-list input'''
+        self.assertRaises(pstream.InputError, pstream.preprocess_stream, "test", "test", StringIO())
+
+    def test_non_writable_output(self):
+        '''preprocess_stream should fail given non-writable output'''
+        self.assertRaises(pstream.InputError, pstream.preprocess_stream, "test", [], "test")
+
+    def test_misplaced_html_function(self):
+        '''preprocess_stream should fail given convert_html_to_text other than first'''
+        self.assertRaises(pstream.InputError, pstream.preprocess_stream, "<p>test</p>",
+                          [lowercase, convert_html_to_text], StringIO())
+
+    def test_invalid_function(self):
+        '''preprocess_stream should fail given invalid function'''
+        self.assertRaises(FunctionError, pstream.preprocess_stream, "test", ["test"],
+                          StringIO())
+
+
+class TestPreprocessStreamGoodInput(TestCase):
+    '''tests for good input to preprocess_stream'''
+
+    def test_expected_outcome(self):
+        '''preprocess_stream should write what preprocess_text returns given known input'''
+        text_string = ("Some TEXT with http://example.com/a/long/url &amp; 40 numbers\n"
+                       "  and   Irregular\twhitespace http://example.com ")
+        for function_list in ([lowercase], [remove_urls, remove_numbers, lowercase],
+                              [convert_html_entities, keyword_tokenize]):
+            for chunk_size in (1, 8, 1000):
+                output_file = StringIO()
+                written = pstream.preprocess_stream(StringIO(text_string), function_list,
+                                                    output_file, chunk_size)
+                self.assertEqual(output_file.getvalue(),
+                                 preprocess_text(text_string, function_list))
+                self.assertEqual(written, len(output_file.getvalue()))
+
+    def test_html_function(self):
+        '''preprocess_stream should parse HTML whole given convert_html_to_text first'''
+        html_string = ('<p>Hello world</p><script type="text/javascript">var secret = 1; '
+                       'alert(secret);</script><a href="x y">link text</a>'
+                       '<style>p { color: red; }</style><div class="a b">Last &amp; words</div>')
+        for function_list in ([convert_html_to_text], [convert_html_to_text, lowercase],
+                              [convert_html_to_text, keyword_tokenize]):
+            for chunk_size in (1, 4, 16, 1000):
+                output_file = StringIO()
+                pstream.preprocess_stream(html_string, function_list, output_file, chunk_size)
+                self.assertEqual(output_file.getvalue(),
+                                 preprocess_text(html_string, function_list))
+                self.assertNotIn("secret", output_file.getvalue())
+                output_file = StringIO()
+                pstream.preprocess_stream(StringIO(html_string), function_list, output_file,
+                                          chunk_size)
+                self.assertEqual(output_file.getvalue(),
+                                 preprocess_text(html_string, function_list))
+
+    def test_html_source(self):
+        '''preprocess_stream should process the text iter_html_text yields from HTML'''
+        html_string = "<p>Some <b>TEXT</b> &amp; 40 numbers</p><script>var x;</script>" * 50
+        function_list = [lowercase, keyword_tokenize]
+        output_file = StringIO()
+        pstream.preprocess_stream(iter_html_text(StringIO(html_string), 64), function_list,
+                                  output_file, 128)
+        self.assertEqual(output_file.getvalue(),
+                         preprocess_text(convert_html_to_text(html_string), function_list))
+
+
+class TestSplitChunksBadInput(TestCase):
+    '''tests for bad input to split_chunks'''
+
+    def test_invalid_chunk_size(self):
+        '''split_chunks should fail given a non-positive chunk size'''
+        self.assertRaises(pstream.InputError, list, pstream.split_chunks("test", 0))
+
+
+class TestSplitChunksGoodInput(TestCase):
+    '''tests for good input to split_chunks'''
+
+    def test_expected_outcome(self):
+        '''split_chunks should only cut at safe whitespace given known input'''
+        self.assertEqual(list(pstream.split_chunks("ab cd http://x.com ef", 4)),
+                         ["ab ", "cd ", "http://x.com ", "ef"])
+        self.assertEqual(list(pstream.split_chunks(None)), [])
+        self.assertEqual(list(pstream.split_chunks(StringIO("a\nb"), 2)), ["a\n", "b"])
+        self.assertEqual(list(pstream.split_chunks(iter(["ab c", "d", " ef"]))),
+                         ["ab ", "cd ", "ef"])
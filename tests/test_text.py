@@ -1,13 +1,15 @@
 '''unit tests for text module'''
 
+from io import StringIO
 from os import path
 import sys
 from unittest import TestCase
 
 sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
 import preprocessing.text as ptext
-from preprocessing.text import (lowercase, remove_esc_chars, remove_unbound_punct,
-                                remove_numbers)
+from preprocessing.text import (convert_html_entities, convert_ligatures, lowercase,
+                                remove_esc_chars, remove_unbound_punct, remove_numbers,
+                                remove_urls)
 
 
 class TestConvertHTMLEntitiesBadInput(TestCase):
@@ -29,6 +31,34 @@ class TestConvertHTMLEntitiesGoodInput(TestCase):
         self.assertEqual(ptext.convert_html_entities('&quot;'), '"')
 
 
+class TestConvertHTMLToTextBadInput(TestCase):
+    '''tests for bad input to convert_html_to_text'''
+
+    def test_non_string_input(self):
+        '''convert_html_to_text should fail given non-string input'''
+        self.assertRaises(ptext.InputError, ptext.convert_html_to_text, [])
+
+
+class TestConvertHTMLToTextGoodInput(TestCase):
+    '''tests for good input to convert_html_to_text'''
+
+    def test_expected_outcome(self):
+        '''convert_html_to_text should return expected output given known input'''
+        self.assertEqual(ptext.convert_html_to_text(""), "")
+        self.assertEqual(ptext.convert_html_to_text(None), "")
+        self.assertEqual(ptext.convert_html_to_text("plain &amp; simple"), "plain & simple")
+        self.assertEqual(ptext.convert_html_to_text(
+            '<html><head><style>p {color: red}</style><script>var p = "<p>";</script></head>'
+            '<body><!-- comment --><p>Caf&eacute; <b>bo</b>ld</p>next<br>line</body></html>'),
+                         "\nCafé bold\nnext\nline")
+
+    def test_entity_decoding(self):
+        '''convert_html_to_text should decode text as convert_html_entities does'''
+        text_string = "&quot;a&quot; &amp;quot; &#169; &#x263a; &notit; & &lt;b&gt;"
+        self.assertEqual(ptext.convert_html_to_text(text_string),
+                         convert_html_entities(text_string))
+
+
 class TestConvertLigaturesBadInput(TestCase):
     '''tests for bad input to convert_ligatures'''
 
@@ -74,6 +104,10 @@ class TestCreateSentenceListBadInput(TestCase):
         '''create_sentence_list should fail given non-string input'''
         self.assertRaises(ptext.InputError, ptext.create_sentence_list, [])
 
+    def test_invalid_engine(self):
+        '''create_sentence_list should fail given an unknown engine'''
+        self.assertRaises(ptext.InputError, ptext.create_sentence_list, "test.", "unknown")
+
 
 class TestCreateSentenceListGoodInput(TestCase):
     '''tests for good input to create_sentence_list'''
@@ -84,6 +118,39 @@ class TestCreateSentenceListGoodInput(TestCase):
                                                     "test sentences."),
                          ['test sentence.', 'another test sentence.', '10.0 test sentences.'])
 
+    def test_regex_engine(self):
+        '''create_sentence_list should split as punkt does with the regex engine'''
+        text_string = "Mr. Smith left at 3 p.m. on Jan. 5. \"Why?\" he asked. J. S. Bach agreed!!"
+        self.assertEqual(ptext.create_sentence_list(text_string, "regex"),
+                         ptext.create_sentence_list(text_string))
+        self.assertEqual(ptext.create_sentence_list(None, "regex"), [])
+
+
+class TestIterHTMLTextBadInput(TestCase):
+    '''tests for bad input to iter_html_text'''
+
+    def test_invalid_arguments(self):
+        '''iter_html_text should fail given non-readable input or a non-positive chunk size'''
+        self.assertRaises(ptext.InputError, list, ptext.iter_html_text([]))
+        self.assertRaises(ptext.InputError, list, ptext.iter_html_text("<p>", 0))
+
+
+class TestIterHTMLTextGoodInput(TestCase):
+    '''tests for good input to iter_html_text'''
+
+    def test_expected_outcome(self):
+        '''iter_html_text should yield the text of convert_html_to_text for any chunk size'''
+        html_string = ('<title>T &amp; U</title><script>if (a < b) {}</script>'
+                       '<p>&quot;x&quot; &amp;quot; <i>y</i></p>&')
+        text_string = ptext.convert_html_to_text(html_string)
+        self.assertEqual(text_string, "\nT & U\n\n\"x\" ' y\n&")
+        for chunk_size in range(1, len(html_string) + 1):
+            self.assertEqual("".join(ptext.iter_html_text(html_string, chunk_size)), text_string)
+        self.assertEqual("".join(ptext.iter_html_text(StringIO(html_string), 5)), text_string)
+        self.assertEqual("".join(ptext.iter_html_text(iter([html_string[:9], html_string[9:]]))),
+                         text_string)
+        self.assertEqual(list(ptext.iter_html_text(None)), [])
+
 
 class TestKeywordTokenizeBadInput(TestCase):
     '''tests for bad input to keyword_tokenize'''
@@ -103,6 +170,55 @@ class TestKeywordTokenizeGoodInput(TestCase):
         self.assertEqual(ptext.keyword_tokenize("a test string"), "test string")
 
 
+class TestKeywordTokenizeIdsBadInput(TestCase):
+    '''tests for bad input to keyword_tokenize_ids'''
+
+    def test_non_string_input(self):
+        '''keyword_tokenize_ids should fail given non-string input'''
+        self.assertRaises(ptext.InputError, ptext.keyword_tokenize_ids, [], ptext.Vocabulary())
+
+    def test_non_vocabulary_input(self):
+        '''keyword_tokenize_ids should fail given a non-Vocabulary vocabulary'''
+        self.assertRaises(ptext.InputError, ptext.keyword_tokenize_ids, "test", {})
+
+
+class TestKeywordTokenizeIdsGoodInput(TestCase):
+    '''tests for good input to keyword_tokenize_ids'''
+
+    def test_expected_outcome(self):
+        '''keyword_tokenize_ids should return expected IDs given known input'''
+        vocabulary = ptext.Vocabulary()
+        self.assertEqual(list(ptext.keyword_tokenize_ids("a test string test", vocabulary)),
+                         [0, 1, 0])
+        self.assertEqual(list(ptext.keyword_tokenize_ids("a new test", vocabulary, False)), [0])
+        self.assertEqual(list(ptext.keyword_tokenize_ids(None, vocabulary)), [])
+        self.assertEqual(vocabulary.decode(ptext.keyword_tokenize_ids("another test string",
+                                                                      vocabulary)),
+                         ptext.keyword_tokenize("another test string").split())
+
+
+class TestKeywordTokenizeIdsBatchBadInput(TestCase):
+    '''tests for bad input to keyword_tokenize_ids_batch'''
+
+    def test_non_list_input(self):
+        '''keyword_tokenize_ids_batch should fail given non-list input'''
+        self.assertRaises(ptext.InputError, ptext.keyword_tokenize_ids_batch, "test",
+                          ptext.Vocabulary())
+        self.assertRaises(ptext.InputError, ptext.keyword_tokenize_ids_batch, [1],
+                          ptext.Vocabulary())
+
+
+class TestKeywordTokenizeIdsBatchGoodInput(TestCase):
+    '''tests for good input to keyword_tokenize_ids_batch'''
+
+    def test_expected_outcome(self):
+        '''keyword_tokenize_ids_batch should return expected CSR arrays given known input'''
+        offsets, ids = ptext.keyword_tokenize_ids_batch(["a test string", None, "", "test words"],
+                                                        ptext.Vocabulary())
+        self.assertEqual(list(offsets), [0, 2, 2, 2, 4])
+        self.assertEqual(list(ids), [0, 1, 0, 2])
+
+
 class TestLemmatizeBadInput(TestCase):
     '''tests for bad input to lemmatize'''
 
@@ -123,6 +239,26 @@ class TestLemmatizeGoodInput(TestCase):
         self.assertEqual(ptext.lemmatize(""), "")
 
 
+class TestLoadLemmatizerGoodInput(TestCase):
+    '''tests for good input to load_lemmatizer'''
+
+    def test_expected_outcome(self):
+        '''load_lemmatizer should load LEMMATIZER once'''
+        lemmatizer = ptext.load_lemmatizer()
+        self.assertIs(ptext.LEMMATIZER, lemmatizer)
+        self.assertIs(ptext.load_lemmatizer(), lemmatizer)
+
+
+class TestLoadSentenceTokenizerGoodInput(TestCase):
+    '''tests for good input to load_sentence_tokenizer'''
+
+    def test_expected_outcome(self):
+        '''load_sentence_tokenizer should load SENTENCE_TOKENIZER once'''
+        sentence_tokenizer = ptext.load_sentence_tokenizer()
+        self.assertIs(ptext.SENTENCE_TOKENIZER, sentence_tokenizer)
+        self.assertIs(ptext.load_sentence_tokenizer(), sentence_tokenizer)
+
+
 class TestLowercaseBadInput(TestCase):
     '''tests for bad input to lowercase'''
 
@@ -141,6 +277,34 @@ class TestLowercaseGoodInput(TestCase):
         self.assertEqual(ptext.lowercase("A TesT StriNG"), "a test string")
 
 
+class TestNormalizeCharactersBadInput(TestCase):
+    '''tests for bad input to normalize_characters'''
+
+    def test_non_string_input(self):
+        '''normalize_characters should fail given non-string input'''
+        self.assertRaises(ptext.InputError, ptext.normalize_characters, [])
+
+
+class TestNormalizeCharactersGoodInput(TestCase):
+    '''tests for good input to normalize_characters'''
+
+    def test_expected_outcome(self):
+        '''normalize_characters should return what the chained functions return given known input'''
+        self.assertEqual(ptext.normalize_characters(""), "")
+        self.assertEqual(ptext.normalize_characters(None), "")
+        self.assertEqual(ptext.normalize_characters(" A  ﬁne\\nTEST &amp;quot;&AElig;&#92;t\n"),
+                         "a finetest 'ae")
+        for text_string in ("plain ascii text", "&amp; &nbsp;Œuvre ΑΣ \\t\tend"):
+            self.assertEqual(ptext.normalize_characters(text_string),
+                             ptext.preprocess_text(text_string, [
+                                 convert_html_entities,
+                                 convert_ligatures,
+                                 lowercase,
+                                 remove_esc_chars,
+                                 ptext.remove_whitespace
+                             ]))
+
+
 class TestPreprocessTextBadInput(TestCase):
     '''tests for bad input to preprocess_text'''
 
@@ -170,6 +334,39 @@ class TestPreprocessTextGoodInput(TestCase):
         ]))
 
 
+class TestPreprocessTextWithOffsetsBadInput(TestCase):
+    '''tests for bad input to preprocess_text_with_offsets'''
+
+    def test_non_string_input(self):
+        '''preprocess_text_with_offsets should fail given non-string input'''
+        self.assertRaises(ptext.InputError, ptext.preprocess_text_with_offsets, [], ["test"])
+
+    def test_non_list_input(self):
+        '''preprocess_text_with_offsets should fail given non-list input'''
+        self.assertRaises(ptext.InputError, ptext.preprocess_text_with_offsets, "test", "test")
+
+    def test_invalid_function(self):
+        '''preprocess_text_with_offsets should fail given invalid function'''
+        self.assertRaises(ptext.FunctionError, ptext.preprocess_text_with_offsets, "test", ["test"])
+
+
+class TestPreprocessTextWithOffsetsGoodInput(TestCase):
+    '''tests for good input to preprocess_text_with_offsets'''
+
+    def test_expected_outcome(self):
+        '''preprocess_text_with_offsets should return expected string and offsets given known input'''
+        text_string = "Visit http://example.com NOW &amp; 40 ﬁnal tests"
+        function_list = [remove_urls, lowercase, convert_html_entities, remove_numbers,
+                         convert_ligatures]
+        clean_string, offset_map = ptext.preprocess_text_with_offsets(text_string, function_list)
+        self.assertEqual(clean_string, ptext.preprocess_text(text_string, function_list))
+        self.assertEqual(clean_string, "visit now & final tests")
+        self.assertEqual(offset_map.original_span(6, 9), (25, 28))
+        self.assertEqual(offset_map.original_span(10, 11), (29, 34))
+        self.assertEqual(offset_map.original_span(12, 17), (38, 42))
+        self.assertEqual(ptext.preprocess_text_with_offsets(None, [])[0], "")
+
+
 class TestRemoveEscCharsBadInput(TestCase):
     '''tests for bad input to remove_esc_chars'''
 
@@ -0,0 +1,59 @@
+'''unit tests for vocabulary module'''
+
+from os import path
+import pickle
+import sys
+from unittest import TestCase
+
+sys.path.insert(0, path.abspath(path.join(path.dirname(__file__), "..")))
+import preprocessing.vocabulary as pvocabulary
+
+
+class TestVocabularyBadInput(TestCase):
+    '''tests for bad input to Vocabulary'''
+
+    def test_non_list_input(self):
+        '''Vocabulary should fail given non-list input'''
+        self.assertRaises(pvocabulary.InputError, pvocabulary.Vocabulary, "test")
+
+    def test_non_string_input(self):
+        '''Vocabulary should fail given non-string words'''
+        self.assertRaises(pvocabulary.InputError, pvocabulary.Vocabulary().add, 1)
+
+    def test_unknown_id(self):
+        '''Vocabulary should fail given IDs not found within it'''
+        vocabulary = pvocabulary.Vocabulary(["test"])
+        self.assertRaises(pvocabulary.InputError, vocabulary.get_word, 1)
+        self.assertRaises(pvocabulary.InputError, vocabulary.decode, [0, 1])
+
+    def test_negative_ids(self):
+        '''Vocabulary should fail given negative IDs rather than count them from the end'''
+        vocabulary = pvocabulary.Vocabulary(["test", "string"])
+        self.assertRaises(pvocabulary.InputError, vocabulary.decode, [-1])
+        self.assertRaises(pvocabulary.InputError, vocabulary.decode, [0, -2])
+        self.assertRaises(pvocabulary.InputError, vocabulary.get_word, -1)
+
+
+class TestVocabularyGoodInput(TestCase):
+    '''tests for good input to Vocabulary'''
+
+    def test_expected_outcome(self):
+        '''Vocabulary should intern words as consecutive IDs given known input'''
+        vocabulary = pvocabulary.Vocabulary(["test", "string"])
+        self.assertEqual(vocabulary.add("test"), 0)
+        self.assertEqual(vocabulary.add("another"), 2)
+        self.assertEqual(vocabulary.get_id("string"), 1)
+        self.assertEqual(vocabulary.get_id("unknown"), None)
+        self.assertEqual(vocabulary.get_word(2), "another")
+        self.assertEqual(list(vocabulary.encode(["string", "new", "test"])), [1, 3, 0])
+        self.assertEqual(list(vocabulary.encode(["string", "newer"], grow=False)), [1])
+        self.assertEqual(vocabulary.decode([3, 0]), ["new", "test"])
+        self.assertEqual(list(vocabulary), ["test", "string", "another", "new"])
+        self.assertEqual(len(vocabulary), 4)
+        self.assertTrue("new" in vocabulary)
+
+    def test_pickle(self):
+        '''Vocabulary should survive pickling'''
+        vocabulary = pickle.loads(pickle.dumps(pvocabulary.Vocabulary(["test", "string"])))
+        self.assertEqual(vocabulary, pvocabulary.Vocabulary(["test", "string"]))
+        self.assertEqual(vocabulary.add("another"), 2)